@@ -0,0 +1,274 @@
+# Performance Benchmarks for Harry Potter Adventure
+# Canned scenarios driven headless through the real update and draw paths
+#
+#   python benchmark.py                                   every scenario -> benchmark.json
+#   python benchmark.py --scenario boss_fight --out after.json --compare before.json
+
+import headless  # Selects the SDL dummy drivers before pygame is imported
+
+import argparse
+import gc
+import json
+import math
+import platform
+import subprocess
+import time
+import pygame
+from settings import *
+from game_states import Difficulty
+from headless import HeadlessGame, INPUT_POLICIES
+from draw_counters import get_draw_counters, COUNTER_KINDS
+
+try:
+    import numpy as np
+except ImportError:  # Only reported in the results
+    np = None
+
+BENCHMARK_SEED = 1234
+RESULTS_VERSION = 2
+# How many subsystems (per-frame averages) and call sites (totals) the results keep
+TOP_SUBSYSTEMS = 12
+TOP_SITES = 20
+
+
+class Scenario:
+    """One canned run: who plays, where, with what input, for how many frames.
+
+    Each party in parties plays frames // len(parties) frames from a fresh
+    game; a party's run ends early if its level ends. area, a (left, right)
+    world x range, keeps the brawl policy fighting inside it.
+    """
+
+    def __init__(self, name, description, frames, level=1, parties=(('Harry',),),
+                 policy='idle', start_x=None, area=None, menu=False):
+        self.name = name
+        self.description = description
+        self.frames = frames
+        self.level = level
+        self.parties = parties
+        self.policy = policy
+        self.start_x = start_x
+        self.area = area
+        self.menu = menu
+
+
+SCENARIOS = [
+    Scenario('level1_traversal', "Level 1 start to goal, one player",
+             2400, level=1, policy='traverse'),
+    Scenario('corridor_melee', "Forbidden Corridor melee, Ron and Hagrid",
+             900, level=1, parties=(('Ron', 'Hagrid'),), policy='brawl', start_x=3300,
+             area=(3200, 4200)),
+    Scenario('boss_fight', "Level 2 boss fight, Harry and Hermione",
+             1200, level=2, parties=(('Harry', 'Hermione'),), policy='brawl', start_x=3000),
+    Scenario('coop_specials', "2P co-op, every character casting specials",
+             1200, level=1, parties=(('Harry', 'Ron'), ('Hermione', 'Voldemort'),
+                                     ('Hagrid', 'Unicorn'), ('Dragon', 'Harry')),
+             policy='brawl', start_x=1900),
+    Scenario('menu_idle', "Main menu left alone", 600, menu=True),
+]
+
+
+# === SCENARIO HELPERS ===
+
+def place_players(game, x):
+    """Move the party to the ground at x and snap the camera there."""
+    grid = game.level.platform_grid
+    for i, player in enumerate(game.players):
+        px = x + i * 50
+        ground = grid.ground_below(px + PLAYER_WIDTH // 2, 0, SCREEN_HEIGHT)
+        top = ground.rect.top if ground else SCREEN_HEIGHT - PLATFORM_HEIGHT
+        player.x, player.y = float(px), float(top - PLAYER_HEIGHT)
+        player.vel_x = player.vel_y = 0
+        player.rect.topleft = (int(player.x), int(player.y))
+    camera = game.camera
+    camera.x = camera.target_x = max(0, min(x - SCREEN_WIDTH // 3, LEVEL_WIDTH - SCREEN_WIDTH))
+
+
+def keep_alive(game):
+    """Benchmarks measure rendering, not skill: refill health, lift players out of pits."""
+    for player in game.players:
+        player.health = player.max_health
+        if player.y > SCREEN_HEIGHT - 60:
+            ahead = [p for p in game.level.platform_grid if p.rect.right > player.x + 40]
+            if ahead:
+                landing = min(ahead, key=lambda p: p.rect.left)
+                player.x = float(max(player.x, landing.rect.left + 10))
+                player.y = float(landing.rect.top - PLAYER_HEIGHT)
+                player.vel_y = 0
+                player.rect.topleft = (int(player.x), int(player.y))
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(times):
+    """Frame-time summary in ms."""
+    if not times:
+        return {}
+    return {
+        'p50': percentile(times, 50),
+        'p95': percentile(times, 95),
+        'p99': percentile(times, 99),
+        'mean': sum(times) / len(times),
+        'max': max(times),
+    }
+
+
+def add_counts(into, counts):
+    """Add one {kind: count} dict into another."""
+    for kind, count in counts.items():
+        into[kind] = into.get(kind, 0) + count
+
+
+def busiest(named_counts, limit):
+    """The limit entries of {name: {kind: count}} with the most counted work."""
+    ranked = sorted(named_counts.items(), key=lambda item: -sum(item[1].values()))
+    return dict(ranked[:limit])
+
+
+# === RUNNING ===
+
+def play(scenario, count_draws=False):
+    """Run a scenario once.
+
+    Returns per-frame total/update/draw ms lists, plus - when count_draws is
+    set - the draw counter totals overall, by subsystem and by call site.
+    """
+    frame_ms, update_ms, draw_ms = [], [], []
+    counts = {'totals': dict.fromkeys(COUNTER_KINDS, 0), 'subsystems': {}, 'sites': {}}
+    frames_each = scenario.frames // len(scenario.parties)
+    for characters in scenario.parties:
+        game = HeadlessGame(INPUT_POLICIES[scenario.policy])
+        game.rng_seed = BENCHMARK_SEED
+        game.arena = scenario.area
+        if not scenario.menu:
+            game.start_run(scenario.level, characters, Difficulty.NORMAL)
+            if scenario.start_x is not None:
+                place_players(game, scenario.start_x)
+        if count_draws:
+            game.set_draw_counting(True)
+
+        gc.collect()
+        for _ in range(frames_each):
+            start = time.perf_counter()
+            if not scenario.menu:
+                keep_alive(game)
+                if not game.step(SIM_STEP_MS):
+                    break
+            updated = time.perf_counter()
+            game.draw()
+            end = time.perf_counter()
+            update_ms.append((updated - start) * 1000)
+            draw_ms.append((end - updated) * 1000)
+            frame_ms.append((end - start) * 1000)
+
+        if count_draws:
+            counters = get_draw_counters()
+            add_counts(counts['totals'], counters.totals)
+            for name, totals in counters.subsystem_totals.items():
+                add_counts(counts['subsystems'].setdefault(name, {}), totals)
+            for name, totals in counters.site_totals.items():
+                add_counts(counts['sites'].setdefault(name, {}), totals)
+            game.set_draw_counting(False)
+    return frame_ms, update_ms, draw_ms, counts
+
+
+def run_scenario(scenario):
+    """Time a scenario, then replay it with draw counters on for the counts.
+
+    The runs are seeded, so the counting pass sees the same game; it is kept
+    separate so counting overhead never lands in the timings.
+    """
+    frame_ms, update_ms, draw_ms, _ = play(scenario)
+    counted_ms, _, _, counts = play(scenario, count_draws=True)
+    frames = max(1, len(counted_ms))
+    totals = counts['totals']
+
+    return {
+        'description': scenario.description,
+        'frames': len(frame_ms),
+        'frame_ms': summarize(frame_ms),
+        'update_ms': summarize(update_ms),
+        'draw_ms': summarize(draw_ms),
+        'per_frame': {kind: totals[kind] / frames for kind in COUNTER_KINDS},
+        'totals': totals,
+        'by_subsystem': {name: {kind: count / frames for kind, count in sub.items()}
+                         for name, sub in busiest(counts['subsystems'], TOP_SUBSYSTEMS).items()},
+        'top_sites': busiest(counts['sites'], TOP_SITES),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(names=None):
+    """Run the named scenarios (all by default) and return the results dict."""
+    scenarios = [s for s in SCENARIOS if names is None or s.name in names]
+    results = {
+        'version': RESULTS_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__ if np is not None else None,
+        'scenarios': {},
+    }
+    for scenario in scenarios:
+        results['scenarios'][scenario.name] = run_scenario(scenario)
+    return results
+
+
+# === REPORTING ===
+
+def print_results(results, baseline=None):
+    base = baseline['scenarios'] if baseline else {}
+    print(f"{'scenario':<18} {'frames':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+          f" {'draws':>7} {'blits':>7} {'text':>5} {'allocs':>6}")
+    for name, result in results['scenarios'].items():
+        ms = result['frame_ms']
+        counts = result['per_frame']
+        print(f"{name:<18} {result['frames']:>6} {ms['p50']:>8.2f} {ms['p95']:>8.2f} {ms['p99']:>8.2f}"
+              f" {counts['draw']:>7.0f} {counts['blit']:>7.0f} {counts['text']:>5.1f}"
+              f" {counts['surface']:>6.1f}")
+        if name in base:
+            old = base[name]['frame_ms']
+            deltas = [f"{key} {(ms[key] - old[key]) / old[key] * 100:+.0f}%"
+                      for key in ('p50', 'p95', 'p99') if old.get(key)]
+            print(f"{'':<18} vs baseline: {', '.join(deltas)}")
+        for subsystem, sub in list(result.get('by_subsystem', {}).items())[:3]:
+            print(f"{'':<18} {subsystem:<32} {sub.get('draw', 0):>7.0f} {sub.get('blit', 0):>7.0f}"
+                  f" {sub.get('text', 0):>5.1f} {sub.get('surface', 0):>6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Harry Potter Adventure benchmark scenarios.")
+    parser.add_argument('--scenario', action='append', choices=[s.name for s in SCENARIOS],
+                        help="run only this scenario (repeatable)")
+    parser.add_argument('--out', default='benchmark.json', help="results file")
+    parser.add_argument('--compare', metavar='JSON', help="earlier results to compare against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks(args.scenario)
+    with open(args.out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print_results(results, baseline)
+    print(f"results written to {args.out}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
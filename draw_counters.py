@@ -0,0 +1,203 @@
+# Draw Counters for Harry Potter Adventure
+# Per-frame counts of draw primitives, blits, text renders and surface allocations,
+# credited to the code that asked for them
+
+import sys
+import pygame
+from text_cache import get_text_cache
+
+# What is counted
+COUNTER_KINDS = ('draw', 'blit', 'text', 'surface')
+
+# pygame.draw primitives, and pygame.transform calls that return a new Surface
+DRAW_FUNCTIONS = ('rect', 'polygon', 'circle', 'ellipse', 'arc', 'line', 'lines',
+                  'aaline', 'aalines')
+ALLOCATING_TRANSFORMS = ('scale', 'smoothscale', 'rotate', 'rotozoom', 'flip',
+                         'scale2x', 'scale_by', 'smoothscale_by')
+
+# Helper modules whose callers get the credit for the work they do
+PASS_THROUGH_MODULES = ('surface_cache', 'text_cache', 'draw_counters')
+# Debug tooling whose own drawing is left out of the counts
+IGNORED_MODULES = ('profiler',)
+
+# The real Surface type; pygame.Surface is swapped for CountingSurface while counting
+BaseSurface = pygame.Surface
+
+
+class CountingSurface(BaseSurface):
+    """Surface that counts its own creation and the blits onto it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if draw_counters is not None and draw_counters.enabled:
+            draw_counters.add('surface')
+
+    def blit(self, *args, **kwargs):
+        if draw_counters.enabled:
+            draw_counters.add('blit')
+        return super().blit(*args, **kwargs)
+
+    def blits(self, blit_sequence, *args, **kwargs):
+        if draw_counters.enabled:
+            blit_sequence = list(blit_sequence)
+            draw_counters.add('blit', len(blit_sequence))
+        return super().blits(blit_sequence, *args, **kwargs)
+
+
+class DrawCounters:
+    """Counts rendering work per frame and per call site. Off by default.
+
+    enable() swaps counting wrappers into pygame.draw, pygame.transform and
+    the text cache, and makes pygame.Surface build CountingSurfaces;
+    disable() restores the originals, so counting costs nothing while off.
+    Blits are counted on CountingSurfaces only - the frame buffer from
+    frame_buffer() and any surface created while counting is on.
+
+    Each count is credited to the calling function, its site
+    ('player.Player._draw_wand'), and to that function's subsystem - its
+    module and class ('player.Player').
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.buffer = None
+        self._originals = []  # (owner, name, original) to restore
+        self._sites = {}  # code object -> (site, subsystem)
+        self.reset()
+
+    def reset(self):
+        """Zero the current frame and the running totals."""
+        self.current = dict.fromkeys(COUNTER_KINDS, 0)
+        self.current_subsystems = {}  # subsystem -> {kind: count}
+        self.last_frame = dict(self.current)
+        self.last_frame_subsystems = {}
+        self.totals = dict(self.current)
+        self.subsystem_totals = {}
+        self.site_totals = {}  # site -> {kind: count}
+        self.frames = 0
+
+    def add(self, kind, count=1):
+        """Count work of one kind, crediting whoever called the counted function."""
+        frame = sys._getframe(2)
+        while frame is not None and frame.f_globals.get('__name__') in PASS_THROUGH_MODULES:
+            frame = frame.f_back
+        if frame is None:
+            self.current[kind] += count
+            return
+        names = self._sites.get(frame.f_code)
+        if names is None:
+            module = frame.f_globals.get('__name__', '?')
+            if module in IGNORED_MODULES:
+                names = (None, None)
+            else:
+                qualname = getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)
+                names = (f"{module}.{qualname}", f"{module}.{qualname.split('.')[0]}")
+            self._sites[frame.f_code] = names
+        site, subsystem = names
+        if site is None:
+            return
+        self.current[kind] += count
+
+        counts = self.current_subsystems.get(subsystem)
+        if counts is None:
+            counts = self.current_subsystems[subsystem] = dict.fromkeys(COUNTER_KINDS, 0)
+        counts[kind] += count
+        counts = self.site_totals.get(site)
+        if counts is None:
+            counts = self.site_totals[site] = dict.fromkeys(COUNTER_KINDS, 0)
+        counts[kind] += count
+
+    def _wrap(self, owner, name, kind):
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+        add = self.add
+
+        def counted(*args, **kwargs):
+            add(kind)
+            return original(*args, **kwargs)
+
+        self._originals.append((owner, name, original))
+        setattr(owner, name, counted)
+
+    def _wrap_text_cache(self):
+        """Count the text cache's real font.render calls, not its cache hits."""
+        cache = get_text_cache()
+        add = self.add
+
+        for name in ('render', 'render_outlined'):
+            original = getattr(cache, name)
+
+            def counted_render(*args, _original=original, **kwargs):
+                before = cache.renders
+                surf = _original(*args, **kwargs)
+                if cache.renders != before:
+                    add('text', cache.renders - before)
+                return surf
+
+            self._originals.append((cache, name, None))
+            setattr(cache, name, counted_render)
+
+    def enable(self):
+        if self.enabled:
+            return
+        for name in DRAW_FUNCTIONS:
+            self._wrap(pygame.draw, name, 'draw')
+        for name in ALLOCATING_TRANSFORMS:
+            self._wrap(pygame.transform, name, 'surface')
+        self._wrap_text_cache()
+        pygame.Surface = CountingSurface
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        for owner, name, original in reversed(self._originals):
+            if original is None:
+                delattr(owner, name)  # Instance override - the class method shows again
+            else:
+                setattr(owner, name, original)
+        self._originals.clear()
+        pygame.Surface = BaseSurface
+        self.enabled = False
+
+    def frame_buffer(self, display):
+        """A counting surface, in the display's format, to draw frames into."""
+        if self.buffer is None or self.buffer.get_size() != display.get_size():
+            self.buffer = CountingSurface(display.get_size(), 0, display)
+        return self.buffer
+
+    def end_frame(self):
+        """Close the frame's counts into last_frame and the totals."""
+        if not self.enabled:
+            return None
+        self.last_frame = self.current
+        self.last_frame_subsystems = self.current_subsystems
+        for kind, count in self.current.items():
+            self.totals[kind] += count
+        for subsystem, counts in self.current_subsystems.items():
+            totals = self.subsystem_totals.get(subsystem)
+            if totals is None:
+                totals = self.subsystem_totals[subsystem] = dict.fromkeys(COUNTER_KINDS, 0)
+            for kind, count in counts.items():
+                totals[kind] += count
+        self.frames += 1
+        self.current = dict.fromkeys(COUNTER_KINDS, 0)
+        self.current_subsystems = {}
+        return self.last_frame
+
+    def top_sites(self, limit=20):
+        """Call sites with the most counted work overall, busiest first."""
+        ranked = sorted(self.site_totals.items(), key=lambda item: -sum(item[1].values()))
+        return ranked[:limit]
+
+
+# Global draw counters instance
+draw_counters = None
+
+def get_draw_counters():
+    """Get or create the global draw counters."""
+    global draw_counters
+    if draw_counters is None:
+        draw_counters = DrawCounters()
+    return draw_counters
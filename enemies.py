@@ -1,16 +1,50 @@
 # Enemy Types for scrolling platformer
 
 import pygame
-import random
 import math
 from settings import *
+from text_cache import get_text_cache
+from surface_cache import get_surface_cache
+from particles import get_particle_system
+from random_streams import get_rng
+from tracer import get_tracer
+from projectiles import ProjectileEngine, STYLE_BOLT, STYLE_DARK_ORB, STYLE_SHOCKWAVE
 
 
 class Enemy:
     """Enemy class."""
 
-    def __init__(self, x, y, enemy_type='walker'):
+    # AI level-of-detail tiers, picked each frame by EnemyManager
+    LOD_DORMANT = 0    # Spawned but not seen yet - no updates until activated
+    LOD_FULL = 1       # On screen (activation range) - updated every frame
+    LOD_NEAR = 2       # Just off screen - updated every LOD_NEAR_INTERVAL frames
+    LOD_HIBERNATE = 3  # Far from the camera - state frozen until it comes back
+    LOD_NEAR_DISTANCE = 600  # Width of the NEAR band beyond the activation range
+    LOD_NEAR_INTERVAL = 4
+
+    # Flipbook timing per type - (loop length in ms, number of baked phases)
+    FLIPBOOK_TIMING = {
+        'walker': (1571, 16),
+        'flying': (1257, 24),
+        'tank': (1257, 16),
+        'malfoy': (1257, 16),
+        'troll': (1000, 1),
+        'fluffy': (1000, 1),
+        'devil_snare': (2513, 24),
+        'flying_key': (1257, 24),
+        'chess_piece': (942, 12),
+        'quirrell': (2000, 24),
+    }
+    FLIPBOOK_PAD_X = 48
+    FLIPBOOK_PAD_Y = 28
+    FLIPBOOK_CACHE = {}
+
+    # Fixed tick value used while baking; None means use the live clock
+    _draw_ticks = None
+
+    def __init__(self, x, y, enemy_type='walker', direction=None, projectiles=None):
         self.enemy_type = enemy_type
+        self.projectiles = projectiles  # Engine this enemy's shots go into (its EnemyManager's)
         self.x = float(x)
         self.y = float(y)
         self.rect = pygame.Rect(int(x), int(y), ENEMY_WIDTH, ENEMY_HEIGHT)
@@ -141,18 +175,19 @@ class Enemy:
         self.vel_x = 0
         self.vel_y = 0
         self.on_ground = False
-        self.direction = random.choice([-1, 1])
+        # Seeded pick for real enemies; bake poses pass one so they draw nothing from the stream
+        self.direction = direction if direction is not None else get_rng('enemies').choice([-1, 1])
         self.patrol_range = 200
         self.start_x = x
         self.attack_cooldown = 0
         self.attack_interval = 1000
         self.active = False  # Only active when player is near
+        self.lod_tier = self.LOD_DORMANT
+        self.lod_phase = 0  # Staggers NEAR ticks across enemies
+        self.lod_pending_dt = 0  # dt accumulated between NEAR ticks
         self.hover_offset = 0
         self.hover_direction = 1
 
-        # Projectile system for ranged enemies
-        self.projectiles = []
-
         # AI state for smarter behavior
         self.ai_state = 'idle'  # idle, chase, attack, retreat, strafe
         self.state_timer = 0
@@ -175,20 +210,29 @@ class Enemy:
             self.active = True
         return self.active
 
+    def get_lod_tier(self, camera_x):
+        """Pick this frame's AI level of detail from the distance to the camera."""
+        if not self.activate(camera_x):
+            return self.LOD_DORMANT
+        screen_x = self.x - camera_x
+        if -200 < screen_x < SCREEN_WIDTH + 200:
+            return self.LOD_FULL
+        if -200 - self.LOD_NEAR_DISTANCE < screen_x < SCREEN_WIDTH + 200 + self.LOD_NEAR_DISTANCE:
+            return self.LOD_NEAR
+        return self.LOD_HIBERNATE
+
     def _check_edge_in_direction(self, platforms, direction):
         """Check if there's an edge (no ground) in the given direction."""
         check_x = self.x + (self.rect.width // 2) + (self.rect.width // 2 + 15) * direction
         check_y = self.y + self.rect.height + 10
-        for platform in platforms:
-            if (platform.rect.left - 5 <= check_x <= platform.rect.right + 5 and
-                platform.rect.top <= check_y <= platform.rect.top + 30):
-                return False  # Ground found
-        return True  # Edge/no ground
+        # Ground found if a platform top is within 30px above the probe
+        return platforms.ground_below(check_x, check_y - 30, 30, slack=5) is None
 
     def _check_wall_in_direction(self, platforms, direction):
         """Check if there's a wall blocking movement in the given direction."""
         check_x = self.x + (self.rect.width if direction > 0 else 0) + (10 * direction)
-        for platform in platforms:
+        column = pygame.Rect(int(check_x) - 1, int(self.y), 3, self.rect.height)
+        for platform in platforms.query_rect(column):
             # Check if wall blocks at body height
             if (platform.rect.left <= check_x <= platform.rect.right and
                 platform.rect.top < self.y + self.rect.height - 5 and
@@ -233,15 +277,11 @@ class Enemy:
         proj_x = self.x + self.rect.width // 2
         proj_y = self.y + self.rect.height // 3
 
-        self.projectiles.append({
-            'x': proj_x,
-            'y': proj_y,
-            'vx': vx,
-            'vy': vy,
-            'life': 3000,  # 3 seconds
-            'damage': self.damage // 2,  # Projectiles do half damage
-            'color': self.secondary_color if hasattr(self, 'secondary_color') else (255, 100, 100)
-        })
+        color = self.secondary_color if hasattr(self, 'secondary_color') else (255, 100, 100)
+        self.projectiles.spawn(self, proj_x, proj_y, vx, vy,
+                               life=3000,  # 3 seconds
+                               damage=self.damage // 2,  # Projectiles do half damage
+                               style=STYLE_BOLT, color=color)
 
     def _quirrell_special_attack(self, player):
         """Quirrell's special attack - spread burst of dark magic."""
@@ -256,6 +296,8 @@ class Enemy:
         base_vy = (dy / dist) * 6
 
         # Fire 5 projectiles in a spread pattern
+        engine = self.projectiles
+        color = (200, 0, 200) if not self.is_enraged else (255, 50, 50)  # Purple/red
         spread_angles = [-30, -15, 0, 15, 30]
         for angle in spread_angles:
             rad = math.radians(angle)
@@ -265,15 +307,9 @@ class Enemy:
             vx = base_vx * cos_a - base_vy * sin_a
             vy = base_vx * sin_a + base_vy * cos_a
 
-            self.projectiles.append({
-                'x': proj_x,
-                'y': proj_y,
-                'vx': vx,
-                'vy': vy,
-                'life': 2500,
-                'damage': self.damage // 3,  # Each projectile does 1/3 damage
-                'color': (200, 0, 200) if not self.is_enraged else (255, 50, 50)  # Purple/red
-            })
+            engine.spawn(self, proj_x, proj_y, vx, vy, life=2500,
+                         damage=self.damage // 3,  # Each projectile does 1/3 damage
+                         style=STYLE_BOLT, color=color)
 
     def update(self, platforms, players, dt, camera_x):
         """Update enemy."""
@@ -299,14 +335,6 @@ class Enemy:
         # Update AI state timer
         self.state_timer += dt
 
-        # Update enemy projectiles
-        for proj in self.projectiles[:]:
-            proj['x'] += proj['vx']
-            proj['y'] += proj['vy']
-            proj['life'] -= dt
-            if proj['life'] <= 0:
-                self.projectiles.remove(proj)
-
         # Stationary enemies (like Devil's Snare) don't move but can still attack
         if self.speed == 0:
             self.vel_x = 0
@@ -498,7 +526,7 @@ class Enemy:
                     self.ai_state = 'wait'
                 elif player_reachable:
                     # Chase with slight speed variation to prevent bunching
-                    speed_var = 0.9 + random.random() * 0.2
+                    speed_var = 0.9 + get_rng('enemies').random() * 0.2
                     self.vel_x = self.speed * desired_dir * speed_var
                     self.direction = desired_dir
                     self.ai_state = 'chase'
@@ -599,9 +627,9 @@ class Enemy:
             self.attack_cooldown -= dt
 
     def check_collisions(self, platforms):
-        """Check collisions with platforms."""
+        """Check collisions with platforms (a PlatformGrid)."""
         self.on_ground = False
-        for platform in platforms:
+        for platform in platforms.query_rect(self.rect.inflate(64, 64)):
             if self.rect.colliderect(platform.rect):
                 if self.vel_y > 0:
                     self.rect.bottom = platform.rect.top
@@ -652,36 +680,16 @@ class Enemy:
         if screen_x < -50 or screen_x > SCREEN_WIDTH + 50:
             return
 
-        # Flash white when hurt
+        # Pre-rendered flipbook frame (white silhouette when hurt)
+        flipbook = Enemy.get_flipbook(self.enemy_type, self._is_casting())
+        facing = 1 if self.direction > 0 else -1
         if self.hurt_timer > 0 and int(self.hurt_timer / 50) % 2 == 0:
-            # Draw white silhouette
-            pygame.draw.ellipse(screen, WHITE, (screen_x, draw_y, self.rect.width, self.rect.height))
-            return
-
-        # Draw based on type
-        if self.enemy_type == 'walker':
-            self._draw_walker(screen, screen_x, draw_y)
-        elif self.enemy_type == 'flying':
-            self._draw_flying(screen, screen_x, draw_y)
-        elif self.enemy_type == 'tank':
-            self._draw_tank(screen, screen_x, draw_y)
-        elif self.enemy_type == 'malfoy':
-            self._draw_malfoy(screen, screen_x, draw_y)
-        elif self.enemy_type == 'troll':
-            self._draw_troll(screen, screen_x, draw_y)
-        elif self.enemy_type == 'fluffy':
-            self._draw_fluffy(screen, screen_x, draw_y)
-        elif self.enemy_type == 'devil_snare':
-            self._draw_devil_snare(screen, screen_x, draw_y)
-        elif self.enemy_type == 'flying_key':
-            self._draw_flying_key(screen, screen_x, draw_y)
-        elif self.enemy_type == 'chess_piece':
-            self._draw_chess_piece(screen, screen_x, draw_y)
-        elif self.enemy_type == 'quirrell':
-            self._draw_quirrell(screen, screen_x, draw_y)
+            sprite = flipbook['flash'][facing]
         else:
-            # Default fallback
-            self._draw_walker(screen, screen_x, draw_y)
+            period, phases = flipbook['timing']
+            phase = (pygame.time.get_ticks() % period) * phases // period
+            sprite = flipbook['frames'][facing][phase]
+        screen.blit(sprite, (screen_x - Enemy.FLIPBOOK_PAD_X, draw_y - Enemy.FLIPBOOK_PAD_Y))
 
         # Enemy name label above health bar (color-coded by threat)
         name_y = draw_y - 20
@@ -692,8 +700,7 @@ class Enemy:
             name_color = (255, 255, 100)  # Yellow - medium
         else:
             name_color = (100, 255, 100)  # Green - weak
-        font = pygame.font.Font(None, 18)
-        name_surf = font.render(self.display_name, True, name_color)
+        name_surf = get_text_cache().render(self.display_name, 18, name_color)
         name_x = screen_x + (self.rect.width - name_surf.get_width()) // 2
         screen.blit(name_surf, (name_x, name_y))
 
@@ -704,22 +711,79 @@ class Enemy:
         health_width = int(bar_width * (self.health / self.max_health))
         pygame.draw.rect(screen, GREEN, (screen_x, bar_y, health_width, 4))
 
-        # Draw enemy projectiles
-        for proj in self.projectiles:
-            px = int(proj['x'] - camera_x)
-            py = int(proj['y'])
-            if 0 <= px <= SCREEN_WIDTH:
-                color = proj.get('color', (255, 100, 100))
-                # Outer glow
-                pygame.draw.circle(screen, (color[0] // 2, color[1] // 2, color[2] // 2), (px, py), 10)
-                # Inner bright
-                pygame.draw.circle(screen, color, (px, py), 7)
-                # Core
-                pygame.draw.circle(screen, (255, 255, 200), (px, py), 3)
+    def _anim_ticks(self):
+        """Clock for the type painters (fixed while baking flipbooks)."""
+        if self._draw_ticks is not None:
+            return self._draw_ticks
+        return pygame.time.get_ticks()
+
+    def _is_casting(self):
+        """Malfoy shows a wand glow right after firing."""
+        return self.enemy_type == 'malfoy' and self.shoot_cooldown > self.shoot_interval * 0.8
+
+    def _paint(self, screen, screen_x, y):
+        """Draw the enemy body from primitives."""
+        if self.enemy_type == 'walker':
+            self._draw_walker(screen, screen_x, y)
+        elif self.enemy_type == 'flying':
+            self._draw_flying(screen, screen_x, y)
+        elif self.enemy_type == 'tank':
+            self._draw_tank(screen, screen_x, y)
+        elif self.enemy_type == 'malfoy':
+            self._draw_malfoy(screen, screen_x, y)
+        elif self.enemy_type == 'troll':
+            self._draw_troll(screen, screen_x, y)
+        elif self.enemy_type == 'fluffy':
+            self._draw_fluffy(screen, screen_x, y)
+        elif self.enemy_type == 'devil_snare':
+            self._draw_devil_snare(screen, screen_x, y)
+        elif self.enemy_type == 'flying_key':
+            self._draw_flying_key(screen, screen_x, y)
+        elif self.enemy_type == 'chess_piece':
+            self._draw_chess_piece(screen, screen_x, y)
+        elif self.enemy_type == 'quirrell':
+            self._draw_quirrell(screen, screen_x, y)
+        else:
+            # Default fallback
+            self._draw_walker(screen, screen_x, y)
+
+    @classmethod
+    def get_flipbook(cls, enemy_type, casting=False):
+        """Get (baking on first use) the animation frames for an enemy type."""
+        key = (enemy_type, casting)
+        flipbook = cls.FLIPBOOK_CACHE.get(key)
+        if flipbook is not None:
+            return flipbook
+
+        period, phases = cls.FLIPBOOK_TIMING.get(enemy_type, (1257, 16))
+        pose = cls(0, 0, enemy_type, direction=1)
+        if casting:
+            pose.shoot_cooldown = pose.shoot_interval
+        frame_size = (pose.rect.width + cls.FLIPBOOK_PAD_X * 2, pose.rect.height + cls.FLIPBOOK_PAD_Y * 2)
+        converted = pygame.display.get_surface() is not None
+
+        frames = {1: [], -1: []}
+        flash = {}
+        for direction in (1, -1):
+            pose.direction = direction
+            for phase in range(phases):
+                pose._draw_ticks = phase * period // phases
+                frame = pygame.Surface(frame_size, pygame.SRCALPHA)
+                pose._paint(frame, cls.FLIPBOOK_PAD_X, cls.FLIPBOOK_PAD_Y)
+                if converted:
+                    frame = frame.convert_alpha()
+                frames[direction].append(frame)
+            # Solid white silhouette for the hurt flash
+            flash[direction] = pygame.mask.from_surface(frames[direction][0]).to_surface(
+                setcolor=WHITE, unsetcolor=(0, 0, 0, 0))
+
+        flipbook = {'timing': (period, phases), 'frames': frames, 'flash': flash}
+        cls.FLIPBOOK_CACHE[key] = flipbook
+        return flipbook
 
     def _draw_walker(self, screen, screen_x, y):
         """Draw a dark creature (dementor-like) with cel-shaded style."""
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
         w, h = ENEMY_WIDTH, ENEMY_HEIGHT
 
         # Ethereal shadow/glow
@@ -805,7 +869,7 @@ class Enemy:
 
     def _draw_flying(self, screen, screen_x, y):
         """Draw a Cornish Pixie - mischievous blue creature with cel-shaded style."""
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
         w, h = ENEMY_WIDTH, ENEMY_HEIGHT
 
         # Animated wing flap
@@ -923,7 +987,7 @@ class Enemy:
 
     def _draw_tank(self, screen, screen_x, y):
         """Draw a Giant Rat - scruffy, menacing with cel-shaded fur texture."""
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
         w, h = ENEMY_WIDTH, ENEMY_HEIGHT
 
         # Scurrying animation
@@ -1061,7 +1125,7 @@ class Enemy:
     def _draw_malfoy(self, screen, screen_x, y):
         """Draw Draco Malfoy - sneering Slytherin student with cel-shaded style."""
         w, h = self.rect.width, self.rect.height
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
 
         # Shadow
         shadow_surf = pygame.Surface((w + 10, 10), pygame.SRCALPHA)
@@ -1292,7 +1356,7 @@ class Enemy:
         w, h = self.rect.width, self.rect.height
 
         # Animated tendrils
-        t = pygame.time.get_ticks() / 200
+        t = self._anim_ticks() / 200
 
         # Base mound
         pygame.draw.ellipse(screen, (15, 50, 15), (screen_x - 5, y + h - 20, w + 10, 25))
@@ -1330,7 +1394,7 @@ class Enemy:
     def _draw_flying_key(self, screen, screen_x, y):
         """Draw Flying Key - ornate antique brass key with feathered wings."""
         w, h = self.rect.width, self.rect.height
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
 
         # Wing flap animation - smooth and bird-like
         wing_flap = math.sin(t * 0.025) * 15
@@ -1503,7 +1567,7 @@ class Enemy:
             pygame.draw.line(screen, self.secondary_color, (mx, my), (mx + 5, my + 8), 2)
 
         # Eye (glowing)
-        glow = int(abs(math.sin(pygame.time.get_ticks() / 300)) * 50)
+        glow = int(abs(math.sin(self._anim_ticks() / 300)) * 50)
         pygame.draw.circle(screen, (150 + glow, 50, 50), (screen_x + 15 + (5 if self.direction > 0 else 0), y + 18), 4)
         pygame.draw.circle(screen, (255, 150, 150), (screen_x + 15 + (5 if self.direction > 0 else 0), y + 18), 2)
 
@@ -1514,7 +1578,7 @@ class Enemy:
     def _draw_quirrell(self, screen, screen_x, y):
         """Draw Professor Quirrell with Voldemort on back - final boss aesthetic."""
         w, h = self.rect.width, self.rect.height
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
 
         # Dark aura effect
         aura_size = 8 + int(math.sin(t * 0.005) * 3)
@@ -1590,11 +1654,19 @@ class Boss:
     
     WIDTH = 80
     HEIGHT = 120
+
+    # Pre-rendered body frames keyed by (phase, direction, eye glow step)
+    SPRITE_CACHE = {}
+    ORB_CACHE = {}
+    SPRITE_PAD_X = 30
+    SPRITE_PAD_Y = 10
+    EYE_GLOW_STEP = 10
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, projectiles=None):
         self.x = float(x)
         self.y = float(y)
         self.rect = pygame.Rect(int(x), int(y), self.WIDTH, self.HEIGHT)
+        self.projectiles = projectiles  # Engine the boss's shots go into (its EnemyManager's)
         
         # Boss stats - VERY tough
         self.health = 500
@@ -1611,7 +1683,6 @@ class Boss:
         # Attack patterns
         self.attack_cooldown = 0
         self.attack_pattern = 0  # 0: melee swing, 1: projectiles, 2: ground slam
-        self.projectiles = []
         
         # Animation
         self.anim_timer = 0
@@ -1633,43 +1704,21 @@ class Boss:
         # Death animation
         self.death_timer = 0
         self.death_duration = 2000  # 2 seconds death animation
-        self.death_particles = []
         
     def _check_edge(self, platforms, direction):
         """Check if there's an edge in the given direction."""
         check_x = self.x + self.WIDTH // 2 + (self.WIDTH // 2 + 20) * direction
         check_y = self.y + self.HEIGHT + 10
-        for platform in platforms:
-            if (platform.rect.left - 10 <= check_x <= platform.rect.right + 10 and
-                platform.rect.top <= check_y <= platform.rect.top + 40):
-                return False  # Ground found
-        return True  # Edge
+        # Ground found if a platform top is within 40px above the probe
+        return platforms.ground_below(check_x, check_y - 40, 40, slack=10) is None
 
     def update(self, players, dt, platforms=None):
         # Handle death animation
         if self.defeated:
             self.death_timer += dt
-            # Update death particles
-            for p in self.death_particles[:]:
-                p['x'] += p['vx']
-                p['y'] += p['vy']
-                p['vy'] += 0.2  # Gravity
-                p['life'] -= dt
-                p['alpha'] = max(0, int(255 * (p['life'] / 800)))
-                if p['life'] <= 0:
-                    self.death_particles.remove(p)
             # Spawn new particles during death
-            if self.death_timer < 1500 and random.random() < 0.3:
-                for _ in range(3):
-                    self.death_particles.append({
-                        'x': self.x + random.randint(0, self.WIDTH),
-                        'y': self.y + random.randint(0, self.HEIGHT),
-                        'vx': random.uniform(-3, 3),
-                        'vy': random.uniform(-5, -1),
-                        'life': random.randint(500, 1000),
-                        'alpha': 255,
-                        'color': random.choice([(150, 50, 150), (100, 0, 100), (200, 100, 200), (80, 0, 80)])
-                    })
+            if self.death_timer < 1500 and get_rng('boss').random() < 0.3:
+                get_particle_system().emit('boss_death_wisps', self.x, self.y, self.WIDTH, self.HEIGHT)
             return
 
         if not self.active:
@@ -1692,6 +1741,7 @@ class Boss:
 
         # Detect phase transition
         if new_phase != self.previous_phase:
+            get_tracer().instant('boss_phase', phase=new_phase, health=self.health)
             self.phase = new_phase
             self.previous_phase = new_phase
             self.phase_transition_timer = 2000  # Show "PHASE X!" for 2 seconds
@@ -1732,7 +1782,7 @@ class Boss:
         else:
             # Good distance - strafe occasionally
             if int(self.anim_timer / 1000) % 4 == 0:
-                move_direction = 1 if random.random() > 0.5 else -1
+                move_direction = 1 if get_rng('boss').random() > 0.5 else -1
             else:
                 move_direction = 0
 
@@ -1778,14 +1828,6 @@ class Boss:
             if self.attack_anim_timer <= 0:
                 self.is_attacking = False
         
-        # Update projectiles
-        for proj in self.projectiles[:]:
-            proj['x'] += proj['vx']
-            proj['y'] += proj['vy']
-            proj['life'] -= dt
-            if proj['life'] <= 0:
-                self.projectiles.remove(proj)
-        
         # Flash timer
         if self.flash_timer > 0:
             self.flash_timer -= dt
@@ -1826,28 +1868,17 @@ class Boss:
             for i in range(num_projectiles):
                 angle = -20 + (40 * i / max(1, num_projectiles - 1)) if num_projectiles > 1 else 0
                 rad = math.radians(angle)
-                self.projectiles.append({
-                    'x': self.x + self.WIDTH // 2,
-                    'y': self.y + self.HEIGHT // 3,
-                    'vx': math.cos(rad) * 8 * self.direction,
-                    'vy': math.sin(rad) * 8,
-                    'life': 2000,
-                    'damage': 15
-                })
+                self.projectiles.spawn(self, self.x + self.WIDTH // 2, self.y + self.HEIGHT // 3,
+                                       math.cos(rad) * 8 * self.direction, math.sin(rad) * 8,
+                                       life=2000, damage=15, half_size=10, style=STYLE_DARK_ORB)
             self.attack_cooldown = 2000 / self.phase
         elif self.attack_pattern == 2:
             # Ground slam - shockwave (handled via projectiles going outward)
             for i in range(8):
                 angle = (i / 8) * math.pi * 2
-                self.projectiles.append({
-                    'x': self.x + self.WIDTH // 2,
-                    'y': self.y + self.HEIGHT,
-                    'vx': math.cos(angle) * 5,
-                    'vy': math.sin(angle) * 3 - 2,
-                    'life': 1500,
-                    'damage': 10,
-                    'is_shockwave': True
-                })
+                self.projectiles.spawn(self, self.x + self.WIDTH // 2, self.y + self.HEIGHT,
+                                       math.cos(angle) * 5, math.sin(angle) * 3 - 2,
+                                       life=1500, damage=10, half_size=10, style=STYLE_SHOCKWAVE)
             self.attack_cooldown = 3000 / self.phase
     
     def get_attack_rect(self):
@@ -1866,16 +1897,7 @@ class Boss:
             self.health = 0
             self.defeated = True
             # Start death animation - spawn initial explosion of particles
-            for _ in range(30):
-                self.death_particles.append({
-                    'x': self.x + random.randint(0, self.WIDTH),
-                    'y': self.y + random.randint(0, self.HEIGHT),
-                    'vx': random.uniform(-5, 5),
-                    'vy': random.uniform(-8, -2),
-                    'life': random.randint(600, 1200),
-                    'alpha': 255,
-                    'color': random.choice([(150, 50, 150), (100, 0, 100), (200, 100, 200), (255, 100, 255)])
-                })
+            get_particle_system().emit('boss_death_burst', self.x, self.y, self.WIDTH, self.HEIGHT)
             return True
         return False
     
@@ -1886,6 +1908,61 @@ class Boss:
         """Check if death animation has finished."""
         return self.defeated and self.death_timer >= self.death_duration
     
+    @classmethod
+    def get_body_sprite(cls, phase, direction, eye_step):
+        """Get the boss body with eyes and staff, rendering it on first use."""
+        facing = 1 if direction > 0 else -1
+        key = (phase, facing, eye_step)
+        sprite = cls.SPRITE_CACHE.get(key)
+        if sprite is not None:
+            return sprite
+
+        sprite = pygame.Surface((cls.WIDTH + cls.SPRITE_PAD_X * 2, cls.HEIGHT + cls.SPRITE_PAD_Y * 2), pygame.SRCALPHA)
+        x, y = cls.SPRITE_PAD_X, cls.SPRITE_PAD_Y
+
+        # Robe body
+        robe_color = (40, 20, 50) if phase == 1 else (60, 20, 40) if phase == 2 else (80, 20, 30)
+        pygame.draw.ellipse(sprite, robe_color, (x + 10, y + 40, 60, 80))
+        pygame.draw.ellipse(sprite, (30, 15, 40), (x + 10, y + 40, 60, 80), 2)
+
+        # Hood/head
+        hood_color = (50, 25, 60)
+        pygame.draw.ellipse(sprite, hood_color, (x + 15, y + 5, 50, 50))
+        pygame.draw.ellipse(sprite, (30, 15, 35), (x + 15, y + 5, 50, 50), 2)
+
+        # Glowing eyes
+        eye_color = (255, 50, 50) if phase < 3 else (255, 100, 100)
+        eye_glow = eye_step * cls.EYE_GLOW_STEP
+        eye_shift = 5 if facing > 0 else 0
+        pygame.draw.circle(sprite, (eye_color[0], eye_glow, eye_glow), (x + 28 + eye_shift, y + 25), 6)
+        pygame.draw.circle(sprite, (eye_color[0], eye_glow, eye_glow), (x + 48 + eye_shift, y + 25), 6)
+        pygame.draw.circle(sprite, (255, 200, 100), (x + 28 + eye_shift, y + 25), 3)
+        pygame.draw.circle(sprite, (255, 200, 100), (x + 48 + eye_shift, y + 25), 3)
+
+        # Staff/wand
+        staff_x = x + (cls.WIDTH + 10 if facing > 0 else -20)
+        pygame.draw.line(sprite, (100, 70, 50), (staff_x, y + 30), (staff_x, y + 100), 4)
+        pygame.draw.line(sprite, (70, 50, 35), (staff_x, y + 30), (staff_x, y + 100), 2)
+
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        cls.SPRITE_CACHE[key] = sprite
+        return sprite
+
+    @classmethod
+    def get_orb_sprite(cls, orb_glow):
+        """Get the staff orb at a given glow radius, rendering it on first use."""
+        sprite = cls.ORB_CACHE.get(orb_glow)
+        if sprite is None:
+            size = (orb_glow + 4) * 2 + 1
+            center = size // 2
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (100, 50, 150), (center, center), orb_glow + 4)
+            pygame.draw.circle(sprite, (180, 100, 220), (center, center), orb_glow)
+            pygame.draw.circle(sprite, (255, 200, 255), (center, center), orb_glow // 2)
+            cls.ORB_CACHE[orb_glow] = sprite
+        return sprite
+
     def draw(self, screen, camera_x):
         screen_x = int(self.x - camera_x)
         y = int(self.y + self.hover_offset)
@@ -1898,7 +1975,7 @@ class Boss:
             # Draw fading boss
             if self.death_timer < 1500:
                 fade_alpha = max(0, int(255 * (1 - self.death_timer / 1500)))
-                fade_surf = pygame.Surface((self.WIDTH + 20, self.HEIGHT + 20), pygame.SRCALPHA)
+                fade_surf = get_surface_cache().scratch(self.WIDTH + 20, self.HEIGHT + 20)
 
                 # Draw shrinking/fading boss silhouette
                 shrink = self.death_timer / 1500 * 0.5
@@ -1912,27 +1989,15 @@ class Boss:
                                    (offset_x + 10, offset_y + 10, draw_w, draw_h))
                 screen.blit(fade_surf, (screen_x - 10, y - 10))
 
-            # Draw death particles
-            for p in self.death_particles:
-                px = int(p['x'] - camera_x)
-                py = int(p['y'])
-                if 0 <= px <= SCREEN_WIDTH:
-                    particle_surf = pygame.Surface((12, 12), pygame.SRCALPHA)
-                    alpha = max(0, min(255, int(p['alpha'])))
-                    color_with_alpha = (p['color'][0], p['color'][1], p['color'][2], alpha)
-                    pygame.draw.circle(particle_surf, color_with_alpha, (6, 6), 6)
-                    screen.blit(particle_surf, (px - 6, py - 6))
-
             # "DEFEATED!" text
             if self.death_timer < 2000:
-                font = pygame.font.Font(None, 48)
+                text_cache = get_text_cache()
                 text_alpha = min(255, int(self.death_timer / 500 * 255))
                 if self.death_timer > 1500:
                     text_alpha = max(0, int(255 * (1 - (self.death_timer - 1500) / 500)))
-                text_surf = font.render("DEFEATED!", True, (255, 200, 50))
-                text_surf.set_alpha(text_alpha)
+                text_surf = text_cache.render("DEFEATED!", 48, (255, 200, 50))
                 text_x = screen_x + self.WIDTH // 2 - text_surf.get_width() // 2
-                screen.blit(text_surf, (text_x, y - 50))
+                text_cache.draw(screen, "DEFEATED!", 48, (255, 200, 50), (text_x, y - 50), text_alpha)
             return
 
         if not self.active:
@@ -1942,34 +2007,13 @@ class Boss:
         if self.flash_timer > 0 and int(self.flash_timer / 50) % 2 == 0:
             return
         
-        # Draw boss - Dark Wizard appearance
-        # Robe body
-        robe_color = (40, 20, 50) if self.phase == 1 else (60, 20, 40) if self.phase == 2 else (80, 20, 30)
-        pygame.draw.ellipse(screen, robe_color, (screen_x + 10, y + 40, 60, 80))
-        pygame.draw.ellipse(screen, (30, 15, 40), (screen_x + 10, y + 40, 60, 80), 2)
-        
-        # Hood/head
-        hood_color = (50, 25, 60)
-        pygame.draw.ellipse(screen, hood_color, (screen_x + 15, y + 5, 50, 50))
-        pygame.draw.ellipse(screen, (30, 15, 35), (screen_x + 15, y + 5, 50, 50), 2)
-        
-        # Glowing eyes
-        eye_color = (255, 50, 50) if self.phase < 3 else (255, 100, 100)
+        # Draw boss - Dark Wizard appearance (pre-rendered body, eyes and staff)
         eye_glow = int(abs(math.sin(self.anim_timer * 0.005)) * 50)
-        pygame.draw.circle(screen, (eye_color[0], eye_glow, eye_glow), 
-                          (screen_x + 28 + (5 if self.direction > 0 else 0), y + 25), 6)
-        pygame.draw.circle(screen, (eye_color[0], eye_glow, eye_glow), 
-                          (screen_x + 48 + (5 if self.direction > 0 else 0), y + 25), 6)
-        pygame.draw.circle(screen, (255, 200, 100), 
-                          (screen_x + 28 + (5 if self.direction > 0 else 0), y + 25), 3)
-        pygame.draw.circle(screen, (255, 200, 100), 
-                          (screen_x + 48 + (5 if self.direction > 0 else 0), y + 25), 3)
-        
-        # Staff/wand
-        staff_x = screen_x + (self.WIDTH + 10 if self.direction > 0 else -20)
-        pygame.draw.line(screen, (100, 70, 50), (staff_x, y + 30), (staff_x, y + 100), 4)
-        pygame.draw.line(screen, (70, 50, 35), (staff_x, y + 30), (staff_x, y + 100), 2)
+        body = Boss.get_body_sprite(self.phase, self.direction, eye_glow // Boss.EYE_GLOW_STEP)
+        screen.blit(body, (screen_x - Boss.SPRITE_PAD_X, y - Boss.SPRITE_PAD_Y))
+
         # Staff orb
+        staff_x = screen_x + (self.WIDTH + 10 if self.direction > 0 else -20)
         orb_glow = 8 + int(abs(math.sin(self.anim_timer * 0.008)) * 6)
 
         # Charging telegraph effect - staff builds power before attack
@@ -1983,43 +2027,27 @@ class Boss:
             pygame.draw.circle(screen, (255, 150, 50), (staff_x, y + 25), charge_orb_size + 8)
             # Boss body glow (pulsing warning)
             pulse = int(abs(math.sin(self.anim_timer * 0.02)) * 100 * charge_progress)
-            glow_surf = pygame.Surface((self.WIDTH + 40, self.HEIGHT + 40), pygame.SRCALPHA)
+            glow_surf = get_surface_cache().scratch(self.WIDTH + 40, self.HEIGHT + 40)
             pygame.draw.ellipse(glow_surf, (255, 100, 100, pulse), (0, 0, self.WIDTH + 40, self.HEIGHT + 40))
             screen.blit(glow_surf, (screen_x - 20, y - 20))
             # Warning text
             if charge_progress > 0.5:
-                font = pygame.font.Font(None, 24)
-                warn_text = font.render("!", True, (255, 50, 50))
+                warn_text = get_text_cache().render("!", 24, (255, 50, 50))
                 screen.blit(warn_text, (screen_x + self.WIDTH // 2 - 5, y - 45))
 
-        pygame.draw.circle(screen, (100, 50, 150), (staff_x, y + 25), orb_glow + 4)
-        pygame.draw.circle(screen, (180, 100, 220), (staff_x, y + 25), orb_glow)
-        pygame.draw.circle(screen, (255, 200, 255), (staff_x, y + 25), orb_glow // 2)
+        orb = Boss.get_orb_sprite(orb_glow)
+        screen.blit(orb, (staff_x - orb.get_width() // 2, y + 25 - orb.get_height() // 2))
 
         # Attack effect
         if self.is_attacking and self.attack_pattern == 0:
             # Melee swing arc
             arc_x = screen_x + (self.WIDTH if self.direction > 0 else -60)
             arc_alpha = int(200 * (self.attack_anim_timer / 500))
-            arc_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
+            arc_surf = get_surface_cache().scratch(100, 100)
             pygame.draw.arc(arc_surf, (200, 50, 200, arc_alpha), (0, 0, 100, 100), 
                            0 if self.direction > 0 else math.pi, math.pi if self.direction > 0 else math.pi * 2, 8)
             screen.blit(arc_surf, (arc_x - 20, y + 10))
         
-        # Draw projectiles
-        for proj in self.projectiles:
-            px = int(proj['x'] - camera_x)
-            py = int(proj['y'])
-            if proj.get('is_shockwave'):
-                # Shockwave - ground energy
-                pygame.draw.circle(screen, (150, 50, 150), (px, py), 12)
-                pygame.draw.circle(screen, (200, 100, 200), (px, py), 8)
-            else:
-                # Dark magic projectile
-                pygame.draw.circle(screen, (80, 40, 100), (px, py), 14)
-                pygame.draw.circle(screen, (150, 80, 180), (px, py), 10)
-                pygame.draw.circle(screen, (220, 150, 255), (px, py), 5)
-        
         # Health bar above boss
         bar_width = 100
         bar_x = screen_x + (self.WIDTH - bar_width) // 2
@@ -2034,8 +2062,7 @@ class Boss:
         
         # Phase indicator (small)
         phase_text = f"PHASE {self.phase}"
-        font_small = pygame.font.Font(None, 20)
-        text_surf = font_small.render(phase_text, True, (255, 150, 150))
+        text_surf = get_text_cache().render(phase_text, 20, (255, 150, 150))
         screen.blit(text_surf, (screen_x + self.WIDTH // 2 - text_surf.get_width() // 2, y - 35))
 
         # Phase transition popup (big dramatic text)
@@ -2044,26 +2071,64 @@ class Boss:
             flash_alpha = min(255, int(self.phase_transition_timer / 2000 * 255))
             # Screen flash on transition
             if self.phase_transition_timer > 1800:
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
                 intensity = int((self.phase_transition_timer - 1800) / 200 * 150)
                 phase_color = (150, 50, 50) if self.phase == 3 else (150, 150, 50)
-                flash_surf.fill((*phase_color, intensity))
-                screen.blit(flash_surf, (0, 0))
+                get_surface_cache().draw_flash(screen, phase_color, intensity)
 
             # Big "PHASE X!" text
-            font_big = pygame.font.Font(None, 64)
+            text_cache = get_text_cache()
             phase_names = {1: "PHASE 1", 2: "PHASE 2 - ENRAGED!", 3: "PHASE 3 - FINAL FORM!"}
             big_text = phase_names.get(self.phase, f"PHASE {self.phase}")
-            # Outline
-            outline_surf = font_big.render(big_text, True, (0, 0, 0))
-            outline_surf.set_alpha(flash_alpha)
-            for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
-                screen.blit(outline_surf, (SCREEN_WIDTH // 2 - outline_surf.get_width() // 2 + dx, 200 + dy))
-            # Main text
+            # Main text with outline
             color = (255, 100, 100) if self.phase == 3 else (255, 200, 50)
-            text_surf_big = font_big.render(big_text, True, color)
-            text_surf_big.set_alpha(flash_alpha)
-            screen.blit(text_surf_big, (SCREEN_WIDTH // 2 - text_surf_big.get_width() // 2, 200))
+            text_surf_big = text_cache.render_outlined(big_text, 64, color, (0, 0, 0), 2, diagonals=False)
+            text_cache.draw_surface(screen, text_surf_big,
+                                    (SCREEN_WIDTH // 2 - text_surf_big.get_width() // 2, 198), flash_alpha)
+
+
+class SpatialHash:
+    """Dynamic spatial hash of hitboxes, cleared and refilled every frame."""
+
+    CELL_SIZE = 128
+
+    def __init__(self):
+        self.cells = {}  # (col, row) -> indices into items
+        self.items = []  # (rect, item) in insertion order
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+
+    def insert(self, rect, item):
+        index = len(self.items)
+        self.items.append((rect, item))
+        size = self.CELL_SIZE
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                cell = self.cells.get((col, row))
+                if cell is None:
+                    self.cells[(col, row)] = [index]
+                else:
+                    cell.append(index)
+
+    def _candidates(self, x, y, w, h):
+        size = self.CELL_SIZE
+        col0, col1 = x // size, (x + w - 1) // size
+        row0, row1 = y // size, (y + h - 1) // size
+        if col0 == col1 and row0 == row1:
+            return self.cells.get((col0, row0), ())
+        found = set()
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                found.update(self.cells.get((col, row), ()))
+        return sorted(found)
+
+    def query(self, rect):
+        """Items whose rect overlaps rect, in insertion order."""
+        if not self.items or rect.width <= 0 or rect.height <= 0:
+            return []
+        return [self.items[i][1] for i in self._candidates(rect.x, rect.y, rect.width, rect.height)
+                if self.items[i][0].colliderect(rect)]
 
 
 class EnemyManager:
@@ -2071,8 +2136,19 @@ class EnemyManager:
 
     def __init__(self, level):
         self.enemies = []
-        self.spawn_data = level.get_enemy_spawns()
-        self.spawned_indices = set()
+        self.target_hash = SpatialHash()  # Enemy/boss hurtboxes
+        self.player_hash = SpatialHash()  # Player hurtboxes
+        # Spawn records sorted by x; spawn_cursor only moves forward as the camera advances
+        self.spawn_data = sorted(level.get_enemy_spawns(), key=lambda spawn: spawn[0])
+        self.spawn_cursor = 0
+        # Enemy and boss shots live in one array store, owned by this manager
+        self.projectiles = ProjectileEngine()
+        # Enemy slots are built at load so spawning mid-fight never allocates
+        self.spawn_slots = [Enemy(x, y, enemy_type, projectiles=self.projectiles)
+                            for x, y, enemy_type in self.spawn_data]
+        for i, enemy in enumerate(self.spawn_slots):
+            enemy.lod_phase = i % Enemy.LOD_NEAR_INTERVAL
+        self.lod_frame = 0
         self.score = 0
         
         # Boss handling
@@ -2080,22 +2156,48 @@ class EnemyManager:
         self.boss_spawned = False
         self.level = level
 
+        # Bake enemy flipbooks up front so first sightings don't hitch
+        for enemy_type in {spawn[2] for spawn in self.spawn_data}:
+            Enemy.get_flipbook(enemy_type)
+            if enemy_type == 'malfoy':
+                Enemy.get_flipbook(enemy_type, casting=True)
+
     def update(self, platforms, players, dt, camera_x):
         """Update all enemies and spawn new ones."""
-        # Spawn enemies that are near the camera
-        for i, (x, y, enemy_type) in enumerate(self.spawn_data):
-            if i not in self.spawned_indices:
-                # Spawn when player approaches
-                if x - camera_x < SCREEN_WIDTH + 300:
-                    self.enemies.append(Enemy(x, y, enemy_type))
-                    self.spawned_indices.add(i)
-
-        # Update existing enemies
-        for enemy in self.enemies[:]:
-            if enemy.is_alive():
-                enemy.update(platforms, players, dt, camera_x)
+        # Spawn enemies that are near the camera (when player approaches)
+        spawn_limit = camera_x + SCREEN_WIDTH + 300
+        while self.spawn_cursor < len(self.spawn_data) and self.spawn_data[self.spawn_cursor][0] < spawn_limit:
+            enemy = self.spawn_slots[self.spawn_cursor]
+            get_tracer().instant('enemy_spawn', type=enemy.enemy_type, x=int(enemy.x))
+            self.enemies.append(enemy)
+            self.spawn_slots[self.spawn_cursor] = None  # Handed over to self.enemies
+            self.spawn_cursor += 1
+
+        # Move existing shots before anyone fires this frame
+        self.projectiles.update(dt)
+
+        # Drop dead enemies (their shots vanish with them), then update the rest by level of detail
+        if not all(enemy.is_alive() for enemy in self.enemies):
+            for enemy in self.enemies:
+                if not enemy.is_alive():
+                    self.projectiles.remove_owner(enemy)
+            self.enemies = [enemy for enemy in self.enemies if enemy.is_alive()]
+        self.lod_frame += 1
+        for enemy in self.enemies:
+            tier = enemy.get_lod_tier(camera_x)
+            enemy.lod_tier = tier
+            if tier == Enemy.LOD_FULL:
+                enemy.update(platforms, players, dt + enemy.lod_pending_dt, camera_x)
+                enemy.lod_pending_dt = 0
+            elif tier == Enemy.LOD_NEAR:
+                # Reduced rate, but timers still see the full elapsed time
+                enemy.lod_pending_dt += dt
+                if (self.lod_frame + enemy.lod_phase) % Enemy.LOD_NEAR_INTERVAL == 0:
+                    enemy.update(platforms, players, enemy.lod_pending_dt, camera_x)
+                    enemy.lod_pending_dt = 0
             else:
-                self.enemies.remove(enemy)
+                # Dormant/hibernating: frozen, and time spent away is not replayed
+                enemy.lod_pending_dt = 0
         
         # Boss spawning and update
         if self.level.has_boss and not self.boss_spawned:
@@ -2104,14 +2206,18 @@ class EnemyManager:
                 if player.is_alive() and hasattr(self.level, 'boss_spawn_x'):
                     if player.x >= self.level.boss_spawn_x - 100:
                         # Spawn the boss!
-                        self.boss = Boss(self.level.boss_spawn_x + 200, self.level.boss_spawn_y - Boss.HEIGHT)
+                        self.boss = Boss(self.level.boss_spawn_x + 200, self.level.boss_spawn_y - Boss.HEIGHT,
+                                         projectiles=self.projectiles)
                         self.boss_spawned = True
+                        get_tracer().instant('boss_spawn', x=int(self.boss.x))
                         break
         
         # Update boss (including death animation)
         if self.boss:
             if self.boss.is_alive() or self.boss.defeated:
                 self.boss.update(players, dt, platforms)
+            if self.boss.defeated:
+                self.projectiles.remove_owner(self.boss)
             # Clean up boss after death animation
             if self.boss.is_death_animation_complete():
                 self.boss = None
@@ -2119,117 +2225,99 @@ class EnemyManager:
     def check_collisions(self, players, enemy_damage_mult=1.0):
         """Check collisions between enemies and players. Returns hit events for feedback.
 
+        Bodies are hashed once per frame and every hitbox (melee swing,
+        projectile, special effect area) only resolves against the bodies
+        it overlaps. The boss goes through the same path as regular enemies.
+
         Args:
             players: List of player objects
             enemy_damage_mult: Difficulty-based damage multiplier (0.75=Easy, 1.0=Normal, 1.25=Hard)
         """
         hit_events = []  # List of (x, y, damage, is_critical) for damage popups
+        boss = self.boss if self.boss and self.boss.is_alive() else None
+        alive_players = [p for p in players if p.is_alive()]
 
+        # === Hurtboxes ===
+        targets = self.target_hash
+        targets.clear()
+        for enemy in self.enemies:
+            if enemy.is_alive() and enemy.active:
+                targets.insert(enemy.rect, enemy)
+        if boss:
+            targets.insert(boss.rect, boss)
+
+        player_bodies = self.player_hash
+        player_bodies.clear()
+        for player in alive_players:
+            player_bodies.insert(player.rect, player)
+
+        # === Enemies hitting players ===
+        # Bodies in enemy order, then the boss, then every shot in fire order
+        # (the first hit each frame makes a player invincible)
         for enemy in self.enemies:
             if not enemy.is_alive() or not enemy.active:
                 continue
-
-            for player in players:
-                if not player.is_alive():
+            # Enemy touching player
+            for player in player_bodies.query(enemy.rect):
+                if enemy.can_attack():
+                    # Apply difficulty scaling to enemy damage
+                    player.take_damage(int(enemy.attack() * enemy_damage_mult))
+
+        if boss:
+            for player in player_bodies.query(boss.rect):
+                player.take_damage(int(boss.damage * enemy_damage_mult))
+            # Boss melee attack hitting player
+            boss_attack_rect = boss.get_attack_rect()
+            if boss_attack_rect:
+                for player in player_bodies.query(boss_attack_rect):
+                    player.take_damage(int(boss.damage * enemy_damage_mult))
+
+        # Enemy and boss projectiles, tested against all players in one pass
+        for player, damage in self.projectiles.hit_players(alive_players):
+            # Apply difficulty scaling to projectile damage
+            player.take_damage(int(damage * enemy_damage_mult))
+
+        # === Players hitting enemies ===
+        for player in alive_players:
+            # Player melee attack
+            if player.attacking and player.attack_rect:
+                for target in targets.query(player.attack_rect):
+                    self._damage_target(target, player.character.damage, player.direction,
+                                        True, hit_events)
+
+            # Player projectiles
+            for proj in player.projectiles:
+                for target in targets.query(proj.rect):
+                    knockback_dir = 1 if proj.vel_x > 0 else -1
+                    self._damage_target(target, proj.damage, knockback_dir, False, hit_events)
+                    proj.active = False
+
+            # Player special effects - one damage rect per effect per frame
+            for effect in player.special_effects:
+                if not effect.active:
                     continue
-
-                # Enemy touching player
-                if enemy.rect.colliderect(player.rect):
-                    if enemy.can_attack():
-                        base_damage = enemy.attack()
-                        # Apply difficulty scaling to enemy damage
-                        scaled_damage = int(base_damage * enemy_damage_mult)
-                        player.take_damage(scaled_damage)
-
-                # Enemy projectiles hitting player
-                for proj in enemy.projectiles[:]:
-                    proj_rect = pygame.Rect(int(proj['x']) - 8, int(proj['y']) - 8, 16, 16)
-                    if proj_rect.colliderect(player.rect):
-                        # Apply difficulty scaling to projectile damage
-                        scaled_damage = int(proj['damage'] * enemy_damage_mult)
-                        player.take_damage(scaled_damage)
-                        enemy.projectiles.remove(proj)
-
-                # Player melee attack hitting enemy
-                if player.attacking and player.attack_rect:
-                    if enemy.rect.colliderect(player.attack_rect):
-                        damage = player.character.damage
-                        knockback_dir = player.direction
-                        if enemy.take_damage(damage, knockback_dir):
-                            self.add_score(enemy.enemy_type)
-                        hit_events.append((enemy.x + enemy.rect.width // 2, enemy.y, damage, True))
-
-                # Player projectiles hitting enemy
-                for proj in player.projectiles[:]:
-                    if enemy.rect.colliderect(proj.rect):
-                        knockback_dir = 1 if proj.vel_x > 0 else -1
-                        if enemy.take_damage(proj.damage, knockback_dir):
-                            self.add_score(enemy.enemy_type)
-                        hit_events.append((enemy.x + enemy.rect.width // 2, enemy.y, proj.damage, False))
-                        proj.active = False
-
-                # Player special effects hitting enemy
-                for effect in player.special_effects:
-                    if effect.active and effect.check_enemy_hit(enemy):
-                        knockback_dir = effect.owner.direction if hasattr(effect, 'owner') else 0
-                        if enemy.take_damage(effect.damage, knockback_dir):
-                            self.add_score(enemy.enemy_type)
-                        hit_events.append((enemy.x + enemy.rect.width // 2, enemy.y, effect.damage, True))
-        
-        # Boss collisions
-        if self.boss and self.boss.is_alive():
-            for player in players:
-                if not player.is_alive():
+                damage_rect = effect.get_damage_rect()
+                if not damage_rect:
                     continue
-
-                # Boss touching player (apply difficulty scaling)
-                if self.boss.rect.colliderect(player.rect):
-                    scaled_damage = int(self.boss.damage * enemy_damage_mult)
-                    player.take_damage(scaled_damage)
-
-                # Boss melee attack hitting player
-                boss_attack_rect = self.boss.get_attack_rect()
-                if boss_attack_rect and boss_attack_rect.colliderect(player.rect):
-                    scaled_damage = int(self.boss.damage * enemy_damage_mult)
-                    player.take_damage(scaled_damage)
-
-                # Boss projectiles hitting player
-                for proj in self.boss.projectiles[:]:
-                    proj_rect = pygame.Rect(int(proj['x']) - 10, int(proj['y']) - 10, 20, 20)
-                    if proj_rect.colliderect(player.rect):
-                        scaled_damage = int(proj['damage'] * enemy_damage_mult)
-                        player.take_damage(scaled_damage)
-                        self.boss.projectiles.remove(proj)
-                
-                # Player attacking boss
-                if player.attacking and player.attack_rect:
-                    if self.boss.rect.colliderect(player.attack_rect):
-                        damage = player.character.damage
-                        if self.boss.take_damage(damage):
-                            self.add_score('boss')
-                        hit_events.append((self.boss.x + self.boss.WIDTH // 2, self.boss.y, damage, True))
-
-                # Player projectiles hitting boss
-                for proj in player.projectiles[:]:
-                    if self.boss.rect.colliderect(proj.rect):
-                        if self.boss.take_damage(proj.damage):
-                            self.add_score('boss')
-                        hit_events.append((self.boss.x + self.boss.WIDTH // 2, self.boss.y, proj.damage, False))
-                        proj.active = False
-
-                # Player special effects hitting boss
-                for effect in player.special_effects:
-                    if effect.active:
-                        damage_rect = effect.get_damage_rect()
-                        if damage_rect and damage_rect.colliderect(self.boss.rect):
-                            if id(self.boss) not in effect.damaged_enemies:
-                                effect.damaged_enemies.add(id(self.boss))
-                                if self.boss.take_damage(effect.damage):
-                                    self.add_score('boss')
-                                hit_events.append((self.boss.x + self.boss.WIDTH // 2, self.boss.y, effect.damage, True))
+                for target in targets.query(damage_rect):
+                    if effect.check_enemy_hit(target, damage_rect):
+                        knockback_dir = effect.owner.direction if hasattr(effect, 'owner') else 0
+                        self._damage_target(target, effect.damage, knockback_dir, True, hit_events)
 
         return hit_events
 
+    def _damage_target(self, target, damage, knockback_dir, is_critical, hit_events):
+        """Apply player damage to an enemy or the boss, scoring kills."""
+        if target is self.boss:
+            killed = target.take_damage(damage)
+            score_type = 'boss'
+        else:
+            killed = target.take_damage(damage, knockback_dir)
+            score_type = target.enemy_type
+        if killed:
+            self.add_score(score_type)
+        hit_events.append((target.x + target.rect.width // 2, target.y, damage, is_critical))
+
     def add_score(self, enemy_type):
         """Add score based on enemy type."""
         scores = {'walker': 10, 'flying': 15, 'tank': 25, 'boss': 500}
@@ -2244,8 +2332,8 @@ class EnemyManager:
         # Boss is defeated if it's None (cleaned up) or marked as defeated
         return self.boss is None or self.boss.defeated
 
-    def draw(self, screen, camera_x):
-        """Draw all enemies."""
+    def draw(self, screen, camera_x, alpha=1.0):
+        """Draw all enemies; alpha blends shots between the last two steps."""
         for enemy in self.enemies:
             if enemy.is_alive():
                 enemy.draw(screen, camera_x)
@@ -2253,3 +2341,6 @@ class EnemyManager:
         # Draw boss (including death animation)
         if self.boss:
             self.boss.draw(screen, camera_x)
+
+        # Enemy and boss shots on top, in one batch
+        self.projectiles.draw(screen, camera_x, alpha)
@@ -1,6 +1,7 @@
 # Game State Machine
 
 from enum import Enum
+from tracer import get_tracer
 
 
 class GameState(Enum):
@@ -84,6 +85,7 @@ class StateManager:
 
     def change_state(self, new_state):
         """Change to a new state."""
+        get_tracer().instant('state_change', previous=self.current_state.name, state=new_state.name)
         self.previous_state = self.current_state
         self.current_state = new_state
 
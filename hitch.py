@@ -0,0 +1,170 @@
+# Hitch Watchdog for Harry Potter Adventure
+# Catches frames over a time budget and saves what the game was doing at the time
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+import pygame
+from settings import *
+from profiler import get_profiler, STAGES
+from draw_counters import get_draw_counters
+from random_streams import get_random_streams
+from replay import RECORDED_KEYS, keys_to_mask
+
+# Captures waiting for the writer thread; more hitches while it is busy are dropped
+HITCH_QUEUE_SIZE = 4
+
+
+def describe_input(masks):
+    """Key masks (oldest first) as key changes: [{'step', 'keys'}, ...].
+
+    'step' counts back from the hitch (-1 is the step just before it).
+    """
+    changes = []
+    previous = None
+    for i, mask in enumerate(masks):
+        if mask != previous:
+            keys = [pygame.key.name(key) for bit, key in enumerate(RECORDED_KEYS) if mask >> bit & 1]
+            changes.append({'step': i - len(masks), 'keys': keys})
+            previous = mask
+    return changes
+
+
+class HitchWatchdog:
+    """Saves a screenshot and a JSON report whenever a frame runs long.
+
+    check() runs on the main thread after each drawn frame and only copies
+    what it needs; PNG encoding and file writes happen on a background
+    thread, so a capture never causes a second hitch. Frame times come from
+    the frame profiler, which keeps timing stages while the watchdog is on.
+    """
+
+    def __init__(self, threshold_ms=HITCH_THRESHOLD_MS, directory=HITCH_DIR):
+        self.threshold_ms = threshold_ms
+        self.directory = directory
+        self.enabled = False
+        self.queue = queue.Queue(maxsize=HITCH_QUEUE_SIZE)
+        self.thread = None
+        self.last_capture = None
+        self.input = deque(maxlen=HITCH_INPUT_SECONDS * FPS)  # Recent key masks, one per sim step
+        self.captured = 0
+        self.dropped = 0
+
+    def start(self):
+        if self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._write_loop, name='hitch-writer', daemon=True)
+            self.thread.start()
+        get_profiler().set_watched('hitch', True)
+        self.enabled = True
+
+    def stop(self, flush=True):
+        """Stop watching; with flush, wait for pending captures to be written."""
+        if self.enabled:
+            get_profiler().set_watched('hitch', False)
+            self.enabled = False
+        if flush and self.thread is not None:
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+            self.thread = None
+
+    def toggle(self):
+        if self.enabled:
+            self.stop(flush=False)
+        else:
+            self.start()
+        return self.enabled
+
+    def record_input(self, keys):
+        """Remember this sim step's keys for the next report."""
+        if self.enabled:
+            self.input.append(keys_to_mask(keys))
+
+    def check(self, game):
+        """Capture the frame just drawn if its work went over the threshold.
+
+        The profiler's frame total is work only (events, sim steps, drawing),
+        never the clock.tick() sleep. Frames where no profiled stage ran
+        (menus) are not gameplay hitches and are skipped.
+        """
+        if not self.enabled:
+            return False
+        frame = get_profiler().last_frame
+        if frame is None or not frame[1] or frame[0] < self.threshold_ms:
+            return False
+        now = time.perf_counter()
+        if self.last_capture is not None and (now - self.last_capture) * 1000 < HITCH_COOLDOWN_MS:
+            return False
+        self.last_capture = now
+
+        report = self.describe(game, frame)
+        report['capture'] = self.captured + self.dropped + 1
+        try:
+            self.queue.put_nowait((game.screen.copy(), report))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.captured += 1
+        return True
+
+    def describe(self, game, frame):
+        """JSON-ready report of the slow frame and the game around it."""
+        total, stages = frame
+        ordered = [s for s in STAGES if s in stages] + sorted(set(stages) - set(STAGES))
+        area = None
+        if game.level is not None and game.camera is not None:
+            story_area = game.level.get_story_area(game.camera.x)
+            area = story_area[0] if story_area else None
+
+        report = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'frame_ms': round(total, 3),
+            'threshold_ms': self.threshold_ms,
+            'stages_ms': {stage: round(stages[stage], 3) for stage in ordered},
+            'untracked_ms': round(total - sum(stages.values()), 3),  # Events, interpolation, flip
+            'state': game.state_manager.current_state.name,
+            'level': game.state_manager.current_level,
+            'story_area': area,
+            'camera_x': round(game.camera.x, 1) if game.camera is not None else None,
+            'seed': get_random_streams().seed,
+            'entities': game.get_entity_counts(),
+            'input': describe_input(self.input),
+        }
+        counters = get_draw_counters()
+        if counters.enabled:
+            report['draw_counts'] = dict(counters.last_frame)
+        return report
+
+    # === WRITER THREAD ===
+
+    def _write_loop(self):
+        while True:
+            capture = self.queue.get()
+            if capture is None:
+                return
+            screenshot, report = capture
+            name = f"hitch_{time.strftime('%Y%m%d_%H%M%S')}_{report['capture']:03d}"
+            base = os.path.join(self.directory, name)
+            try:
+                pygame.image.save(screenshot, base + '.png')
+                report['screenshot'] = name + '.png'
+                with open(base + '.json', 'w') as f:
+                    json.dump(report, f, indent=2)
+            except (OSError, pygame.error) as e:
+                print(f"Hitch capture failed: {e}")
+
+
+# Global hitch watchdog instance
+hitch_watchdog = None
+
+def get_hitch_watchdog():
+    """Get or create the global hitch watchdog."""
+    global hitch_watchdog
+    if hitch_watchdog is None:
+        hitch_watchdog = HitchWatchdog()
+    return hitch_watchdog
@@ -3,7 +3,53 @@
 import pygame
 import math
 import random
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from settings import *
+from surface_cache import get_surface_cache
+from random_streams import get_rng
+from profiler import get_profiler
+
+
+# === Sky gradient cache ===
+SKY_GRADIENT_CACHE_SIZE = 16
+SKY_COLOR_STEP = 4  # Colors are snapped to this step so near-identical skies share a surface
+_sky_gradient_cache = OrderedDict()
+
+
+def _quantize_color(color):
+    """Snap an RGB color to the sky cache grid."""
+    return tuple(min(255, (int(c) + SKY_COLOR_STEP // 2) // SKY_COLOR_STEP * SKY_COLOR_STEP) for c in color)
+
+
+def get_sky_gradient(sky_top, sky_bottom):
+    """Get a full-screen vertical gradient surface, rendering it only on a cache miss."""
+    key = (_quantize_color(sky_top), _quantize_color(sky_bottom))
+    surf = _sky_gradient_cache.get(key)
+    if surf is not None:
+        _sky_gradient_cache.move_to_end(key)
+        return surf
+
+    top, bottom = key
+    surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for y_pos in range(0, SCREEN_HEIGHT, 2):
+        ratio = y_pos / SCREEN_HEIGHT
+        r = int(top[0] + ratio * (bottom[0] - top[0]))
+        g = int(top[1] + ratio * (bottom[1] - top[1]))
+        b = int(top[2] + ratio * (bottom[2] - top[2]))
+        surf.fill((r, g, b), (0, y_pos, SCREEN_WIDTH, 2))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+
+    _sky_gradient_cache[key] = surf
+    if len(_sky_gradient_cache) > SKY_GRADIENT_CACHE_SIZE:
+        _sky_gradient_cache.popitem(last=False)
+    return surf
+
+
+def clear_sky_gradient_cache():
+    """Drop all cached sky gradients (e.g. after a display mode change)."""
+    _sky_gradient_cache.clear()
 
 
 class Platform:
@@ -19,19 +65,23 @@ class Platform:
         """Generate plank pattern variations."""
         plank_w = 40
         num_planks = max(1, self.rect.width // plank_w + 1)
-        random.seed(self.rect.x + self.rect.y)  # Consistent variation per platform
+        rng = random.Random(self.rect.x + self.rect.y)  # Consistent variation per platform
         for i in range(num_planks):
             self.plank_variations.append({
-                'hue': random.randint(-15, 15),
-                'grain_offset': random.randint(0, 10),
-                'knot_pos': random.randint(5, 25) if random.random() > 0.6 else -1
+                'hue': rng.randint(-15, 15),
+                'grain_offset': rng.randint(0, 10),
+                'knot_pos': rng.randint(5, 25) if rng.random() > 0.6 else -1
             })
-        random.seed()
 
     def draw(self, screen, camera_x):
         screen_x = self.rect.x - camera_x
         if screen_x + self.rect.width < -50 or screen_x > SCREEN_WIDTH + 50:
             return
+        self.draw_at(screen, screen_x)
+
+    def draw_at(self, screen, screen_x):
+        """Draw the platform with its left edge at screen_x on any target surface."""
+        target_w = screen.get_width()
 
         # Universal wooden platform style for polished look
         # Rich wood colors
@@ -54,7 +104,7 @@ class Platform:
             pw = min(plank_w, self.rect.width - i * plank_w)
             if pw <= 0:
                 break
-            if px + pw < 0 or px > SCREEN_WIDTH:
+            if px + pw < 0 or px > target_w:
                 continue
 
             var = self.plank_variations[i % len(self.plank_variations)]
@@ -120,7 +170,8 @@ class Platform:
             else:
                 sx = screen_x + i * support_spacing
 
-            if sx < -20 or sx > SCREEN_WIDTH + 20:
+            # Diagonal braces reach 50px right of their post
+            if sx < -60 or sx > screen.get_width() + 20:
                 continue
 
             # Support post (vertical beam going down)
@@ -165,7 +216,7 @@ class Hazard:
         self.hazard_type = hazard_type
         self.damage = 25 if hazard_type == 'spikes' else 15  # Lava does less but continuous
         self.rect = pygame.Rect(x, y, width, 30 if hazard_type == 'spikes' else 20)
-        self.anim_timer = random.random() * math.pi * 2
+        self.anim_timer = get_rng('level').random() * math.pi * 2
         self.damaged_players = {}  # Track damage cooldown per player
 
     def update(self, dt):
@@ -255,7 +306,7 @@ class Collectible:
         self.collect_type = collect_type
         self.collected = False
         self.rect = pygame.Rect(x, y, 24, 24)
-        self.bob_offset = random.random() * math.pi * 2
+        self.bob_offset = get_rng('level').random() * math.pi * 2
         self.sparkle_timer = 0
 
     def update(self, dt):
@@ -279,11 +330,9 @@ class Collectible:
 
             # Outer glow (pulsing)
             glow_pulse = abs(math.sin(pygame.time.get_ticks() * 0.004 + self.bob_offset)) * 0.4 + 0.6
-            glow_surf = pygame.Surface((40, 40), pygame.SRCALPHA)
             glow_alpha = int(60 * glow_pulse)
-            pygame.draw.circle(glow_surf, (255, 200, 50, glow_alpha), (20, 20), 18)
-            pygame.draw.circle(glow_surf, (255, 220, 100, glow_alpha // 2), (20, 20), 14)
-            screen.blit(glow_surf, (cx - 20, cy - 20))
+            get_surface_cache().draw_glow(screen, (cx, cy), 18, (255, 200, 50), glow_alpha,
+                                          ((14, (255, 220, 100), glow_alpha // 2),))
 
             # Coin body - gradient effect
             pygame.draw.circle(screen, (180, 140, 20), (cx, cy), 13)  # Dark edge
@@ -444,12 +493,10 @@ class Decoration:
             flicker2 = math.sin(t * 0.018 + 1) * 3
 
             # Large outer glow
-            glow_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
             glow_pulse = int(abs(math.sin(t * 0.008)) * 25)
-            pygame.draw.circle(glow_surf, (255, 150, 50, 35 + glow_pulse), (40, 40), 35)
-            pygame.draw.circle(glow_surf, (255, 180, 80, 25 + glow_pulse), (40, 40), 25)
-            pygame.draw.circle(glow_surf, (255, 200, 100, 20), (40, 40), 18)
-            screen.blit(glow_surf, (tx - 35, ty - 60))
+            get_surface_cache().draw_glow(screen, (tx + 5, ty - 20), 35, (255, 150, 50), 35 + glow_pulse,
+                                          ((25, (255, 180, 80), 25 + glow_pulse),
+                                           (18, (255, 200, 100), 20)))
 
             # Flame layers (outer to inner)
             # Red outer
@@ -499,7 +546,7 @@ class Decoration:
                 (screen_x + 10, self.y + 20), (screen_x - 25, self.y - 20), (screen_x - 15, self.y + 5)
             ])
             # Fog at base
-            fog_surf = pygame.Surface((60, 30), pygame.SRCALPHA)
+            fog_surf = get_surface_cache().scratch(60, 30)
             pygame.draw.ellipse(fog_surf, (100, 100, 120, 60), (0, 0, 60, 30))
             screen.blit(fog_surf, (screen_x - 10, self.y + 80))
 
@@ -539,9 +586,204 @@ class Decoration:
             pygame.draw.rect(screen, (100, 100, 110), (screen_x, self.y + 40, 50, 15), border_radius=3)
 
 
+class ParallaxLayer:
+    """A pre-rendered background strip blitted at a fixed scroll factor."""
+
+    def __init__(self, surface, scroll, x=0, y=0, tile=True):
+        self.surface = surface
+        self.scroll = scroll
+        self.x = x
+        self.y = y
+        self.tile = tile
+        self.width = surface.get_width()
+
+    def draw(self, screen, camera_x):
+        """Blit the layer, repeating it horizontally if it tiles."""
+        offset = int(camera_x * self.scroll)
+        if not self.tile:
+            draw_x = self.x - offset
+            if -self.width < draw_x < SCREEN_WIDTH:
+                screen.blit(self.surface, (draw_x, self.y))
+            return
+
+        draw_x = (self.x - offset) % self.width - self.width
+        while draw_x < SCREEN_WIDTH:
+            if draw_x > -self.width:
+                screen.blit(self.surface, (draw_x, self.y))
+            draw_x += self.width
+
+
+class StaticGeometryCache:
+    """Bakes platforms into fixed-width world chunks."""
+
+    CHUNK_WIDTH = 512
+    MAX_CHUNKS = 6
+    OVERHANG = 60  # Support braces reach this far past their platform's rect
+
+    def __init__(self, level):
+        self.level = level
+        self.chunks = OrderedDict()  # chunk index -> baked surface, least recent first
+
+    def clear(self):
+        """Drop all baked chunks."""
+        self.chunks.clear()
+
+    def _bake_chunk(self, index):
+        """Render every static element overlapping chunk index into a new surface."""
+        chunk_x = index * self.CHUNK_WIDTH
+        surf = pygame.Surface((self.CHUNK_WIDTH, SCREEN_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill((0, 0, 0))
+        surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+
+        left = chunk_x - self.OVERHANG
+        right = chunk_x + self.CHUNK_WIDTH + self.OVERHANG
+        for platform in self.level.platforms:
+            if platform.rect.right >= left and platform.rect.x <= right:
+                platform.draw_at(surf, platform.rect.x - chunk_x)
+        return surf
+
+    def draw(self, screen, camera_x):
+        """Blit the chunks overlapping the camera, baking any not yet cached."""
+        first = int(camera_x) // self.CHUNK_WIDTH
+        last = int(camera_x + SCREEN_WIDTH) // self.CHUNK_WIDTH
+        for index in range(first, last + 1):
+            surf = self.chunks.get(index)
+            if surf is None:
+                surf = self._bake_chunk(index)
+                self.chunks[index] = surf
+                if len(self.chunks) > self.MAX_CHUNKS:
+                    self.chunks.popitem(last=False)
+            else:
+                self.chunks.move_to_end(index)
+            screen.blit(surf, (int(index * self.CHUNK_WIDTH - camera_x), 0))
+
+
+class EntityIndex:
+    """Level entities sorted by world x for camera-window queries.
+
+    span(entity) gives the (left, right) world x range the entity can draw
+    into. view() keeps a cursor over the sorted starts, so scrolling only
+    steps past entities entering or leaving the window.
+    """
+
+    def __init__(self, entities, span):
+        spans = sorted(((span(e), e) for e in entities), key=lambda item: item[0][0])
+        self.entities = [e for _, e in spans]
+        self.starts = [s[0] for s, _ in spans]
+        self.ends = [s[1] for s, _ in spans]
+        self.max_width = max((s[1] - s[0] for s, _ in spans), default=0)
+
+        # Camera window cursor: entities[lo:hi] start inside the window
+        self.lo = 0
+        self.hi = 0
+        self.window = None
+        self.visible = []
+
+    def query(self, left, right):
+        """Entities whose span overlaps [left, right]."""
+        lo = bisect_left(self.starts, left - self.max_width)
+        hi = bisect_right(self.starts, right)
+        return [self.entities[i] for i in range(lo, hi) if self.ends[i] >= left]
+
+    def view(self, left, right):
+        """Like query(), but advances the cursor from the previous window."""
+        if self.window == (left, right):
+            return self.visible
+
+        starts = self.starts
+        count = len(starts)
+        first = left - self.max_width
+        lo, hi = self.lo, self.hi
+        while lo > 0 and starts[lo - 1] >= first:
+            lo -= 1
+        while lo < count and starts[lo] < first:
+            lo += 1
+        while hi < count and starts[hi] <= right:
+            hi += 1
+        while hi > 0 and starts[hi - 1] > right:
+            hi -= 1
+
+        self.lo, self.hi = lo, hi
+        self.window = (left, right)
+        self.visible = [self.entities[i] for i in range(lo, hi) if self.ends[i] >= left]
+        return self.visible
+
+
+class PlatformGrid:
+    """Uniform grid over the static platform rects (collision broadphase).
+
+    Each platform is listed in every cell its rect touches, edges included,
+    so the inclusive edge/wall probes used by the AI still find it.
+    """
+
+    CELL_SIZE = 128
+
+    def __init__(self, platforms):
+        self.platforms = list(platforms)
+        self.cells = {}  # (col, row) -> platform indices in level order
+        for i, platform in enumerate(self.platforms):
+            rect = platform.rect
+            for col in range(rect.left // self.CELL_SIZE, rect.right // self.CELL_SIZE + 1):
+                for row in range(rect.top // self.CELL_SIZE, rect.bottom // self.CELL_SIZE + 1):
+                    self.cells.setdefault((col, row), []).append(i)
+
+    def __iter__(self):
+        return iter(self.platforms)
+
+    def __len__(self):
+        return len(self.platforms)
+
+    def query_rect(self, rect):
+        """Platforms listed in the cells under rect, in level order.
+
+        This is a broadphase: callers still run their own exact test.
+        """
+        size = self.CELL_SIZE
+        col0, col1 = rect.left // size, rect.right // size
+        row0, row1 = rect.top // size, rect.bottom // size
+        if col0 == col1 and row0 == row1:
+            return [self.platforms[i] for i in self.cells.get((col0, row0), ())]
+
+        found = set()
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                found.update(self.cells.get((col, row), ()))
+        return [self.platforms[i] for i in sorted(found)]
+
+    def query_point(self, x, y):
+        """Platforms whose rect contains (x, y), edges included."""
+        size = self.CELL_SIZE
+        return [self.platforms[i] for i in self.cells.get((int(x) // size, int(y) // size), ())
+                if self.platforms[i].rect.left <= x <= self.platforms[i].rect.right
+                and self.platforms[i].rect.top <= y <= self.platforms[i].rect.bottom]
+
+    def ground_below(self, x, y, depth, slack=0):
+        """First platform whose top lies in [y, y + depth] under x (+/- slack)."""
+        probe = pygame.Rect(int(x - slack) - 1, int(y) - 1, int(slack * 2) + 3, int(depth) + 3)
+        for platform in self.query_rect(probe):
+            rect = platform.rect
+            if rect.left - slack <= x <= rect.right + slack and y <= rect.top <= y + depth:
+                return platform
+        return None
+
+
 class Level:
     """A scrolling Mario-style level with multiple areas."""
 
+    # Outdoor backdrop layers, baked once and shared by every level
+    PARALLAX_CACHE = {}
+    # Star layers: wrap period and left margin in screen px, and camera scroll factor
+    STAR_LAYERS = {
+        'large': (SCREEN_WIDTH + 400, 200, 0.02),
+        'medium': (SCREEN_WIDTH + 500, 250, 0.016),
+        'tiny': (SCREEN_WIDTH + 600, 300, 0.01),
+    }
+    MOON_PULSE_STEPS = 6
+    # Extra world x kept around the camera when picking entities to draw/update
+    VIEW_MARGIN = 64
+
     def __init__(self, level_num=1):
         self.level_num = level_num
         self.platforms = []
@@ -568,6 +810,15 @@ class Level:
         self.checkpoint_reached = set()  # Set of checkpoint indices reached
 
         self.create_level()
+        self.parallax = self._build_parallax_layers()
+        self.static_geometry = StaticGeometryCache(self)
+        self.platform_grid = PlatformGrid(self.platforms)
+        self.view_x = 0
+
+        # x-sorted indexes; spans match each entity's own off-screen test
+        self.decoration_index = EntityIndex(self.decorations, lambda d: (d.x - 150, d.x + 150))
+        self.hazard_index = EntityIndex(self.hazards, lambda h: (h.x - 50, h.x + h.width + 50))
+        self.collectible_index = EntityIndex(self.collectibles, lambda c: (c.x - 30, c.x + 30))
 
     def create_level(self):
         """Create the level based on level number."""
@@ -1140,26 +1391,19 @@ class Level:
             else:
                 return (20, 30, 60), (50, 60, 100)
 
-        # Get current and next area colors
-        sky_top, sky_bottom = get_area_colors(area_name)
-
-        # Blend colors if transitioning
-        if next_area_name and blend_factor < 1.0:
-            next_top, next_bottom = get_area_colors(next_area_name)
-            sky_top = tuple(int(sky_top[i] * blend_factor + next_top[i] * (1 - blend_factor)) for i in range(3))
-            sky_bottom = tuple(int(sky_bottom[i] * blend_factor + next_bottom[i] * (1 - blend_factor)) for i in range(3))
-
+        # Draw gradient background from cached surfaces - transitions cross-fade
+        # the two cached area endpoints instead of re-rendering blended colors
         if self.level_num != 1:
-            sky_top = (15, 15, 25)
-            sky_bottom = (35, 30, 50)
-
-        # Draw gradient background
-        for y_pos in range(0, SCREEN_HEIGHT, 2):
-            ratio = y_pos / SCREEN_HEIGHT
-            r = int(sky_top[0] + ratio * (sky_bottom[0] - sky_top[0]))
-            g = int(sky_top[1] + ratio * (sky_bottom[1] - sky_top[1]))
-            b = int(sky_top[2] + ratio * (sky_bottom[2] - sky_top[2]))
-            pygame.draw.rect(screen, (r, g, b), (0, y_pos, SCREEN_WIDTH, 2))
+            screen.blit(get_sky_gradient((15, 15, 25), (35, 30, 50)), (0, 0))
+        else:
+            screen.blit(get_sky_gradient(*get_area_colors(area_name)), (0, 0))
+            if next_area_name and blend_factor < 1.0:
+                next_alpha = int(255 * (1.0 - blend_factor))
+                if next_alpha > 0:
+                    next_sky = get_sky_gradient(*get_area_colors(next_area_name))
+                    next_sky.set_alpha(next_alpha)
+                    screen.blit(next_sky, (0, 0))
+                    next_sky.set_alpha(None)
 
         # SMOOTH TRANSITION between indoor/outdoor using alpha blending
         # Draw outdoor elements first (faded if transitioning to indoor)
@@ -1168,106 +1412,14 @@ class Level:
 
         # Create surfaces for blending
         if outdoor_alpha > 10:
-            # OUTDOOR - Beautiful starry night sky
-            # ============================================
-            # STARS - Many more with varying sizes and brightness
-            # ============================================
-            star_offset = int(camera_x * 0.02) % 300
-            random.seed(42)
-
-            # Large bright stars (fewer)
-            for i in range(15):
-                star_x = (i * 150 + random.randint(0, 120) - star_offset) % (SCREEN_WIDTH + 400) - 200
-                star_y = 20 + random.randint(0, 150)
-                twinkle = abs(math.sin(t * 0.003 + i * 0.7)) * 0.4 + 0.6
-                brightness = int(255 * twinkle)
-                # Star with glow
-                glow_color = (brightness // 3, brightness // 3, brightness // 2)
-                pygame.draw.circle(screen, glow_color, (int(star_x), star_y), 4)
-                pygame.draw.circle(screen, (brightness, brightness, brightness), (int(star_x), star_y), 2)
-                # Cross sparkle on brightest stars
-                if twinkle > 0.85:
-                    pygame.draw.line(screen, (brightness, brightness, brightness),
-                                   (int(star_x) - 4, star_y), (int(star_x) + 4, star_y), 1)
-                    pygame.draw.line(screen, (brightness, brightness, brightness),
-                                   (int(star_x), star_y - 4), (int(star_x), star_y + 4), 1)
-
-            # Medium stars
-            for i in range(40):
-                star_x = (i * 60 + random.randint(0, 50) - star_offset * 0.8) % (SCREEN_WIDTH + 500) - 250
-                star_y = 10 + random.randint(0, 200)
-                twinkle = abs(math.sin(t * 0.004 + i * 1.3)) * 0.3 + 0.5
-                brightness = int(220 * twinkle)
-                pygame.draw.circle(screen, (brightness, brightness, brightness), (int(star_x), star_y), 1)
-
-            # Tiny distant stars (many)
-            for i in range(80):
-                star_x = (i * 30 + random.randint(0, 25) - star_offset * 0.5) % (SCREEN_WIDTH + 600) - 300
-                star_y = 5 + random.randint(0, 220)
-                twinkle = abs(math.sin(t * 0.005 + i * 2.1)) * 0.4 + 0.3
-                brightness = int(180 * twinkle)
-                # Single pixel stars
-                if 0 <= star_x < SCREEN_WIDTH and star_y < 250:
-                    screen.set_at((int(star_x), star_y), (brightness, brightness, brightness))
-            random.seed()
-
-            # ============================================
-            # MOON - Large and atmospheric with strong glow
-            # ============================================
-            moon_x = 680 - int(camera_x * 0.015)
-            moon_y = 100
-            moon_radius = 70  # Bigger moon!
-
-            if -150 < moon_x < SCREEN_WIDTH + 150:
-                # Outer atmospheric glow (large, soft)
-                glow_surf = pygame.Surface((400, 400), pygame.SRCALPHA)
-                glow_pulse = int(abs(math.sin(t * 0.0008)) * 15)
-
-                # Multiple glow layers for atmosphere
-                for i in range(8):
-                    glow_r = 180 - i * 18
-                    alpha = 12 + glow_pulse // 3 - i * 1
-                    if alpha > 0:
-                        pygame.draw.circle(glow_surf, (180, 200, 230, alpha), (200, 200), glow_r)
-
-                # Warm inner glow
-                for i in range(4):
-                    inner_r = 100 - i * 15
-                    alpha = 25 - i * 5
-                    pygame.draw.circle(glow_surf, (220, 220, 200, alpha), (200, 200), inner_r)
-
-                screen.blit(glow_surf, (moon_x - 200, moon_y - 200 + 50))
-
-                # Moon body - gradient effect
-                pygame.draw.circle(screen, (245, 245, 235), (moon_x, moon_y + 50), moon_radius)
-                pygame.draw.circle(screen, (235, 235, 225), (moon_x - 10, moon_y + 45), moon_radius - 5)
-                pygame.draw.circle(screen, (250, 250, 245), (moon_x - 20, moon_y + 35), moon_radius - 15)
-
-                # Craters with depth
-                crater_color = (215, 215, 200)
-                crater_shadow = (200, 200, 185)
-                pygame.draw.circle(screen, crater_color, (moon_x + 25, moon_y + 70), 12)
-                pygame.draw.circle(screen, crater_shadow, (moon_x + 27, moon_y + 72), 9)
-                pygame.draw.circle(screen, crater_color, (moon_x - 15, moon_y + 35), 10)
-                pygame.draw.circle(screen, crater_shadow, (moon_x - 13, moon_y + 37), 7)
-                pygame.draw.circle(screen, crater_color, (moon_x + 10, moon_y + 20), 6)
-                pygame.draw.circle(screen, crater_color, (moon_x + 35, moon_y + 45), 5)
-                pygame.draw.circle(screen, crater_color, (moon_x - 25, moon_y + 65), 8)
-
-            # Distant Hogwarts castle silhouette
-            castle_offset = int(camera_x * 0.08)
-            self._draw_distant_castle(screen, castle_offset, t)
-
-            # ============================================
-            # MOUNTAINS - Detailed with snow caps and layers
-            # ============================================
-            self._draw_detailed_mountains(screen, camera_x, t)
+            # OUTDOOR - Baked starry sky, moon, castle and mountains
+            self._draw_outdoor_backdrop(screen, camera_x, t)
 
         # INDOOR elements with smooth blending
         if indoor_alpha > 10:
             # Create semi-transparent surface for indoor elements
             if indoor_factor < 1.0:
-                indoor_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                indoor_surf = get_surface_cache().scratch(SCREEN_WIDTH, SCREEN_HEIGHT)
                 self._draw_stone_walls(indoor_surf, camera_x, t)
                 self._draw_torches(indoor_surf, camera_x, t)
 
@@ -1342,16 +1494,16 @@ class Level:
 
         # Moss/vine patches on walls
         moss_offset = int(camera_x * 0.4) % 200
-        random.seed(123)
+        rng = random.Random(123)
         for i in range(8):
             moss_x = (i * 180 - moss_offset) % (SCREEN_WIDTH + 200) - 100
-            moss_y = 50 + random.randint(0, 150)
-            moss_color = (30 + random.randint(0, 20), 60 + random.randint(0, 30), 25)
+            moss_y = 50 + rng.randint(0, 150)
+            moss_color = (30 + rng.randint(0, 20), 60 + rng.randint(0, 30), 25)
 
             # Hanging vines
-            for v in range(random.randint(2, 5)):
+            for v in range(rng.randint(2, 5)):
                 vine_x = moss_x + v * 8
-                vine_len = 30 + random.randint(0, 40)
+                vine_len = 30 + rng.randint(0, 40)
                 wave = int(math.sin(t * 0.002 + v) * 3)
                 pygame.draw.line(screen, moss_color, (vine_x, moss_y),
                                (vine_x + wave, moss_y + vine_len), 2)
@@ -1360,7 +1512,6 @@ class Level:
                     ly = moss_y + leaf * 15 + 10
                     lx = vine_x + int(math.sin(t * 0.002 + leaf) * 2)
                     pygame.draw.ellipse(screen, moss_color, (lx - 3, ly, 6, 4))
-        random.seed()
 
     def _draw_torches(self, screen, camera_x, t):
         """Draw wall-mounted torches with animated flames."""
@@ -1393,11 +1544,9 @@ class Level:
             ]
 
             # Flame glow
-            glow_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
             glow_pulse = int(abs(math.sin(t * 0.01 + i)) * 30)
-            pygame.draw.circle(glow_surf, (255, 150, 50, 40 + glow_pulse), (30, 30), 28)
-            pygame.draw.circle(glow_surf, (255, 200, 100, 30 + glow_pulse), (30, 30), 20)
-            screen.blit(glow_surf, (tx - 30, ty - 50))
+            get_surface_cache().draw_glow(screen, (tx, ty - 20), 28, (255, 150, 50), 40 + glow_pulse,
+                                          ((20, (255, 200, 100), 30 + glow_pulse),))
 
             # Flame layers
             for j, color in enumerate(flame_colors):
@@ -1415,150 +1564,33 @@ class Level:
                 spark_y = ty - 35 - random.randint(0, 15)
                 pygame.draw.circle(screen, (255, 220, 100), (spark_x, spark_y), 2)
 
-    def _draw_detailed_mountains(self, screen, camera_x, t):
-        """Draw beautiful layered mountains with snow caps."""
-        # Back layer - distant dark mountains
-        hill_offset = int(camera_x * 0.08)
-        back_color = (35, 40, 55)
-        back_highlight = (45, 52, 70)
-
-        for i in range(8):
-            mx = i * 280 - (hill_offset % 280) - 140
-            # Varied peak heights
-            peak_heights = [180, 220, 160, 240, 190, 210, 170, 230]
-            peak_h = peak_heights[i % len(peak_heights)]
-
-            # Mountain silhouette
-            points = [
-                (mx, SCREEN_HEIGHT),
-                (mx + 50, SCREEN_HEIGHT - peak_h * 0.6),
-                (mx + 100, SCREEN_HEIGHT - peak_h * 0.85),
-                (mx + 140, SCREEN_HEIGHT - peak_h),  # Peak
-                (mx + 180, SCREEN_HEIGHT - peak_h * 0.8),
-                (mx + 230, SCREEN_HEIGHT - peak_h * 0.5),
-                (mx + 280, SCREEN_HEIGHT)
-            ]
-            pygame.draw.polygon(screen, back_color, points)
-
-            # Subtle highlight on one side
-            highlight_points = [
-                (mx + 100, SCREEN_HEIGHT - peak_h * 0.85),
-                (mx + 140, SCREEN_HEIGHT - peak_h),
-                (mx + 145, SCREEN_HEIGHT - peak_h * 0.9),
-                (mx + 105, SCREEN_HEIGHT - peak_h * 0.75)
-            ]
-            pygame.draw.polygon(screen, back_highlight, highlight_points)
-
-        # Mid layer - main mountains with snow caps
-        mid_offset = int(camera_x * 0.12)
-        mid_color = (55, 60, 80)
-        mid_shadow = (40, 45, 60)
-        snow_color = (220, 225, 235)
-        snow_shadow = (180, 185, 200)
-
-        for i in range(6):
-            mx = i * 350 - (mid_offset % 350) - 175
-            # Taller peaks
-            peak_heights = [260, 300, 240, 320, 280, 290]
-            peak_h = peak_heights[i % len(peak_heights)]
-
-            # Main mountain body
-            left_base = mx - 20
-            right_base = mx + 370
-            peak_x = mx + 175
-
-            # Left slope
-            pygame.draw.polygon(screen, mid_color, [
-                (left_base, SCREEN_HEIGHT),
-                (peak_x, SCREEN_HEIGHT - peak_h),
-                (peak_x, SCREEN_HEIGHT)
-            ])
-            # Right slope (slightly darker)
-            pygame.draw.polygon(screen, mid_shadow, [
-                (peak_x, SCREEN_HEIGHT - peak_h),
-                (right_base, SCREEN_HEIGHT),
-                (peak_x, SCREEN_HEIGHT)
-            ])
-
-            # Ridge details
-            ridge_x = mx + 80
-            ridge_h = peak_h * 0.7
-            pygame.draw.polygon(screen, mid_shadow, [
-                (ridge_x, SCREEN_HEIGHT - ridge_h),
-                (ridge_x + 50, SCREEN_HEIGHT - ridge_h * 0.85),
-                (ridge_x + 30, SCREEN_HEIGHT)
-            ])
-
-            # SNOW CAP
-            snow_start_y = SCREEN_HEIGHT - peak_h
-            snow_end_y = SCREEN_HEIGHT - peak_h * 0.65
-
-            # Snow on peak
-            pygame.draw.polygon(screen, snow_color, [
-                (peak_x - 30, snow_end_y),
-                (peak_x, snow_start_y),
-                (peak_x + 25, snow_end_y + 10),
-            ])
-            # Snow shadow side
-            pygame.draw.polygon(screen, snow_shadow, [
-                (peak_x, snow_start_y),
-                (peak_x + 25, snow_end_y + 10),
-                (peak_x + 5, snow_end_y + 30)
-            ])
-
-            # Snow drip details
-            for s in range(3):
-                drip_x = peak_x - 20 + s * 18
-                drip_y = snow_end_y + s * 8 + 5
-                pygame.draw.polygon(screen, snow_color, [
-                    (drip_x, drip_y),
-                    (drip_x + 6, drip_y + 15),
-                    (drip_x - 6, drip_y + 15)
-                ])
-
-        # Front layer - closer hills/foothills
-        front_offset = int(camera_x * 0.2)
-        front_color = (45, 50, 65)
-
-        for i in range(10):
-            hx = i * 200 - (front_offset % 200) - 100
-            hill_h = 80 + (i % 4) * 25
-
-            pygame.draw.polygon(screen, front_color, [
-                (hx, SCREEN_HEIGHT),
-                (hx + 50, SCREEN_HEIGHT - hill_h * 0.7),
-                (hx + 100, SCREEN_HEIGHT - hill_h),
-                (hx + 150, SCREEN_HEIGHT - hill_h * 0.6),
-                (hx + 200, SCREEN_HEIGHT)
-            ])
-
     def _draw_floating_candles(self, screen, camera_x, t, alpha=255):
         """Draw floating magical candles like in the Great Hall."""
         candle_offset = int(camera_x * 0.6) % 150
-        random.seed(456)
+        rng = random.Random(456)
 
         # Create surface if alpha needed
         if alpha < 255:
-            candle_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            candle_surf = get_surface_cache().scratch(SCREEN_WIDTH, SCREEN_HEIGHT)
             target = candle_surf
         else:
             target = screen
 
         for i in range(12):
             cx = (i * 120 - candle_offset) % (SCREEN_WIDTH + 200) - 100
-            cy = 60 + random.randint(0, 100) + int(math.sin(t * 0.002 + i) * 8)
+            cy = 60 + rng.randint(0, 100) + int(math.sin(t * 0.002 + i) * 8)
 
             if cx < -30 or cx > SCREEN_WIDTH + 30:
                 continue
 
             # Candle body (cream colored)
-            candle_h = 25 + random.randint(0, 15)
+            candle_h = 25 + rng.randint(0, 15)
             pygame.draw.rect(target, (250, 245, 230), (cx - 4, cy, 8, candle_h))
             pygame.draw.rect(target, (230, 220, 200), (cx - 4, cy, 3, candle_h))
             pygame.draw.rect(target, (255, 250, 240), (cx + 1, cy, 2, candle_h))
 
             # Dripping wax
-            for d in range(random.randint(1, 3)):
+            for d in range(rng.randint(1, 3)):
                 drip_x = cx - 3 + d * 3
                 drip_y = cy + candle_h - 5
                 pygame.draw.ellipse(target, (250, 245, 230), (drip_x, drip_y, 4, 8))
@@ -1568,33 +1600,105 @@ class Level:
             flame_flicker = int(math.sin(t * 0.018 + i * 1.5) * 3)
 
             # Glow
-            glow_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
             glow_alpha = 50 + int(abs(math.sin(t * 0.012 + i)) * 30)
-            pygame.draw.circle(glow_surf, (255, 200, 100, glow_alpha), (15, 15), 14)
-            target.blit(glow_surf, (cx - 15, flame_y - 8))
+            get_surface_cache().draw_glow(target, (cx, flame_y + 7), 14, (255, 200, 100), glow_alpha)
 
             # Flame
             pygame.draw.ellipse(target, (255, 220, 100), (cx - 4 + flame_flicker, flame_y, 8, 14))
             pygame.draw.ellipse(target, (255, 250, 200), (cx - 2 + flame_flicker, flame_y + 4, 4, 8))
 
-        random.seed()
-
         # Blit with alpha if using separate surface
         if alpha < 255:
             candle_surf.set_alpha(alpha)
             screen.blit(candle_surf, (0, 0))
 
-    def _draw_distant_castle(self, screen, offset, t):
-        """Draw distant Hogwarts castle silhouette."""
-        castle_x = 500 - offset
-        if castle_x < -300 or castle_x > SCREEN_WIDTH + 200:
-            return
+    def _make_backdrop_surface(self, width, height):
+        """Create a black color-keyed surface for an opaque-shape backdrop layer."""
+        surf = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill((0, 0, 0))
+        surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surf
+
+    def _build_parallax_layers(self):
+        """Bake the outdoor backdrop (stars, moon, castle, mountains) into reusable layers."""
+        if Level.PARALLAX_CACHE:
+            return Level.PARALLAX_CACHE
+
+        cache = Level.PARALLAX_CACHE
+        cache.update(self._bake_star_layers())
+        cache['moon_frames'] = self._bake_moon_frames()
+        cache.update(self._bake_castle_layer())
+        cache['mountains'] = self._bake_mountain_layers()
+        return cache
+
+    def _bake_star_layers(self):
+        """Lay out the star field once; the stars are drawn per frame so they keep twinkling."""
+        rng = random.Random(42)
+        periods = {name: layer[0] for name, layer in Level.STAR_LAYERS.items()}
+
+        # (x within the layer's wrap period, y, twinkle phase)
+        large_stars = [((i * 150 + rng.randint(0, 120)) % periods['large'], 20 + rng.randint(0, 150), i * 0.7)
+                       for i in range(15)]
+        medium_stars = [((i * 60 + rng.randint(0, 50)) % periods['medium'], 10 + rng.randint(0, 200), i * 1.3)
+                        for i in range(40)]
+        tiny_stars = [((i * 30 + rng.randint(0, 25)) % periods['tiny'], 5 + rng.randint(0, 220), i * 2.1)
+                      for i in range(80)]
+        return {'stars': {'large': large_stars, 'medium': medium_stars, 'tiny': tiny_stars}}
+
+    def _bake_moon_frames(self):
+        """Bake the moon with its atmospheric glow at each pulse strength."""
+        frames = []
+        for pulse_step in range(Level.MOON_PULSE_STEPS):
+            moon_surf = pygame.Surface((400, 400), pygame.SRCALPHA)
+
+            # Multiple glow layers for atmosphere
+            for i in range(8):
+                glow_r = 180 - i * 18
+                alpha = 12 + pulse_step - i * 1
+                if alpha > 0:
+                    pygame.draw.circle(moon_surf, (180, 200, 230, alpha), (200, 200), glow_r)
+
+            # Warm inner glow
+            for i in range(4):
+                inner_r = 100 - i * 15
+                alpha = 25 - i * 5
+                pygame.draw.circle(moon_surf, (220, 220, 200, alpha), (200, 200), inner_r)
+
+            # Moon body - gradient effect
+            moon_radius = 70
+            pygame.draw.circle(moon_surf, (245, 245, 235), (200, 200), moon_radius)
+            pygame.draw.circle(moon_surf, (235, 235, 225), (190, 195), moon_radius - 5)
+            pygame.draw.circle(moon_surf, (250, 250, 245), (180, 185), moon_radius - 15)
+
+            # Craters with depth
+            crater_color = (215, 215, 200)
+            crater_shadow = (200, 200, 185)
+            pygame.draw.circle(moon_surf, crater_color, (225, 220), 12)
+            pygame.draw.circle(moon_surf, crater_shadow, (227, 222), 9)
+            pygame.draw.circle(moon_surf, crater_color, (185, 185), 10)
+            pygame.draw.circle(moon_surf, crater_shadow, (187, 187), 7)
+            pygame.draw.circle(moon_surf, crater_color, (210, 170), 6)
+            pygame.draw.circle(moon_surf, crater_color, (235, 195), 5)
+            pygame.draw.circle(moon_surf, crater_color, (175, 215), 8)
+
+            if pygame.display.get_surface() is not None:
+                moon_surf = moon_surf.convert_alpha()
+            frames.append(moon_surf)
+        return frames
+
+    def _bake_castle_layer(self):
+        """Bake the distant Hogwarts silhouette; window glow stays a per-frame overlay."""
+        castle_surf = self._make_backdrop_surface(250, 320)
+        castle_x = 25  # Castle origin inside the surface (left roof overhang is 25px)
+        top = 20  # Main tower spire reaches 20px above the screen top
 
         castle_color = (35, 40, 55)
         castle_light = (45, 50, 65)
 
         # Main castle body
-        pygame.draw.rect(screen, castle_color, (castle_x, 180, 200, 120))
+        pygame.draw.rect(castle_surf, castle_color, (castle_x, 180 + top, 200, 120))
 
         # Towers with pointed roofs
         tower_positions = [
@@ -1604,23 +1708,227 @@ class Level:
             (castle_x + 180, 110, 38, 190),
         ]
 
+        windows = []
         for tx, ty, tw, th in tower_positions:
-            pygame.draw.rect(screen, castle_color, (tx, ty, tw, th))
+            pygame.draw.rect(castle_surf, castle_color, (tx, ty + top, tw, th))
             # Pointed roof
-            pygame.draw.polygon(screen, castle_light, [
-                (tx - 5, ty), (tx + tw // 2, ty - 40), (tx + tw + 5, ty)
+            pygame.draw.polygon(castle_surf, castle_light, [
+                (tx - 5, ty + top), (tx + tw // 2, ty + top - 40), (tx + tw + 5, ty + top)
             ])
-            # Windows (glowing)
+            # Window slots (glow is animated in _draw_outdoor_backdrop)
             for wy in range(ty + 20, ty + th - 30, 35):
-                glow = int(abs(math.sin(t * 0.001 + tx * 0.1 + wy * 0.05)) * 50)
-                pygame.draw.rect(screen, (180 + glow, 150 + glow, 80), (tx + tw // 2 - 4, wy, 8, 12))
+                window_x = tx - castle_x + tw // 2 - 4
+                windows.append((window_x, wy, (500 + tx - castle_x) * 0.1 + wy * 0.05))
 
         # Main tower (tallest, center)
-        pygame.draw.rect(screen, castle_color, (castle_x + 80, 40, 50, 260))
-        pygame.draw.polygon(screen, castle_light, [
-            (castle_x + 75, 40), (castle_x + 105, -20), (castle_x + 135, 40)
+        pygame.draw.rect(castle_surf, castle_color, (castle_x + 80, 40 + top, 50, 260))
+        pygame.draw.polygon(castle_surf, castle_light, [
+            (castle_x + 75, 40 + top), (castle_x + 105, top - 20), (castle_x + 135, 40 + top)
         ])
 
+        return {
+            'castle': ParallaxLayer(castle_surf, 0.08, x=500 - castle_x, y=-top, tile=False),
+            'castle_windows': windows,
+        }
+
+    def _bake_mountain_layers(self):
+        """Bake the three mountain ranges into seamlessly tiling strips."""
+        # Back layer - distant dark mountains
+        back_peaks = [180, 220, 160, 240, 190, 210, 170, 230]
+        back_w, back_h = 280 * len(back_peaks), 241
+        back_surf = self._make_backdrop_surface(back_w, back_h)
+        back_color = (35, 40, 55)
+        back_highlight = (45, 52, 70)
+
+        for wrap in (-back_w, 0, back_w):
+            for i, peak_h in enumerate(back_peaks):
+                mx = i * 280 + wrap
+
+                # Mountain silhouette
+                points = [
+                    (mx, back_h),
+                    (mx + 50, back_h - peak_h * 0.6),
+                    (mx + 100, back_h - peak_h * 0.85),
+                    (mx + 140, back_h - peak_h),  # Peak
+                    (mx + 180, back_h - peak_h * 0.8),
+                    (mx + 230, back_h - peak_h * 0.5),
+                    (mx + 280, back_h)
+                ]
+                pygame.draw.polygon(back_surf, back_color, points)
+
+                # Subtle highlight on one side
+                highlight_points = [
+                    (mx + 100, back_h - peak_h * 0.85),
+                    (mx + 140, back_h - peak_h),
+                    (mx + 145, back_h - peak_h * 0.9),
+                    (mx + 105, back_h - peak_h * 0.75)
+                ]
+                pygame.draw.polygon(back_surf, back_highlight, highlight_points)
+
+        # Mid layer - main mountains with snow caps
+        mid_peaks = [260, 300, 240, 320, 280, 290]
+        mid_w, mid_h = 350 * len(mid_peaks), 321
+        mid_surf = self._make_backdrop_surface(mid_w, mid_h)
+        mid_color = (55, 60, 80)
+        mid_shadow = (40, 45, 60)
+        snow_color = (220, 225, 235)
+        snow_shadow = (180, 185, 200)
+
+        for wrap in (-mid_w, 0, mid_w):
+            for i, peak_h in enumerate(mid_peaks):
+                mx = i * 350 + wrap
+
+                # Main mountain body
+                left_base = mx - 20
+                right_base = mx + 370
+                peak_x = mx + 175
+
+                # Left slope
+                pygame.draw.polygon(mid_surf, mid_color, [
+                    (left_base, mid_h),
+                    (peak_x, mid_h - peak_h),
+                    (peak_x, mid_h)
+                ])
+                # Right slope (slightly darker)
+                pygame.draw.polygon(mid_surf, mid_shadow, [
+                    (peak_x, mid_h - peak_h),
+                    (right_base, mid_h),
+                    (peak_x, mid_h)
+                ])
+
+                # Ridge details
+                ridge_x = mx + 80
+                ridge_h = peak_h * 0.7
+                pygame.draw.polygon(mid_surf, mid_shadow, [
+                    (ridge_x, mid_h - ridge_h),
+                    (ridge_x + 50, mid_h - ridge_h * 0.85),
+                    (ridge_x + 30, mid_h)
+                ])
+
+                # SNOW CAP
+                snow_start_y = mid_h - peak_h
+                snow_end_y = mid_h - peak_h * 0.65
+
+                # Snow on peak
+                pygame.draw.polygon(mid_surf, snow_color, [
+                    (peak_x - 30, snow_end_y),
+                    (peak_x, snow_start_y),
+                    (peak_x + 25, snow_end_y + 10),
+                ])
+                # Snow shadow side
+                pygame.draw.polygon(mid_surf, snow_shadow, [
+                    (peak_x, snow_start_y),
+                    (peak_x + 25, snow_end_y + 10),
+                    (peak_x + 5, snow_end_y + 30)
+                ])
+
+                # Snow drip details
+                for s in range(3):
+                    drip_x = peak_x - 20 + s * 18
+                    drip_y = snow_end_y + s * 8 + 5
+                    pygame.draw.polygon(mid_surf, snow_color, [
+                        (drip_x, drip_y),
+                        (drip_x + 6, drip_y + 15),
+                        (drip_x - 6, drip_y + 15)
+                    ])
+
+        # Front layer - closer hills/foothills
+        front_w, front_h = 200 * 4, 156
+        front_surf = self._make_backdrop_surface(front_w, front_h)
+        front_color = (45, 50, 65)
+
+        for wrap in (-front_w, 0, front_w):
+            for i in range(4):
+                hx = i * 200 + wrap
+                hill_h = 80 + i * 25
+
+                pygame.draw.polygon(front_surf, front_color, [
+                    (hx, front_h),
+                    (hx + 50, front_h - hill_h * 0.7),
+                    (hx + 100, front_h - hill_h),
+                    (hx + 150, front_h - hill_h * 0.6),
+                    (hx + 200, front_h)
+                ])
+
+        return [
+            ParallaxLayer(back_surf, 0.08, x=-140, y=SCREEN_HEIGHT - back_h),
+            ParallaxLayer(mid_surf, 0.12, x=-175, y=SCREEN_HEIGHT - mid_h),
+            ParallaxLayer(front_surf, 0.2, x=-100, y=SCREEN_HEIGHT - front_h),
+        ]
+
+    def _draw_outdoor_backdrop(self, screen, camera_x, t):
+        """Draw the baked outdoor layers plus their small animated overlays."""
+        parallax = self.parallax
+
+        # ============================================
+        # STARS - fixed layout, twinkle drawn per frame
+        # ============================================
+        stars = parallax['stars']
+
+        # Large bright stars (fewer)
+        period, margin, scroll = Level.STAR_LAYERS['large']
+        offset = camera_x * scroll
+        for star_x, star_y, phase in stars['large']:
+            sx = int((star_x - offset) % period - margin)
+            if sx < -5 or sx > SCREEN_WIDTH + 5:
+                continue
+            twinkle = abs(math.sin(t * 0.003 + phase)) * 0.4 + 0.6
+            brightness = int(255 * twinkle)
+            # Star with glow
+            glow_color = (brightness // 3, brightness // 3, brightness // 2)
+            pygame.draw.circle(screen, glow_color, (sx, star_y), 4)
+            pygame.draw.circle(screen, (brightness, brightness, brightness), (sx, star_y), 2)
+            # Cross sparkle on brightest stars
+            if twinkle > 0.85:
+                pygame.draw.line(screen, (brightness, brightness, brightness),
+                               (sx - 4, star_y), (sx + 4, star_y), 1)
+                pygame.draw.line(screen, (brightness, brightness, brightness),
+                               (sx, star_y - 4), (sx, star_y + 4), 1)
+
+        # Medium stars
+        period, margin, scroll = Level.STAR_LAYERS['medium']
+        offset = camera_x * scroll
+        for star_x, star_y, phase in stars['medium']:
+            sx = int((star_x - offset) % period - margin)
+            if -2 <= sx <= SCREEN_WIDTH + 2:
+                brightness = int(220 * (abs(math.sin(t * 0.004 + phase)) * 0.3 + 0.5))
+                pygame.draw.circle(screen, (brightness, brightness, brightness), (sx, star_y), 1)
+
+        # Tiny distant stars (many) - single pixels
+        period, margin, scroll = Level.STAR_LAYERS['tiny']
+        offset = camera_x * scroll
+        for star_x, star_y, phase in stars['tiny']:
+            sx = int((star_x - offset) % period - margin)
+            if 0 <= sx < SCREEN_WIDTH:
+                brightness = int(180 * (abs(math.sin(t * 0.005 + phase)) * 0.4 + 0.3))
+                screen.set_at((sx, star_y), (brightness, brightness, brightness))
+
+        # ============================================
+        # MOON - pre-rendered at each glow pulse strength
+        # ============================================
+        moon_x = 680 - int(camera_x * 0.015)
+        moon_y = 100
+        if -150 < moon_x < SCREEN_WIDTH + 150:
+            glow_pulse = int(abs(math.sin(t * 0.0008)) * 15)
+            moon_frames = parallax['moon_frames']
+            moon_surf = moon_frames[min(len(moon_frames) - 1, glow_pulse // 3)]
+            screen.blit(moon_surf, (moon_x - 200, moon_y - 150))
+
+        # Distant Hogwarts castle silhouette with glowing windows
+        castle = parallax['castle']
+        castle.draw(screen, camera_x)
+        castle_x = 500 - int(camera_x * castle.scroll)
+        if -300 <= castle_x <= SCREEN_WIDTH + 200:
+            for window_x, window_y, phase in parallax['castle_windows']:
+                glow = int(abs(math.sin(t * 0.001 + phase)) * 50)
+                pygame.draw.rect(screen, (180 + glow, 150 + glow, 80), (castle_x + window_x, window_y, 8, 12))
+
+        # ============================================
+        # MOUNTAINS - back, mid and front ranges
+        # ============================================
+        for layer in parallax['mountains']:
+            layer.draw(screen, camera_x)
+
     def _draw_chess_room_decor(self, screen, camera_x, t):
         """Draw chess room specific decorations."""
         # Checkered floor pattern hint in background
@@ -1656,29 +1964,52 @@ class Level:
 
     def draw(self, screen, camera_x):
         """Draw the level."""
+        profiler = get_profiler()
         self.draw_background(screen, camera_x)
+        profiler.mark('background')
+        left, right = self.get_view_window(camera_x)
 
         # Decorations behind platforms
-        for dec in self.decorations:
+        for dec in self.decoration_index.view(left, right):
             dec.draw(screen, camera_x)
+        profiler.mark('decorations')
 
-        # Platforms
-        for platform in self.platforms:
-            platform.draw(screen, camera_x)
+        # Platforms (baked into world chunks)
+        self.static_geometry.draw(screen, camera_x)
+        profiler.mark('platforms')
         
         # Hazards (spikes, lava)
-        for hazard in self.hazards:
+        for hazard in self.hazard_index.view(left, right):
             hazard.draw(screen, camera_x)
 
         # Collectibles
-        for collectible in self.collectibles:
+        for collectible in self.collectible_index.view(left, right):
             collectible.draw(screen, camera_x)
-
-    def update(self, dt):
-        """Update level elements."""
-        for collectible in self.collectibles:
-            collectible.update(dt)
-        for hazard in self.hazards:
+        profiler.mark('level_items')
+
+    def get_view_window(self, camera_x):
+        """World x range covered by the camera plus VIEW_MARGIN.
+
+        camera_x is truncated to whole pixels, so the draw pass (interpolated,
+        float camera) and update() ask EntityIndex.view() for the same window
+        and share its cached result.
+        """
+        camera_x = int(camera_x)
+        return (camera_x - self.VIEW_MARGIN, camera_x + SCREEN_WIDTH + self.VIEW_MARGIN)
+
+    def get_active_hazards(self):
+        """Hazards near the current view (see update())."""
+        return self.hazard_index.view(*self.get_view_window(self.view_x))
+
+    def update(self, dt, camera_x=None):
+        """Update level elements near the camera."""
+        if camera_x is not None:
+            self.view_x = int(camera_x)
+        left, right = self.get_view_window(self.view_x)
+        for collectible in self.collectible_index.view(left, right):
+            if not collectible.collected:
+                collectible.update(dt)
+        for hazard in self.hazard_index.view(left, right):
             hazard.update(dt)
 
     def check_collectibles(self, players):
@@ -1687,8 +2018,9 @@ class Level:
         for player in players:
             if not player.is_alive():
                 continue
-            for collectible in self.collectibles:
-                if not collectible.collected and player.rect.colliderect(collectible.rect):
+            rect = player.rect
+            for collectible in self.collectible_index.query(rect.left, rect.right):
+                if not collectible.collected and rect.colliderect(collectible.rect):
                     collectible.collected = True
                     collected.append((player, collectible.collect_type))
         return collected
@@ -1780,31 +2112,32 @@ class Level:
         return None
 
     def draw_checkpoints(self, screen, camera_x):
-        """Draw checkpoint flags."""
+        """Draw checkpoint flags over the level and its items."""
         for i, (cp_x, cp_y, name) in enumerate(self.checkpoints):
             screen_x = int(cp_x - camera_x)
             if screen_x < -50 or screen_x > SCREEN_WIDTH + 50:
                 continue
 
             is_reached = i in self.checkpoint_reached
-
-            # Flag pole
-            pygame.draw.rect(screen, (150, 150, 160) if is_reached else (100, 100, 110),
-                           (screen_x, cp_y - 80, 6, 90))
-
-            # Flag
-            flag_color = (50, 200, 50) if is_reached else (150, 50, 50)
-            pygame.draw.polygon(screen, flag_color, [
-                (screen_x + 6, cp_y - 80),
-                (screen_x + 50, cp_y - 60),
-                (screen_x + 6, cp_y - 40)
-            ])
+            self._draw_checkpoint_flag(screen, screen_x, cp_y, is_reached)
 
             # Glow effect for reached checkpoints
             if is_reached:
-                glow_surf = pygame.Surface((40, 40), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (50, 255, 50, 80), (20, 20), 20)
-                screen.blit(glow_surf, (screen_x - 15, cp_y - 70))
+                get_surface_cache().draw_glow(screen, (screen_x + 5, cp_y - 50), 20, (50, 255, 50), 80)
+
+    def _draw_checkpoint_flag(self, screen, screen_x, cp_y, is_reached):
+        """Draw a checkpoint pole and flag."""
+        # Flag pole
+        pygame.draw.rect(screen, (150, 150, 160) if is_reached else (100, 100, 110),
+                       (screen_x, cp_y - 80, 6, 90))
+
+        # Flag
+        flag_color = (50, 200, 50) if is_reached else (150, 50, 50)
+        pygame.draw.polygon(screen, flag_color, [
+            (screen_x + 6, cp_y - 80),
+            (screen_x + 50, cp_y - 60),
+            (screen_x + 6, cp_y - 40)
+        ])
 
 
 class Camera:
@@ -1830,7 +2163,7 @@ class Camera:
         """Get current shake offset for rendering."""
         return (int(self.shake_offset_x), int(self.shake_offset_y))
 
-    def update(self, players):
+    def update(self, players, dt=SIM_STEP_MS):
         """Update camera to keep all players visible."""
         if not players:
             return
@@ -1858,7 +2191,7 @@ class Camera:
 
         # Update screen shake using sine wave for smoother feel
         if self.shake_timer > 0:
-            self.shake_timer -= 16  # Approximate dt
+            self.shake_timer -= dt
             progress = self.shake_timer / self.shake_duration if self.shake_duration > 0 else 0
             magnitude = self.shake_magnitude * progress
             # Use sine waves at different frequencies for organic shake
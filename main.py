@@ -8,6 +8,8 @@ if sys.platform == "darwin":
     os.environ.setdefault("SDL_VIDEODRIVER", "cocoa")
     os.environ.setdefault("SDL_AUDIODRIVER", "coreaudio")
 
+import argparse
+import time
 import pygame
 import math
 from settings import *
@@ -18,6 +20,16 @@ from enemies import EnemyManager
 from level import Level, Camera
 from ui import UI
 from audio import get_audio
+from text_cache import get_text_cache
+from surface_cache import get_surface_cache
+from particles import get_particle_system
+from draw_counters import get_draw_counters
+from profiler import get_profiler
+from hitch import get_hitch_watchdog
+from tracer import get_tracer
+from timestep import FixedTimestep, RenderInterpolator
+from random_streams import get_random_streams
+from replay import InputRecording, ReplayDriver
 
 
 class DamagePopup:
@@ -49,17 +61,11 @@ class DamagePopup:
         alpha = max(0, 255 - int(255 * (self.age / self.lifetime)))
         # Scale based on damage (bigger numbers for bigger hits)
         font_size = min(36, 20 + self.damage // 5)
-        font = pygame.font.Font(None, font_size)
-        # Render text
+        text_cache = get_text_cache()
         text = str(self.damage)
-        text_surf = font.render(text, True, self.color)
-        text_surf.set_alpha(alpha)
         # Draw with outline for visibility
-        outline_surf = font.render(text, True, (0, 0, 0))
-        outline_surf.set_alpha(alpha)
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            screen.blit(outline_surf, (screen_x + dx, screen_y + dy))
-        screen.blit(text_surf, (screen_x, screen_y))
+        text_surf = text_cache.render_outlined(text, font_size, self.color, (0, 0, 0), 1, diagonals=False)
+        text_cache.draw_surface(screen, text_surf, (screen_x - 1, screen_y - 1), alpha)
 
 
 class CheckpointNotification:
@@ -88,14 +94,9 @@ class CheckpointNotification:
             alpha = 255
 
         # Draw "CHECKPOINT" header
-        font_large = pygame.font.Font(None, 48)
-        font_name = pygame.font.Font(None, 36)
-
-        header = font_large.render("CHECKPOINT", True, (50, 255, 50))
-        name_text = font_name.render(self.name, True, (255, 255, 255))
-
-        header.set_alpha(alpha)
-        name_text.set_alpha(alpha)
+        text_cache = get_text_cache()
+        header = text_cache.render("CHECKPOINT", 48, (50, 255, 50))
+        name_text = text_cache.render(self.name, 36, (255, 255, 255))
 
         # Center on screen
         header_x = SCREEN_WIDTH // 2 - header.get_width() // 2
@@ -103,11 +104,9 @@ class CheckpointNotification:
         y_base = SCREEN_HEIGHT // 3
 
         # Draw with shadow
-        shadow = font_large.render("CHECKPOINT", True, (0, 0, 0))
-        shadow.set_alpha(alpha // 2)
-        screen.blit(shadow, (header_x + 2, y_base + 2))
-        screen.blit(header, (header_x, y_base))
-        screen.blit(name_text, (name_x, y_base + 50))
+        text_cache.draw(screen, "CHECKPOINT", 48, (0, 0, 0), (header_x + 2, y_base + 2), alpha // 2)
+        text_cache.draw(screen, "CHECKPOINT", 48, (50, 255, 50), (header_x, y_base), alpha)
+        text_cache.draw(screen, self.name, 36, (255, 255, 255), (name_x, y_base + 50), alpha)
 
 
 class TutorialPrompt:
@@ -130,7 +129,7 @@ class TutorialPrompt:
         else:
             alpha = 255
 
-        font = pygame.font.Font(None, 32)
+        text_cache = get_text_cache()
 
         # Control hints
         hints = [
@@ -142,25 +141,35 @@ class TutorialPrompt:
 
         y = SCREEN_HEIGHT - 120
         for hint in hints:
-            text = font.render(hint, True, (255, 255, 255))
-            text.set_alpha(alpha)
             # Shadow
-            shadow = font.render(hint, True, (0, 0, 0))
-            shadow.set_alpha(alpha // 2)
-            screen.blit(shadow, (22, y + 2))
-            screen.blit(text, (20, y))
+            text_cache.draw(screen, hint, 32, (0, 0, 0), (22, y + 2), alpha // 2)
+            text_cache.draw(screen, hint, 32, (255, 255, 255), (20, y), alpha)
             y += 25
 
 
 class Game:
     """Main game class."""
 
+    # States drawn over a snapshot of the last gameplay frame -> UI overlay
+    FREEZE_FRAME_OVERLAYS = {
+        GameState.PAUSED: 'pause',
+        GameState.GAME_OVER: 'game_over',
+        GameState.VICTORY: 'victory',
+        GameState.LEVEL_COMPLETE: 'level_complete',
+    }
+
     def __init__(self):
         # Simple init - pygame auto-detects the best drivers
         pygame.init()
         pygame.display.set_caption(TITLE)
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self.display  # Frame target (a counting buffer while draw counters are on)
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
+        self.interpolator = RenderInterpolator()
+        self.profiler = get_profiler()
+        self.hitch_watchdog = get_hitch_watchdog()
+        self.tracer = get_tracer()
         self.running = True
 
         # Game components
@@ -172,16 +181,52 @@ class Game:
         self.players = []
         self.enemy_manager = None
         self.damage_popups = []  # Floating damage numbers
+        self.particles = get_particle_system()  # World-space particle effects
         self.checkpoint_notifications = []  # Checkpoint reached notifications
 
+        # Determinism: runs are seeded, and can be recorded or replayed
+        self.rng_seed = None     # Seed for the next run (None = pick a fresh one)
+        self.record_path = None  # Save each run's input here (numbered after the first)
+        self.recording = None    # InputRecording of the current run
+        self.recorded_runs = 0   # Runs recorded so far this session
+        self.replay = None       # ReplayDriver feeding recorded input
+
+        # Freeze frame for pause/end screens: the world stops moving there,
+        # so it is rendered once and the menus composite over the snapshot
+        self.world_snapshot = None
+        self.freeze_frame = None
+        self.freeze_frame_state = None
+
     def run(self):
-        """Main game loop."""
+        """Main game loop: fixed-rate simulation, interpolated rendering."""
+        tracer = self.tracer
         while self.running:
-            dt = self.clock.tick(FPS)
+            frame_ms = self.clock.tick(RENDER_FPS)
+            tracer.begin('frame')
+            self.profiler.begin_frame()
+            tracer.begin('handle_events')
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            tracer.end()
+            steps = self.timestep.advance(frame_ms)
+            for _ in range(steps):
+                self.update(SIM_STEP_MS)
+
+            # Menus animate once per draw, so they only redraw after a sim step
+            if steps == 0 and self.state_manager.current_state != GameState.PLAYING:
+                self.profiler.skip_frame()
+                tracer.end()
+                continue
+            if self.timestep.should_render():
+                self.draw(self.timestep.alpha)
+                self.profiler.end_frame()
+                self.hitch_watchdog.check(self)
+            else:
+                self.profiler.skip_frame()
+            tracer.end()
 
+        self.save_recording()
+        self.hitch_watchdog.stop()
+        self.tracer.stop()
         pygame.quit()
         sys.exit()
 
@@ -198,6 +243,27 @@ class Game:
         """Handle key press events."""
         state = self.state_manager.current_state
 
+        # Debug keys work on every screen
+        if key == pygame.K_F3:
+            self.profiler.toggle()
+            return
+        if key == pygame.K_F4 and self.profiler.frames:
+            path = self.profiler.dump_csv(time.strftime('profile_%Y%m%d_%H%M%S.csv'))
+            print(f"Frame profile written to {path}")
+            return
+        if key == pygame.K_F5:
+            self.set_draw_counting(not get_draw_counters().enabled)
+            return
+        if key == pygame.K_F6:
+            watching = self.hitch_watchdog.toggle()
+            print(f"Hitch watchdog {'on' if watching else 'off'}"
+                  f" ({self.hitch_watchdog.threshold_ms} ms, {self.hitch_watchdog.directory}/)")
+            return
+        if key == pygame.K_F7:
+            path = self.tracer.toggle(time.strftime('trace_%Y%m%d_%H%M%S.json'))
+            print(f"Trace written to {path}" if path else f"Tracing to {self.tracer.path}")
+            return
+
         if state == GameState.MENU:
             if key == pygame.K_SPACE or key == pygame.K_RETURN:
                 self.state_manager.start_mode_select()
@@ -280,8 +346,53 @@ class Game:
                 self.state_manager.advance_level()
                 self.start_next_level()
 
+    def reset_frame_clock(self):
+        """Don't make the simulation catch up on time spent loading."""
+        self.timestep.reset()
+        self.clock.tick()
+
+    def start_run(self, level, characters, difficulty):
+        """Go through mode, difficulty and character select, then start level."""
+        sm = self.state_manager
+        sm.select_mode(len(characters))
+        sm.select_difficulty(difficulty)
+        for name in characters:
+            sm.select_character(name)
+        sm.current_level = level
+        self.start_game()
+
+    def start_replay(self, recording):
+        """Restart a recorded run and feed its input back step by step."""
+        self.replay = ReplayDriver(recording)
+        self.start_run(recording.level, recording.characters, recording.difficulty)
+
+    def save_recording(self):
+        """Write out the current run's input, if it is being recorded."""
+        if self.recording is not None:
+            self.recorded_runs += 1
+            self.recording.save(self.recording_path(self.recorded_runs))
+            self.recording = None
+
+    def recording_path(self, run):
+        """File for the nth recorded run: record_path, then name_2.ext, name_3.ext, ..."""
+        if run == 1:
+            return self.record_path
+        stem, ext = os.path.splitext(self.record_path)
+        return f"{stem}_{run}{ext}"
+
     def start_game(self):
         """Initialize game for playing."""
+        # Seed gameplay randomness before the level is built; replays reuse theirs
+        seed = self.replay.recording.seed if self.replay else self.rng_seed
+        seed = get_random_streams().reseed(seed)
+        if self.record_path:
+            self.save_recording()
+            sm = self.state_manager
+            characters = [sm.player1_character]
+            if sm.num_players == 2:
+                characters.append(sm.player2_character)
+            self.recording = InputRecording(seed, sm.current_level, sm.difficulty, characters)
+
         self.level = Level(self.state_manager.current_level)
         self.camera = Camera()
         spawn_positions = self.level.get_spawn_positions()
@@ -300,6 +411,7 @@ class Game:
 
         # Create enemy manager
         self.enemy_manager = EnemyManager(self.level)
+        self.particles.clear()
 
         # Store difficulty settings for enemy damage scaling
         self.difficulty_settings = self.state_manager.difficulty_settings
@@ -320,6 +432,8 @@ class Game:
         else:
             self.tutorial_prompt = None
 
+        self.reset_frame_clock()
+
     def start_next_level(self):
         """Start the next level, keeping player stats."""
         old_players = self.players
@@ -341,25 +455,81 @@ class Game:
 
         # Create new enemy manager
         self.enemy_manager = EnemyManager(self.level)
+        self.particles.clear()
         
         # Reset respawn system for new level
         self.respawn_timers = [0, 0]
         self.respawns_remaining = 3 if self.state_manager.num_players == 2 else 2
 
+        self.reset_frame_clock()
+
     def update(self, dt):
-        """Update game state."""
+        """Advance the game by one fixed simulation step."""
         if self.state_manager.current_state == GameState.PLAYING:
+            self.interpolator.capture(self.get_interpolation_targets())
+            self.tracer.begin('update_playing')
             self.update_playing(dt)
+            self.tracer.end()
+
+        # A recording covers one run, up to its end screen or leaving to the menu
+        if self.recording is not None and self.state_manager.current_state not in (
+                GameState.PLAYING, GameState.PAUSED):
+            self.save_recording()
+
+    def get_interpolation_targets(self):
+        """(object, attrs) pairs whose drawn position is blended between steps."""
+        targets = [(self.camera, ('x',))]
+        for player in self.players:
+            targets.append((player, ('x', 'y')))
+            targets.extend((proj, ('x', 'y')) for proj in player.projectiles)
+            # Owner-following effects (fire breath) must blend with their owner
+            targets.extend((effect, ('x', 'y')) for effect in player.special_effects if effect.active)
+        targets.extend((enemy, ('x', 'y')) for enemy in self.enemy_manager.enemies)
+        if self.enemy_manager.boss:
+            targets.append((self.enemy_manager.boss, ('x', 'y')))
+        return targets
+
+    def get_entity_counts(self):
+        """Live object counts, for hitch reports."""
+        counts = {
+            'particles': len(self.particles),
+            'popups': len(self.damage_popups) + len(self.checkpoint_notifications),
+            'player_projectiles': sum(len(p.projectiles) for p in self.players),
+            'special_effects': sum(len(p.special_effects) for p in self.players),
+        }
+        if self.enemy_manager is not None:
+            counts['enemies'] = len(self.enemy_manager.enemies)
+            counts['boss'] = self.enemy_manager.boss is not None
+            counts['enemy_projectiles'] = len(self.enemy_manager.projectiles)
+        return counts
+
+    def get_input(self):
+        """Key state for this sim step: replayed if a replay is running, recorded if on."""
+        keys = self.replay.next_keys() if self.replay is not None else None
+        if keys is None:
+            self.replay = None  # Replay used up - control goes back to the keyboard
+            keys = self.read_keys()
+        if self.recording is not None:
+            self.recording.record(keys)
+        self.hitch_watchdog.record_input(keys)
+        return keys
+
+    def read_keys(self):
+        """Live key state (headless runs supply their own)."""
+        return pygame.key.get_pressed()
 
     def update_playing(self, dt):
         """Update gameplay."""
-        keys = pygame.key.get_pressed()
+        keys = self.get_input()
+        profiler = self.profiler
+        profiler.start()
 
         # Update players
         for player in self.players:
             if player.is_alive():
                 player.handle_input(keys)
-                player.update(self.level.platforms, dt)
+                player.update(self.level.platform_grid, dt)
+        profiler.mark('player_update')
 
         # === CHECKPOINT SYSTEM ===
         # Check if players reached new checkpoints
@@ -413,11 +583,14 @@ class Game:
                         player.vel_x = 0
                     player.rect.x = int(player.x)
 
+        profiler.mark('checkpoints')
+
         # Update camera
-        self.camera.update(self.players)
+        self.camera.update(self.players, dt)
+        profiler.mark('camera')
 
         # Update level (collectibles animation)
-        self.level.update(dt)
+        self.level.update(dt, self.camera.x)
 
         # Check collectibles
         collected = self.level.check_collectibles(self.players)
@@ -437,8 +610,15 @@ class Game:
                 player.character.damage += 5
                 self.audio.play_sound('coin')
 
+        profiler.mark('level_update')
+
+        # Update particles (before enemies, so new emissions start where they spawn)
+        self.particles.update(dt)
+        profiler.mark('particles')
+
         # Update enemies
-        self.enemy_manager.update(self.level.platforms, self.players, dt, self.camera.x)
+        self.enemy_manager.update(self.level.platform_grid, self.players, dt, self.camera.x)
+        profiler.mark('enemy_update')
 
         # Check collisions and get hit events for feedback
         # Pass difficulty multiplier for enemy damage scaling
@@ -456,6 +636,7 @@ class Game:
             self.camera.shake(magnitude=shake_magnitude, duration=shake_duration)
             # Play hit sound
             self.audio.play_sound('hit')
+        profiler.mark('combat')
 
         # Update damage popups
         for popup in self.damage_popups[:]:
@@ -478,9 +659,10 @@ class Game:
         # Update tutorial prompt
         if hasattr(self, 'tutorial_prompt') and self.tutorial_prompt:
             self.tutorial_prompt.update(dt)
+        profiler.mark('popups')
 
         # Check hazard collisions (spikes, lava)
-        for hazard in self.level.hazards:
+        for hazard in self.level.get_active_hazards():
             hazard.update(dt)
             for player in self.players:
                 if player.is_alive() and hazard.check_collision(player):
@@ -497,6 +679,7 @@ class Game:
                 # Death zone - give more buffer for fairness
                 if player.y > SCREEN_HEIGHT + 100:
                     player.health = 0
+        profiler.mark('hazards')
 
         # Check goal (level complete or victory!)
         # If level has boss, must defeat boss first
@@ -515,8 +698,8 @@ class Game:
                 progress
             )
 
-    def draw(self):
-        """Draw the current frame."""
+    def draw(self, alpha=1.0):
+        """Draw the current frame, alpha of the way from the previous sim step."""
         state = self.state_manager.current_state
 
         if state == GameState.MENU:
@@ -536,28 +719,72 @@ class Game:
             self.ui.draw_character_select(self.screen, self.state_manager)
 
         elif state == GameState.PLAYING:
-            self.draw_playing()
+            self.tracer.begin('draw_playing')
+            self.draw_playing(alpha)
+            self.tracer.end()
 
         elif state == GameState.PAUSED:
-            self.draw_playing()
-            self.ui.draw_pause(self.screen)
+            self.draw_freeze_frame(state)
+            self.ui.draw_pause(self.screen, overlay=False)
 
         elif state == GameState.GAME_OVER:
-            self.draw_playing()
-            self.ui.draw_game_over(self.screen, self.state_manager)
+            self.draw_freeze_frame(state)
+            self.ui.draw_game_over(self.screen, self.state_manager, overlay=False)
 
         elif state == GameState.VICTORY:
-            self.draw_playing()
-            self.ui.draw_victory(self.screen, self.state_manager)
+            self.draw_freeze_frame(state)
+            self.ui.draw_victory(self.screen, self.state_manager, overlay=False)
 
         elif state == GameState.LEVEL_COMPLETE:
-            self.draw_playing()
-            self.ui.draw_level_complete(self.screen, self.state_manager)
+            self.draw_freeze_frame(state)
+            self.ui.draw_level_complete(self.screen, self.state_manager, overlay=False)
 
-        pygame.display.flip()
+        if state not in self.FREEZE_FRAME_OVERLAYS:
+            self.world_snapshot = None
+            self.freeze_frame = None
+            self.freeze_frame_state = None
+
+        if self.profiler.overlay_visible:
+            self.profiler.draw_overlay(self.screen)
 
-    def draw_playing(self):
+        if self.screen is not self.display:
+            self.display.blit(self.screen, (0, 0))
+            get_draw_counters().end_frame()
+        self.tracer.begin('flip')
+        pygame.display.flip()
+        self.tracer.end()
+
+    def set_draw_counting(self, enabled):
+        """Turn per-frame draw/blit/text/allocation counting on or off."""
+        counters = get_draw_counters()
+        if enabled:
+            self.screen = counters.frame_buffer(self.display)
+            counters.reset()
+            counters.enable()
+        else:
+            counters.disable()
+            self.screen = self.display
+
+    def draw_freeze_frame(self, state):
+        """Blit the frozen world with this state's overlay already applied."""
+        if self.freeze_frame is None or self.freeze_frame_state != state:
+            if self.world_snapshot is None:
+                self.draw_playing()
+                self.world_snapshot = self.screen.copy()
+            self.freeze_frame = self.world_snapshot.copy()
+            self.freeze_frame.blit(self.ui.get_overlay(self.FREEZE_FRAME_OVERLAYS[state]), (0, 0))
+            self.freeze_frame_state = state
+        self.screen.blit(self.freeze_frame, (0, 0))
+
+    def draw_playing(self, alpha=1.0):
         """Draw gameplay screen."""
+        # Blend positions between the last two sim steps; undone after drawing
+        if alpha < 1.0:
+            self.interpolator.apply(self.get_interpolation_targets(), alpha)
+
+        profiler = self.profiler
+        profiler.start()
+
         # Clear screen first to prevent smearing/ghosting
         self.screen.fill((0, 0, 0))
 
@@ -575,14 +802,21 @@ class Game:
 
         # Draw checkpoint flags
         self.level.draw_checkpoints(self.screen, camera_x)
+        profiler.mark('platforms')
 
         # Draw enemies
-        self.enemy_manager.draw(self.screen, camera_x)
+        self.enemy_manager.draw(self.screen, camera_x, alpha)
+        profiler.mark('enemies_draw')
+
+        # Draw particle effects
+        self.particles.draw(self.screen, camera_x)
+        profiler.mark('particles_draw')
 
         # Draw players
         for player in self.players:
             if player.is_alive():
                 player.draw(self.screen, camera_x)
+        profiler.mark('players_draw')
 
         # Draw damage popups
         for popup in self.damage_popups:
@@ -598,15 +832,16 @@ class Game:
 
         # Draw pit danger warning (red flash at bottom of screen)
         if hasattr(self, 'pit_danger') and self.pit_danger:
-            warning_surf = pygame.Surface((SCREEN_WIDTH, 30), pygame.SRCALPHA)
+            warning_surf = get_surface_cache().scratch(SCREEN_WIDTH, 30)
             pulse = abs(math.sin(pygame.time.get_ticks() * 0.01)) * 100 + 100
             warning_surf.fill((255, 0, 0, int(pulse)))
             self.screen.blit(warning_surf, (0, SCREEN_HEIGHT - 30))
             # Warning text
-            font = pygame.font.Font(None, 28)
-            text = font.render("DANGER!", True, (255, 255, 255))
+            text = get_text_cache().render("DANGER!", 28, (255, 255, 255))
             self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT - 25))
 
+        profiler.mark('popups_draw')
+
         # Draw HUD with respawn info
         respawn_info = {
             'respawns': self.respawns_remaining,
@@ -615,8 +850,31 @@ class Game:
         }
         self.ui.draw_hud(self.screen, self.players, self.enemy_manager, self.camera, 
                         self.state_manager.current_level, respawn_info, self.level)
+        profiler.mark('hud')
+
+        self.interpolator.restore()
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument('--seed', type=int, help="seed gameplay randomness")
+    parser.add_argument('--record', metavar='PATH',
+                        help="record each run's input to PATH; later runs add _2, _3, ... before the extension")
+    parser.add_argument('--replay', metavar='PATH', help="play back a recorded run")
+    parser.add_argument('--watch-hitches', metavar='MS', type=float, nargs='?',
+                        const=HITCH_THRESHOLD_MS,
+                        help=f"capture frames slower than MS (default {HITCH_THRESHOLD_MS}) to {HITCH_DIR}/")
+    parser.add_argument('--trace', metavar='PATH', help="write a trace-event JSON of every frame to PATH")
+    args = parser.parse_args()
+
     game = Game()
+    game.rng_seed = args.seed
+    game.record_path = args.record
+    if args.replay:
+        game.start_replay(InputRecording.load(args.replay))
+    if args.watch_hitches is not None:
+        game.hitch_watchdog.threshold_ms = args.watch_hitches
+        game.hitch_watchdog.start()
+    if args.trace:
+        game.tracer.start(args.trace)
     game.run()
@@ -0,0 +1,239 @@
+# Particle System for Harry Potter Adventure
+# Struct-of-arrays particles spawned from named emitters and drawn in one batch
+
+import pygame
+from settings import *
+from surface_cache import get_surface_cache
+from random_streams import get_rng
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - the system falls back to plain lists
+    np = None
+
+# Starting number of slots; a system doubles it when full
+PARTICLE_CAPACITY = 256
+
+# Sprite kinds
+SPRITE_GLOW = 0      # Soft disc of radius size, faded by the particle's alpha
+SPRITE_SPARKLE = 1   # Solid dot of radius size inside a faint glow of radius 2*size
+
+# Distance past the screen edge where wrapping particles re-enter
+WRAP_MARGIN = 10
+
+
+class ParticleEmitter:
+    """Data class describing how one kind of particle is spawned and behaves."""
+
+    def __init__(self, count, vx, vy, life, colors, size=(4, 4), gravity=0.0,
+                 fade_time=0, sprite=SPRITE_GLOW, wrap=False):
+        self.count = count          # Particles per emit() call
+        self.vx = vx                # (min, max) horizontal speed
+        self.vy = vy                # (min, max) vertical speed
+        self.life = life            # (min, max) lifetime in ms, or None to live forever
+        self.colors = colors        # Picked at random per particle
+        self.size = size            # (min, max) radius in pixels
+        self.gravity = gravity      # Added to vy every step
+        self.fade_time = fade_time  # Alpha reaches 0 over the last fade_time ms (0 = no fade)
+        self.sprite = sprite
+        self.wrap = wrap            # Re-enter from the far edge instead of leaving the screen
+
+
+# Emitter definitions
+EMITTERS = {
+    # Boss defeat: initial burst, then wisps while the body dissolves
+    'boss_death_burst': ParticleEmitter(
+        count=30, vx=(-5, 5), vy=(-8, -2), life=(600, 1200),
+        colors=[(150, 50, 150), (100, 0, 100), (200, 100, 200), (255, 100, 255)],
+        size=(6, 6), gravity=0.2, fade_time=800),
+    'boss_death_wisps': ParticleEmitter(
+        count=3, vx=(-3, 3), vy=(-5, -1), life=(500, 1000),
+        colors=[(150, 50, 150), (100, 0, 100), (200, 100, 200), (80, 0, 80)],
+        size=(6, 6), gravity=0.2, fade_time=800),
+    # Menu screens: golden motes drifting upward forever
+    'menu_sparkles': ParticleEmitter(
+        count=30, vx=(-1, 1), vy=(-1.5, -0.5), life=None,
+        colors=[GOLD, YELLOW, YELLOW], size=(2, 5),
+        sprite=SPRITE_SPARKLE, wrap=True),
+}
+
+
+class ParticleSystem:
+    """Struct-of-arrays particle store.
+
+    Slots [0, count) are live. Integration and lifetime culling run as
+    whole-array passes when numpy is available.
+    """
+
+    FLOAT_FIELDS = ('x', 'y', 'vx', 'vy', 'gravity', 'life', 'fade_time')
+    INT_FIELDS = ('alpha', 'size', 'sprite', 'wrap', 'r', 'g', 'b')
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.count = 0
+        self.capacity = 0
+        self.sprites = {}  # (size, color) -> pre-rendered sparkle
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create or grow the field arrays, keeping live slots."""
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+            old = getattr(self, name, None)
+            if np is not None:
+                dtype = np.float64 if name in self.FLOAT_FIELDS else np.int64
+                arr = np.zeros(capacity, dtype=dtype)
+            else:
+                arr = [0.0 if name in self.FLOAT_FIELDS else 0] * capacity
+            if old is not None:
+                arr[:self.count] = old[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, name, x, y, width=0, height=0):
+        """Spawn an emitter's particles at random points in (x, y, width, height)."""
+        emitter = EMITTERS[name]
+        if self.count + emitter.count > self.capacity:
+            capacity = self.capacity
+            while self.count + emitter.count > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+
+        rng = get_rng('particles')
+        for _ in range(emitter.count):
+            i = self.count
+            self.x[i] = x + rng.randint(0, int(width))
+            self.y[i] = y + rng.randint(0, int(height))
+            self.vx[i] = rng.uniform(*emitter.vx)
+            self.vy[i] = rng.uniform(*emitter.vy)
+            self.gravity[i] = emitter.gravity
+            self.life[i] = rng.uniform(*emitter.life) if emitter.life else float('inf')
+            self.fade_time[i] = emitter.fade_time
+            self.alpha[i] = 255
+            self.size[i] = rng.randint(*emitter.size)
+            self.sprite[i] = emitter.sprite
+            self.wrap[i] = emitter.wrap
+            self.r[i], self.g[i], self.b[i] = rng.choice(emitter.colors)
+            self.count += 1
+
+    def update(self, dt):
+        """Step every particle, then cull the expired ones."""
+        n = self.count
+        if n == 0:
+            return
+        if np is not None:
+            self.x[:n] += self.vx[:n]
+            self.y[:n] += self.vy[:n]
+            self.vy[:n] += self.gravity[:n]
+            life = self.life[:n]
+            life -= dt
+            fading = self.fade_time[:n] > 0
+            if fading.any():
+                faded = (255 * life[fading] / self.fade_time[:n][fading]).astype(np.int64)
+                self.alpha[:n][fading] = np.maximum(faded, 0)
+            x, y = self.x[:n], self.y[:n]
+            outside = (self.wrap[:n] != 0) & ((y < -WRAP_MARGIN) | (x < -WRAP_MARGIN) |
+                                              (x > SCREEN_WIDTH + WRAP_MARGIN))
+            if outside.any():
+                self._wrap(np.flatnonzero(outside).tolist())
+            self._compact(life > 0)
+        else:
+            keep = []
+            for i in range(n):
+                self.x[i] += self.vx[i]
+                self.y[i] += self.vy[i]
+                self.vy[i] += self.gravity[i]
+                self.life[i] -= dt
+                if self.fade_time[i] > 0:
+                    self.alpha[i] = max(0, int(255 * self.life[i] / self.fade_time[i]))
+                keep.append(self.life[i] > 0)
+            self._wrap([i for i in range(n) if self.wrap[i]])
+            self._compact(keep)
+
+    def _wrap(self, indices):
+        """Send wrapping particles that left the screen back in from the far side."""
+        rng = get_rng('particles')
+        for i in indices:
+            if self.y[i] < -WRAP_MARGIN:
+                self.y[i] = SCREEN_HEIGHT + WRAP_MARGIN
+                self.x[i] = rng.randint(0, SCREEN_WIDTH)
+            if self.x[i] < -WRAP_MARGIN:
+                self.x[i] = SCREEN_WIDTH + WRAP_MARGIN
+            elif self.x[i] > SCREEN_WIDTH + WRAP_MARGIN:
+                self.x[i] = -WRAP_MARGIN
+
+    def _compact(self, keep):
+        """Pack the slots where keep is true to the front, preserving order."""
+        n = self.count
+        if np is not None:
+            kept = int(np.count_nonzero(keep))
+            if kept == n:
+                return
+            for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+                arr = getattr(self, name)
+                arr[:kept] = arr[:n][keep]
+        else:
+            kept = 0
+            for i in range(n):
+                if keep[i]:
+                    if kept != i:
+                        for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+                            arr = getattr(self, name)
+                            arr[kept] = arr[i]
+                    kept += 1
+        self.count = kept
+
+    def _get_sprite(self, kind, size, color, alpha):
+        """Pre-rendered texture for one particle look."""
+        if kind == SPRITE_GLOW:
+            return get_surface_cache().glow(size, color, min(255, alpha))
+
+        key = (size, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            # The faint glow is painted over the dot, as it is on screen
+            sprite = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size * 2, size * 2), size)
+            sprite.blit(get_surface_cache().glow(size * 2, color, 50), (0, 0))
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, camera_x=0):
+        """Stamp every on-screen particle with one Surface.blits call."""
+        n = self.count
+        if n == 0:
+            return
+        if np is not None:
+            sx = (self.x[:n] - camera_x).astype(np.int64).tolist()
+            sy = self.y[:n].astype(np.int64).tolist()
+            fields = [arr[:n].tolist() for arr in (self.sprite, self.size, self.alpha,
+                                                   self.r, self.g, self.b)]
+        else:
+            sx = [int(self.x[i] - camera_x) for i in range(n)]
+            sy = [int(self.y[i]) for i in range(n)]
+            fields = [arr[:n] for arr in (self.sprite, self.size, self.alpha,
+                                          self.r, self.g, self.b)]
+
+        batch = []
+        for i, (kind, size, alpha, r, g, b) in enumerate(zip(*fields)):
+            sprite = self._get_sprite(kind, size, (r, g, b), alpha)
+            half = sprite.get_width() // 2
+            if sx[i] + half < 0 or sx[i] - half > SCREEN_WIDTH:
+                continue
+            batch.append((sprite, (sx[i] - half, sy[i] - half)))
+        screen.blits(batch, doreturn=False)
+
+
+# Global particle system for world-space effects
+particle_system = None
+
+def get_particle_system():
+    """Get or create the global world particle system."""
+    global particle_system
+    if particle_system is None:
+        particle_system = ParticleSystem()
+    return particle_system
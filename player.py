@@ -6,6 +6,19 @@ import os
 import random
 from settings import *
 from characters import get_character
+from text_cache import get_text_cache
+from surface_cache import get_surface_cache
+from tracer import get_tracer
+
+
+class PressedKeys:
+    """Key state built from a set of held keys, indexed like pygame.key.get_pressed()."""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
 
 
 class Projectile:
@@ -29,14 +42,16 @@ class Projectile:
         self.vel_x = vel_x if vel_x is not None else speed * direction
         self.vel_y = vel_y
 
-    def update(self):
-        self.age += 1
+    def update(self, dt=SIM_STEP_MS):
+        # Speeds are per sim step; scale in case dt is not one step
+        step = dt / SIM_STEP_MS
+        self.age += step
         self.trail.append((self.x, self.y, self.age))
         if len(self.trail) > self.trail_max:
             self.trail.pop(0)
         
-        self.x += self.vel_x
-        self.y += self.vel_y
+        self.x += self.vel_x * step
+        self.y += self.vel_y * step
         self.rect.x = int(self.x) - 5
         self.rect.y = int(self.y) - 5
         if self.rect.right < -100 or self.rect.left > LEVEL_WIDTH + 100:
@@ -215,9 +230,38 @@ class Projectile:
         pygame.draw.circle(screen, core_color, (cx, cy), max(3, self.size // 3))
 
 
+class PremultipliedCanvas(pygame.Surface):
+    """SRCALPHA bake target that keeps its pixels in premultiplied alpha.
+
+    A plain SRCALPHA surface blends translucent layers as if it were
+    opaque, so stacked glows would bake too bright. Blits here composite
+    exactly; blit the result with BLEND_PREMULTIPLIED.
+    """
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return super().blit(source.premul_alpha(), dest, area, pygame.BLEND_PREMULTIPLIED)
+
+
 class SpecialEffect:
     """Visual effect for special attacks with particles, glow, and damage."""
 
+    # Effects are baked into flipbooks of progress steps per facing
+    FLIPBOOK_STEPS = 24
+    FLIPBOOK_CANVAS = (1000, 800)  # Bake canvas; frames are cropped to what was painted
+    FLIPBOOK_CACHE = {}  # (effect_type, direction) -> [(frame, offset_x, offset_y), ...]
+    DIRECTIONAL_EFFECTS = ('lightning', 'fire_breath')
+
+    # Full-screen flash on cast: effect_type -> (color, peak alpha, fraction of life it lasts)
+    FLASHES = {
+        'lightning': ((200, 220, 255), 200, 0.1),
+        'shockwave': ((255, 150, 0), 150, 0.1),
+        'spell_burst': ((100, 100, 255), 180, 0.15),
+        'dark_magic': ((0, 255, 0), 100, 0.2),
+        'ground_slam': ((139, 90, 43), 150, 0.15),
+        'heal_aura': ((255, 200, 255), 120, 0.2),
+        'fire_breath': ((255, 100, 0), 100, 0.15),
+    }
+
     def __init__(self, x, y, effect_type, duration, color, owner, damage=0, damage_radius=0):
         self.x = x
         self.y = y
@@ -227,116 +271,9 @@ class SpecialEffect:
         self.color = color
         self.owner = owner
         self.active = True
-        self.particles = []
         self.damage = damage
         self.damage_radius = damage_radius
         self.damaged_enemies = set()  # Track which enemies were hit (by id)
-        self._init_particles()
-
-    def _init_particles(self):
-        import random
-        if self.effect_type == 'lightning':
-            # Main lightning bolts + electric sparks
-            for _ in range(35):
-                self.particles.append({
-                    'x': random.randint(-50, 50), 'y': random.randint(-100, 30),
-                    'vx': random.uniform(-4, 4), 'vy': random.uniform(-5, 2),
-                    'life': random.uniform(0.4, 1.0), 'size': random.randint(3, 8),
-                    'type': 'spark'
-                })
-            # Ground impact sparks
-            for _ in range(15):
-                self.particles.append({
-                    'x': random.randint(-60, 60), 'y': random.randint(-10, 20),
-                    'vx': random.uniform(-6, 6), 'vy': random.uniform(-10, -3),
-                    'life': 1.0, 'size': random.randint(2, 5),
-                    'type': 'ground'
-                })
-        elif self.effect_type in ('spell_burst', 'dark_magic'):
-            # Multiple rings of magical orbs
-            for ring in range(3):
-                num_orbs = 8 + ring * 4
-                for i in range(num_orbs):
-                    angle = (i / num_orbs) * math.pi * 2
-                    speed = 3 + ring * 2
-                    self.particles.append({
-                        'x': 0, 'y': 0, 'vx': math.cos(angle) * speed, 'vy': math.sin(angle) * speed,
-                        'life': 1.0, 'size': 12 - ring * 2, 'ring': ring,
-                        'angle': angle
-                    })
-            # Add trailing sparkles
-            for _ in range(20):
-                self.particles.append({
-                    'x': random.randint(-20, 20), 'y': random.randint(-20, 20),
-                    'vx': random.uniform(-2, 2), 'vy': random.uniform(-2, 2),
-                    'life': random.uniform(0.5, 1.0), 'size': random.randint(2, 5),
-                    'ring': -1
-                })
-        elif self.effect_type == 'fire_breath':
-            # Intense multi-layered flame with upward spread
-            for _ in range(50):
-                self.particles.append({
-                    'x': 0, 'y': random.randint(-25, 25),
-                    'vx': self.owner.direction * random.uniform(10, 20),
-                    'vy': random.uniform(-3, 3),
-                    'life': random.uniform(0.5, 1.0), 'size': random.randint(8, 18),
-                    'heat': random.uniform(0, 1)
-                })
-            # Add upward-rising flames for flying enemy coverage
-            for _ in range(15):
-                self.particles.append({
-                    'x': self.owner.direction * random.randint(20, 80), 'y': 0,
-                    'vx': self.owner.direction * random.uniform(5, 10),
-                    'vy': random.uniform(-8, -4),  # Rises upward
-                    'life': random.uniform(0.6, 1.0), 'size': random.randint(10, 16),
-                    'heat': random.uniform(0.5, 1)
-                })
-            # Smoke particles
-            for _ in range(15):
-                self.particles.append({
-                    'x': self.owner.direction * random.uniform(60, 100),
-                    'y': random.randint(-30, 30),
-                    'vx': self.owner.direction * random.uniform(2, 5),
-                    'vy': random.uniform(-4, -1),
-                    'life': random.uniform(0.3, 0.8), 'size': random.randint(15, 25),
-                    'heat': -1  # smoke marker
-                })
-        elif self.effect_type == 'heal_aura':
-            # Magical sparkles rising in spirals
-            for i in range(25):
-                angle = random.uniform(0, math.pi * 2)
-                dist = random.uniform(15, 70)
-                self.particles.append({
-                    'x': math.cos(angle) * dist, 'y': math.sin(angle) * dist - 20,
-                    'vx': math.cos(angle + math.pi/2) * 0.5, 'vy': random.uniform(-2, -4),
-                    'life': random.uniform(0.6, 1.0), 'size': random.randint(4, 10),
-                    'angle': angle, 'dist': dist
-                })
-            # Plus symbols (healing icons)
-            for _ in range(6):
-                self.particles.append({
-                    'x': random.randint(-50, 50), 'y': random.randint(-60, 0),
-                    'vx': 0, 'vy': random.uniform(-1.5, -3),
-                    'life': 1.0, 'size': 12, 'is_cross': True
-                })
-        elif self.effect_type == 'ground_slam':
-            # Rocks and debris
-            for i in range(18):
-                self.particles.append({
-                    'x': (i - 9) * 20, 'y': 0,
-                    'vx': (i - 9) * 3, 'vy': random.uniform(-12, -5),
-                    'life': 1.0, 'size': random.randint(10, 22),
-                    'rotation': random.uniform(0, math.pi * 2),
-                    'rot_speed': random.uniform(-0.3, 0.3)
-                })
-            # Ground cracks
-            for i in range(10):
-                self.particles.append({
-                    'x': (i - 5) * 30, 'y': 5,
-                    'vx': 0, 'vy': 0,
-                    'life': 1.0, 'size': random.randint(3, 6),
-                    'is_crack': True, 'crack_len': random.randint(30, 60)
-                })
 
     def update(self, dt):
         self.duration -= dt
@@ -346,11 +283,6 @@ class SpecialEffect:
         if self.effect_type in ('fire_breath',):
             self.x = self.owner.rect.centerx + (30 * self.owner.direction)
             self.y = self.owner.rect.centery
-        # Update particles
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['life'] -= dt / self.max_duration
 
     def get_damage_rect(self):
         """Get the damage area for this effect."""
@@ -403,11 +335,15 @@ class SpecialEffect:
                              current_radius * 2, current_radius * 2)
         return None
 
-    def check_enemy_hit(self, enemy):
-        """Check if this effect hits an enemy and deal damage."""
+    def check_enemy_hit(self, enemy, damage_rect=None):
+        """Check if this effect hits an enemy and deal damage.
+
+        damage_rect may be passed in when it was already computed this frame.
+        """
         if self.damage <= 0 or id(enemy) in self.damaged_enemies:
             return False
-        damage_rect = self.get_damage_rect()
+        if damage_rect is None:
+            damage_rect = self.get_damage_rect()
         if damage_rect and damage_rect.colliderect(enemy.rect):
             self.damaged_enemies.add(id(enemy))
             return True
@@ -418,39 +354,79 @@ class SpecialEffect:
         if screen_x < -300 or screen_x > SCREEN_WIDTH + 300:
             return
 
-        progress = 1 - (self.duration / self.max_duration)
-        
-        # Screen shake indicator for epic effects
-        shake = 0
-        if progress < 0.3 and self.effect_type in ('lightning', 'ground_slam', 'dark_magic'):
-            shake = int((1 - progress / 0.3) * 4 * math.sin(progress * 50))
-
+        progress = max(0.0, min(1.0, 1 - (self.duration / self.max_duration)))
+
+        # Full-screen flash on cast
+        flash = self.FLASHES.get(self.effect_type)
+        if flash and progress < flash[2]:
+            color, peak_alpha, flash_end = flash
+            get_surface_cache().draw_flash(screen, color, int(peak_alpha * (1 - progress / flash_end)))
+
+        direction = self.owner.direction if self.effect_type in self.DIRECTIONAL_EFFECTS else 1
+        frames = self.get_flipbook(self.effect_type, direction)
+        frame, offset_x, offset_y = frames[min(len(frames) - 1, int(progress * len(frames)))]
+        screen.blit(frame, (screen_x + offset_x, int(self.y) + offset_y),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    @classmethod
+    def get_flipbook(cls, effect_type, direction=1):
+        """Get (baking on first use) the progress frames for an effect and facing.
+
+        Each frame is (surface, offset_x, offset_y), cropped to its painted
+        area and premultiplied; the offsets place it relative to the
+        effect's position.
+        """
+        if effect_type not in cls.DIRECTIONAL_EFFECTS:
+            direction = 1
+        key = (effect_type, direction)
+        frames = cls.FLIPBOOK_CACHE.get(key)
+        if frames is not None:
+            return frames
+
+        # A bare SpecialEffect carries just the state the painter reads
+        pose = cls.__new__(cls)
+        pose.effect_type = effect_type
+        canvas_w, canvas_h = cls.FLIPBOOK_CANVAS
+        cx, cy = canvas_w // 2, canvas_h // 2
+        converted = pygame.display.get_surface() is not None
+
+        # Jittery effects (cracks, embers) get the same look every run
+        rng_state = random.getstate()
+        random.seed(f"{effect_type}:{direction}")
+        frames = []
+        for step in range(cls.FLIPBOOK_STEPS):
+            canvas = PremultipliedCanvas((canvas_w, canvas_h), pygame.SRCALPHA)
+            pose._paint(canvas, cx, cy, (step + 0.5) / cls.FLIPBOOK_STEPS, direction)
+            bounds = canvas.get_bounding_rect()
+            if bounds.width == 0 or bounds.height == 0:
+                bounds = pygame.Rect(cx, cy, 1, 1)
+            frame = canvas.subsurface(bounds).copy()
+            if converted:
+                frame = frame.convert_alpha()
+            frames.append((frame, bounds.x - cx, bounds.y - cy))
+        random.setstate(rng_state)
+
+        cls.FLIPBOOK_CACHE[key] = frames
+        return frames
+
+    def _paint(self, surface, cx, cy, progress, direction):
+        """Paint one frame of the effect centred on (cx, cy)."""
         if self.effect_type == 'lightning':
             # HARRY'S PATRONUS - Silver/white stag charging forward
-            direction = self.owner.direction
-            
-            # Brilliant silver/white flash on cast
-            if progress < 0.1:
-                flash_alpha = int(200 * (1 - progress / 0.1))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((200, 220, 255, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             # Stag position - charges forward
-            stag_x = screen_x + direction * int(progress * 250)
-            stag_y = int(self.y) - 20
+            stag_x = cx + direction * int(progress * 250)
+            stag_y = cy - 20
             
             # Ethereal trail behind the stag
             for i in range(15):
                 trail_progress = max(0, progress - i * 0.03)
                 if trail_progress > 0:
-                    trail_x = screen_x + direction * int(trail_progress * 250)
+                    trail_x = cx + direction * int(trail_progress * 250)
                     trail_alpha = int(150 * (1 - i / 15))
                     trail_size = int(30 - i * 1.5)
                     if trail_size > 0:
-                        trail_surf = pygame.Surface((trail_size * 2, trail_size * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(trail_surf, (180, 200, 255, trail_alpha), (trail_size, trail_size), trail_size)
-                        screen.blit(trail_surf, (trail_x - trail_size, stag_y - trail_size))
+                        get_surface_cache().draw_glow(surface, (trail_x, stag_y), trail_size,
+                                                      (180, 200, 255), trail_alpha)
             
             # Draw the stag Patronus
             stag_scale = min(1.0, progress * 3)  # Grow into full size quickly
@@ -458,23 +434,23 @@ class SpecialEffect:
             # Body (elongated oval)
             body_w = int(60 * stag_scale)
             body_h = int(35 * stag_scale)
-            body_surf = pygame.Surface((body_w + 20, body_h + 20), pygame.SRCALPHA)
+            body_surf = get_surface_cache().scratch(body_w + 20, body_h + 20)
             pygame.draw.ellipse(body_surf, (200, 220, 255, 200), (10, 10, body_w, body_h))
             pygame.draw.ellipse(body_surf, (230, 240, 255, 255), (15, 15, body_w - 10, body_h - 10))
             if direction < 0:
                 body_surf = pygame.transform.flip(body_surf, True, False)
-            screen.blit(body_surf, (stag_x - body_w // 2 - 10, stag_y - body_h // 2))
+            surface.blit(body_surf, (stag_x - body_w // 2 - 10, stag_y - body_h // 2))
             
             # Neck and head
             head_x = stag_x + direction * int(35 * stag_scale)
             head_y = stag_y - int(15 * stag_scale)
             # Neck
-            pygame.draw.line(screen, (220, 235, 255), 
+            pygame.draw.line(surface, (220, 235, 255), 
                            (stag_x + direction * int(20 * stag_scale), stag_y - int(10 * stag_scale)),
                            (head_x, head_y), int(8 * stag_scale))
             # Head
-            pygame.draw.circle(screen, (200, 220, 255), (head_x, head_y), int(12 * stag_scale))
-            pygame.draw.circle(screen, (230, 245, 255), (head_x, head_y), int(8 * stag_scale))
+            pygame.draw.circle(surface, (200, 220, 255), (head_x, head_y), int(12 * stag_scale))
+            pygame.draw.circle(surface, (230, 245, 255), (head_x, head_y), int(8 * stag_scale))
             
             # Majestic antlers
             antler_base_x = head_x
@@ -489,13 +465,13 @@ class SpecialEffect:
                     ex = ax + int(math.cos(branch_angle) * branch_len) * side * direction
                     ey = ay - int(abs(math.sin(branch_angle)) * branch_len)
                     thickness = max(1, int((4 - branch * 0.5) * stag_scale))
-                    pygame.draw.line(screen, (220, 235, 255), (ax, ay), (ex, ey), thickness)
-                    pygame.draw.line(screen, WHITE, (ax, ay), (ex, ey), max(1, thickness - 1))
+                    pygame.draw.line(surface, (220, 235, 255), (ax, ay), (ex, ey), thickness)
+                    pygame.draw.line(surface, WHITE, (ax, ay), (ex, ey), max(1, thickness - 1))
                     # Sub-branches
                     if branch > 0:
                         sub_angle = branch_angle + side * direction * 0.4
                         sub_len = branch_len * 0.5
-                        pygame.draw.line(screen, (200, 220, 255), 
+                        pygame.draw.line(surface, (200, 220, 255), 
                                        (ex, ey), 
                                        (ex + int(math.cos(sub_angle) * sub_len), ey - int(abs(math.sin(sub_angle)) * sub_len)),
                                        max(1, thickness - 1))
@@ -514,13 +490,13 @@ class SpecialEffect:
                 leg_swing = math.sin(phase) * 15
                 foot_x = leg_x + direction * int((end_offset + leg_swing) * stag_scale * 0.3)
                 foot_y = leg_y + int(leg_len * stag_scale)
-                pygame.draw.line(screen, (200, 220, 255), (leg_x, leg_y), (foot_x, foot_y), int(4 * stag_scale))
+                pygame.draw.line(surface, (200, 220, 255), (leg_x, leg_y), (foot_x, foot_y), int(4 * stag_scale))
             
             # Ethereal glow around the stag
             glow_size = int(50 * stag_scale)
-            glow_surf = pygame.Surface((glow_size * 3, glow_size * 2), pygame.SRCALPHA)
+            glow_surf = get_surface_cache().scratch(glow_size * 3, glow_size * 2)
             pygame.draw.ellipse(glow_surf, (180, 200, 255, 60), (0, 0, glow_size * 3, glow_size * 2))
-            screen.blit(glow_surf, (stag_x - glow_size * 1.5, stag_y - glow_size))
+            surface.blit(glow_surf, (stag_x - glow_size * 1.5, stag_y - glow_size))
             
             # Sparkles around the Patronus
             for i in range(8):
@@ -528,8 +504,8 @@ class SpecialEffect:
                 spark_dist = 40 + math.sin(spark_angle * 2) * 15
                 sx = stag_x + int(math.cos(spark_angle) * spark_dist)
                 sy = stag_y + int(math.sin(spark_angle) * spark_dist * 0.5)
-                pygame.draw.circle(screen, (230, 240, 255), (sx, sy), 3)
-                pygame.draw.circle(screen, WHITE, (sx, sy), 1)
+                pygame.draw.circle(surface, (230, 240, 255), (sx, sy), 3)
+                pygame.draw.circle(surface, WHITE, (sx, sy), 1)
             
             # Light rays emanating from stag
             if progress > 0.2:
@@ -541,17 +517,10 @@ class SpecialEffect:
                     rex = rx + int(math.cos(ray_angle) * ray_len)
                     rey = ry + int(math.sin(ray_angle) * ray_len * 0.5)
                     ray_alpha = int(100 * (1 - progress * 0.5))
-                    pygame.draw.line(screen, (200, 220, 255), (rx, ry), (rex, rey), 2)
+                    pygame.draw.line(surface, (200, 220, 255), (rx, ry), (rex, rey), 2)
 
         elif self.effect_type == 'shockwave':
             # RON'S POWERFUL PUNCH - Orange/red force explosion
-            # Initial flash
-            if progress < 0.1:
-                flash_alpha = int(150 * (1 - progress / 0.1))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((255, 150, 0, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             radius = int(progress * 200)
             
             # Ground cracks radiating outward
@@ -562,12 +531,12 @@ class SpecialEffect:
                     seg_start = seg * crack_len // 5
                     seg_end = (seg + 1) * crack_len // 5
                     jitter = random.randint(-8, 8) if seg > 0 else 0
-                    sx = screen_x + int(math.cos(crack_angle) * seg_start)
-                    sy = int(self.y) + int(math.sin(crack_angle) * seg_start * 0.3)
-                    ex = screen_x + int(math.cos(crack_angle) * seg_end) + jitter
-                    ey = int(self.y) + int(math.sin(crack_angle) * seg_end * 0.3)
-                    pygame.draw.line(screen, (80, 40, 0), (sx, sy), (ex, ey), 4)
-                    pygame.draw.line(screen, (150, 80, 20), (sx, sy), (ex, ey), 2)
+                    sx = cx + int(math.cos(crack_angle) * seg_start)
+                    sy = cy + int(math.sin(crack_angle) * seg_start * 0.3)
+                    ex = cx + int(math.cos(crack_angle) * seg_end) + jitter
+                    ey = cy + int(math.sin(crack_angle) * seg_end * 0.3)
+                    pygame.draw.line(surface, (80, 40, 0), (sx, sy), (ex, ey), 4)
+                    pygame.draw.line(surface, (150, 80, 20), (sx, sy), (ex, ey), 2)
             
             # Multiple shockwave rings
             for ring in range(5):
@@ -575,132 +544,118 @@ class SpecialEffect:
                 if r > 0:
                     thickness = max(2, 10 - ring * 2)
                     alpha = max(0, 255 - ring * 40 - int(progress * 100))
-                    ring_surf = pygame.Surface((r * 2 + 20, r * 2 + 20), pygame.SRCALPHA)
+                    ring_surf = get_surface_cache().scratch(r * 2 + 20, r * 2 + 20)
                     color = (255, 200 - ring * 30, 50 - ring * 10, alpha)
                     pygame.draw.circle(ring_surf, color, (r + 10, r + 10), r, thickness)
-                    screen.blit(ring_surf, (screen_x - r - 10, int(self.y) - r * 0.3 - 10))
+                    surface.blit(ring_surf, (cx - r - 10, cy - r * 0.3 - 10))
             
             # Fist impact glow at center
             punch_glow = int(40 * (1 - progress * 0.7))
-            pygame.draw.circle(screen, (255, 150, 50), (screen_x, int(self.y)), punch_glow)
-            pygame.draw.circle(screen, (255, 220, 150), (screen_x, int(self.y)), punch_glow // 2)
-            pygame.draw.circle(screen, WHITE, (screen_x, int(self.y)), punch_glow // 4)
+            pygame.draw.circle(surface, (255, 150, 50), (cx, cy), punch_glow)
+            pygame.draw.circle(surface, (255, 220, 150), (cx, cy), punch_glow // 2)
+            pygame.draw.circle(surface, WHITE, (cx, cy), punch_glow // 4)
             
             # Debris particles
             for i in range(16):
                 angle = (i / 16) * math.pi * 2 + i * 0.3
                 dist = 30 + progress * 100
                 height = int(math.sin(progress * math.pi) * 40 * (1 - i % 3 * 0.2))
-                dx = screen_x + int(math.cos(angle) * dist)
-                dy = int(self.y) - height + int(math.sin(angle) * dist * 0.2)
+                dx = cx + int(math.cos(angle) * dist)
+                dy = cy - height + int(math.sin(angle) * dist * 0.2)
                 size = 3 + (i % 4)
-                pygame.draw.circle(screen, (139, 90, 43), (dx, dy), size)
+                pygame.draw.circle(surface, (139, 90, 43), (dx, dy), size)
 
         elif self.effect_type == 'spell_burst':
             # HERMIONE'S SPELL BURST - Blue/purple magical knowledge
-            # Brilliant blue flash
-            if progress < 0.15:
-                flash_alpha = int(180 * (1 - progress / 0.15))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((100, 100, 255, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             # Magic circle with runes
             circle_r = int(50 + progress * 100)
             # Outer circle
-            pygame.draw.circle(screen, (100, 50, 200), (screen_x, int(self.y)), circle_r, 4)
-            pygame.draw.circle(screen, (150, 100, 255), (screen_x, int(self.y)), circle_r - 8, 2)
-            pygame.draw.circle(screen, (200, 150, 255), (screen_x, int(self.y)), circle_r - 20, 2)
+            pygame.draw.circle(surface, (100, 50, 200), (cx, cy), circle_r, 4)
+            pygame.draw.circle(surface, (150, 100, 255), (cx, cy), circle_r - 8, 2)
+            pygame.draw.circle(surface, (200, 150, 255), (cx, cy), circle_r - 20, 2)
             
             # Rotating runes around the circle
             for i in range(8):
                 rune_angle = (i / 8) * math.pi * 2 + progress * 4
-                rx = screen_x + int(math.cos(rune_angle) * (circle_r - 5))
-                ry = int(self.y) + int(math.sin(rune_angle) * (circle_r - 5) * 0.7)
+                rx = cx + int(math.cos(rune_angle) * (circle_r - 5))
+                ry = cy + int(math.sin(rune_angle) * (circle_r - 5) * 0.7)
                 # Draw rune symbol (diamond with cross)
                 rune_size = 10
-                pygame.draw.polygon(screen, (200, 180, 255), [
+                pygame.draw.polygon(surface, (200, 180, 255), [
                     (rx, ry - rune_size), (rx + rune_size // 2, ry),
                     (rx, ry + rune_size), (rx - rune_size // 2, ry)
                 ])
-                pygame.draw.line(screen, WHITE, (rx - 4, ry), (rx + 4, ry), 2)
-                pygame.draw.line(screen, WHITE, (rx, ry - 4), (rx, ry + 4), 2)
+                pygame.draw.line(surface, WHITE, (rx - 4, ry), (rx + 4, ry), 2)
+                pygame.draw.line(surface, WHITE, (rx, ry - 4), (rx, ry + 4), 2)
             
             # Expanding spell projectiles in star pattern
             for i in range(5):
                 spell_angle = (i / 5) * math.pi * 2 - math.pi / 2 + progress * 2
                 spell_dist = 20 + progress * 150
-                sx = screen_x + int(math.cos(spell_angle) * spell_dist)
-                sy = int(self.y) + int(math.sin(spell_angle) * spell_dist * 0.6)
+                sx = cx + int(math.cos(spell_angle) * spell_dist)
+                sy = cy + int(math.sin(spell_angle) * spell_dist * 0.6)
                 # Spell orb with trail
                 for trail in range(5):
                     t_dist = spell_dist - trail * 15
                     if t_dist > 0:
-                        tx = screen_x + int(math.cos(spell_angle) * t_dist)
-                        ty = int(self.y) + int(math.sin(spell_angle) * t_dist * 0.6)
+                        tx = cx + int(math.cos(spell_angle) * t_dist)
+                        ty = cy + int(math.sin(spell_angle) * t_dist * 0.6)
                         t_size = 10 - trail * 2
                         t_alpha = 255 - trail * 40
-                        pygame.draw.circle(screen, (150, 100, 255), (tx, ty), t_size)
-                        pygame.draw.circle(screen, (200, 150, 255), (tx, ty), max(1, t_size - 3))
+                        pygame.draw.circle(surface, (150, 100, 255), (tx, ty), t_size)
+                        pygame.draw.circle(surface, (200, 150, 255), (tx, ty), max(1, t_size - 3))
                 # Main orb
-                pygame.draw.circle(screen, (100, 50, 200), (sx, sy), 15)
-                pygame.draw.circle(screen, (180, 130, 255), (sx, sy), 10)
-                pygame.draw.circle(screen, WHITE, (sx, sy), 5)
+                pygame.draw.circle(surface, (100, 50, 200), (sx, sy), 15)
+                pygame.draw.circle(surface, (180, 130, 255), (sx, sy), 10)
+                pygame.draw.circle(surface, WHITE, (sx, sy), 5)
             
             # Floating book pages / sparkles
             for i in range(12):
                 page_angle = (i / 12) * math.pi * 2 + progress * 3 + i * 0.5
                 page_dist = 40 + math.sin(progress * 6 + i) * 20
-                px = screen_x + int(math.cos(page_angle) * page_dist)
-                py = int(self.y) + int(math.sin(page_angle) * page_dist * 0.5) - int(progress * 30)
+                px = cx + int(math.cos(page_angle) * page_dist)
+                py = cy + int(math.sin(page_angle) * page_dist * 0.5) - int(progress * 30)
                 # Small square "page"
                 page_size = 6
-                pygame.draw.rect(screen, (230, 220, 255), (px - page_size // 2, py - page_size // 2, page_size, page_size))
-                pygame.draw.rect(screen, (150, 130, 200), (px - page_size // 2, py - page_size // 2, page_size, page_size), 1)
+                pygame.draw.rect(surface, (230, 220, 255), (px - page_size // 2, py - page_size // 2, page_size, page_size))
+                pygame.draw.rect(surface, (150, 130, 200), (px - page_size // 2, py - page_size // 2, page_size, page_size), 1)
             
             # Central knowledge burst
             burst_size = int(30 * (1 - progress * 0.5))
-            pygame.draw.circle(screen, (200, 180, 255), (screen_x, int(self.y)), burst_size)
-            pygame.draw.circle(screen, WHITE, (screen_x, int(self.y)), burst_size // 2)
+            pygame.draw.circle(surface, (200, 180, 255), (cx, cy), burst_size)
+            pygame.draw.circle(surface, WHITE, (cx, cy), burst_size // 2)
 
         elif self.effect_type == 'dark_magic':
             # AVADA KEDAVRA - deadly green skull explosion
-            # Green flash at start
-            if progress < 0.2:
-                flash_alpha = int(100 * (1 - progress / 0.2))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((0, 255, 0, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             # Expanding death ring
             ring_radius = int(progress * 150)
             for i in range(4):
                 r = max(1, ring_radius - i * 15)
                 thickness = max(1, 8 - i * 2)
                 alpha = max(0, 255 - i * 50 - int(progress * 100))
-                ring_surf = pygame.Surface((r * 2 + 20, r * 2 + 20), pygame.SRCALPHA)
+                ring_surf = get_surface_cache().scratch(r * 2 + 20, r * 2 + 20)
                 pygame.draw.circle(ring_surf, (0, 255, 0, alpha), (r + 10, r + 10), r, thickness)
-                screen.blit(ring_surf, (screen_x - r - 10, int(self.y) - r - 10))
+                surface.blit(ring_surf, (cx - r - 10, cy - r - 10))
             
             # Green skull apparition in center
             skull_size = int(40 * min(1, progress * 2))
             skull_alpha = int(200 * (1 - progress * 0.5))
             # Skull shape (simplified)
-            pygame.draw.circle(screen, (0, 180, 0), (screen_x, int(self.y) - 10), skull_size)  # Head
-            pygame.draw.circle(screen, (0, 100, 0), (screen_x - skull_size // 3, int(self.y) - skull_size // 3), skull_size // 4)  # Eye
-            pygame.draw.circle(screen, (0, 100, 0), (screen_x + skull_size // 3, int(self.y) - skull_size // 3), skull_size // 4)  # Eye
-            pygame.draw.ellipse(screen, (0, 80, 0), (screen_x - skull_size // 4, int(self.y), skull_size // 2, skull_size // 3))  # Jaw
+            pygame.draw.circle(surface, (0, 180, 0), (cx, cy - 10), skull_size)  # Head
+            pygame.draw.circle(surface, (0, 100, 0), (cx - skull_size // 3, cy - skull_size // 3), skull_size // 4)  # Eye
+            pygame.draw.circle(surface, (0, 100, 0), (cx + skull_size // 3, cy - skull_size // 3), skull_size // 4)  # Eye
+            pygame.draw.ellipse(surface, (0, 80, 0), (cx - skull_size // 4, cy, skull_size // 2, skull_size // 3))  # Jaw
             
             # Swirling green death energy
             for i in range(16):
                 angle = (i / 16) * math.pi * 2 + progress * 8
                 dist = 40 + progress * 100
-                px = screen_x + int(math.cos(angle) * dist)
-                py = int(self.y) + int(math.sin(angle) * dist * 0.6)
+                px = cx + int(math.cos(angle) * dist)
+                py = cy + int(math.sin(angle) * dist * 0.6)
                 # Green death orbs
-                pygame.draw.circle(screen, (0, 150, 0), (px, py), 10)
-                pygame.draw.circle(screen, (0, 255, 0), (px, py), 6)
-                pygame.draw.circle(screen, (150, 255, 150), (px, py), 3)
+                pygame.draw.circle(surface, (0, 150, 0), (px, py), 10)
+                pygame.draw.circle(surface, (0, 255, 0), (px, py), 6)
+                pygame.draw.circle(surface, (150, 255, 150), (px, py), 3)
             
             # Snake-like energy trails
             for i in range(8):
@@ -708,41 +663,34 @@ class SpecialEffect:
                 for seg in range(8):
                     seg_angle = angle + seg * 0.15
                     seg_dist = 30 + seg * 12 + progress * 60
-                    sx = screen_x + int(math.cos(seg_angle) * seg_dist)
-                    sy = int(self.y) + int(math.sin(seg_angle) * seg_dist * 0.5)
+                    sx = cx + int(math.cos(seg_angle) * seg_dist)
+                    sy = cy + int(math.sin(seg_angle) * seg_dist * 0.5)
                     size = max(2, 8 - seg)
-                    pygame.draw.circle(screen, (0, 200 - seg * 15, 0), (sx, sy), size)
-                    pygame.draw.circle(screen, DARK_GREEN, (int(px), int(py)), size - 3)
+                    pygame.draw.circle(surface, (0, 200 - seg * 15, 0), (sx, sy), size)
+                    pygame.draw.circle(surface, DARK_GREEN, (int(px), int(py)), size - 3)
             
             # Central dark vortex
             for ring in range(6):
                 r = int(15 + ring * 12 + progress * 25 - ring * 3)
                 if r > 0:
                     alpha = 255 - ring * 30
-                    vortex_surf = pygame.Surface((r * 2 + 4, r * 2 + 4), pygame.SRCALPHA)
+                    vortex_surf = get_surface_cache().scratch(r * 2 + 4, r * 2 + 4)
                     pygame.draw.circle(vortex_surf, (20, 50, 20, alpha), (r + 2, r + 2), r, 3)
-                    screen.blit(vortex_surf, (screen_x - r - 2, int(self.y) - 15 - r - 2))
+                    surface.blit(vortex_surf, (cx - r - 2, cy - 15 - r - 2))
             
             # Evil runes floating
             for i in range(4):
                 rune_angle = (i / 4) * math.pi * 2 + progress * 5
                 rune_dist = 70 + progress * 30
-                rx = screen_x + math.cos(rune_angle) * rune_dist
-                ry = int(self.y) - 15 + math.sin(rune_angle) * 20
+                rx = cx + math.cos(rune_angle) * rune_dist
+                ry = cy - 15 + math.sin(rune_angle) * 20
                 # Simple rune shape
-                pygame.draw.polygon(screen, (100, 200, 100), [
+                pygame.draw.polygon(surface, (100, 200, 100), [
                     (rx, ry - 8), (rx + 6, ry), (rx, ry + 8), (rx - 6, ry)
                 ], 2)
 
         elif self.effect_type == 'ground_slam':
             # HAGRID'S MIGHTY GROUND SLAM - Earthquake devastation
-            # Brown/orange flash on impact
-            if progress < 0.15:
-                flash_alpha = int(150 * (1 - progress / 0.15))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((139, 90, 43, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             shake_y = int(math.sin(progress * 50) * 8 * (1 - progress))
             
             # MASSIVE shockwave on ground
@@ -753,74 +701,67 @@ class SpecialEffect:
                     thickness = max(2, 12 - ring * 3)
                     alpha = max(0, 200 - ring * 40 - int(progress * 80))
                     # Elliptical shockwave (ground level)
-                    ring_surf = pygame.Surface((r * 2 + 20, r + 20), pygame.SRCALPHA)
+                    ring_surf = get_surface_cache().scratch(r * 2 + 20, r + 20)
                     pygame.draw.ellipse(ring_surf, (139, 90, 43, alpha), (10, 5, r * 2, r // 2), thickness)
-                    screen.blit(ring_surf, (screen_x - r - 10, int(self.y) - r // 4 + shake_y))
+                    surface.blit(ring_surf, (cx - r - 10, cy - r // 4 + shake_y))
             
             # Deep ground cracks radiating outward
             for i in range(12):
                 crack_angle = (i / 12) * math.pi * 2
                 crack_len = int(progress * 180)
-                points = [(screen_x, int(self.y) + shake_y)]
+                points = [(cx, cy + shake_y)]
                 for seg in range(8):
                     dist = (seg + 1) * crack_len / 8
                     jitter_x = random.randint(-12, 12)
                     jitter_y = random.randint(-6, 6)
-                    cx = screen_x + int(math.cos(crack_angle) * dist) + jitter_x
-                    cy = int(self.y) + int(math.sin(crack_angle) * dist * 0.25) + jitter_y + shake_y
-                    points.append((cx, cy))
+                    crack_x = cx + int(math.cos(crack_angle) * dist) + jitter_x
+                    crack_y = cy + int(math.sin(crack_angle) * dist * 0.25) + jitter_y + shake_y
+                    points.append((crack_x, crack_y))
                 if len(points) > 1:
-                    pygame.draw.lines(screen, (40, 25, 15), False, points, 5)
-                    pygame.draw.lines(screen, (80, 50, 30), False, points, 3)
-                    pygame.draw.lines(screen, (120, 80, 40), False, points, 1)
+                    pygame.draw.lines(surface, (40, 25, 15), False, points, 5)
+                    pygame.draw.lines(surface, (80, 50, 30), False, points, 3)
+                    pygame.draw.lines(surface, (120, 80, 40), False, points, 1)
             
             # Flying boulders
             for i in range(15):
                 angle = (i / 15) * math.pi * 2
                 dist = 40 + progress * 120
                 height = int(math.sin(progress * math.pi) * (80 + i * 5))
-                bx = screen_x + int(math.cos(angle) * dist)
-                by = int(self.y) - height + int(math.sin(angle) * dist * 0.2) + shake_y
+                bx = cx + int(math.cos(angle) * dist)
+                by = cy - height + int(math.sin(angle) * dist * 0.2) + shake_y
                 size = 8 + (i % 6) * 3
                 # 3D rock shape
-                pygame.draw.circle(screen, (80, 60, 40), (bx + 2, by + 2), size)  # Shadow
-                pygame.draw.circle(screen, (139, 110, 70), (bx, by), size)
-                pygame.draw.circle(screen, (180, 150, 100), (bx - 2, by - 2), size // 2)  # Highlight
+                pygame.draw.circle(surface, (80, 60, 40), (bx + 2, by + 2), size)  # Shadow
+                pygame.draw.circle(surface, (139, 110, 70), (bx, by), size)
+                pygame.draw.circle(surface, (180, 150, 100), (bx - 2, by - 2), size // 2)  # Highlight
             
             # Hagrid fist imprint at center
             fist_size = int(50 * min(1, progress * 3))
-            pygame.draw.ellipse(screen, (60, 40, 20), 
-                              (screen_x - fist_size, int(self.y) - fist_size // 3 + shake_y, fist_size * 2, fist_size))
-            pygame.draw.ellipse(screen, (40, 25, 10), 
-                              (screen_x - fist_size, int(self.y) - fist_size // 3 + shake_y, fist_size * 2, fist_size), 3)
+            pygame.draw.ellipse(surface, (60, 40, 20), 
+                              (cx - fist_size, cy - fist_size // 3 + shake_y, fist_size * 2, fist_size))
+            pygame.draw.ellipse(surface, (40, 25, 10), 
+                              (cx - fist_size, cy - fist_size // 3 + shake_y, fist_size * 2, fist_size), 3)
             
             # Dust clouds
             for i in range(5):
-                dust_x = screen_x + (i - 2) * 60
+                dust_x = cx + (i - 2) * 60
                 dust_size = int(40 + progress * 50)
                 dust_alpha = int(120 * (1 - progress * 0.8))
-                dust_surf = pygame.Surface((dust_size * 2, dust_size), pygame.SRCALPHA)
+                dust_surf = get_surface_cache().scratch(dust_size * 2, dust_size)
                 pygame.draw.ellipse(dust_surf, (180, 160, 130, dust_alpha), (0, 0, dust_size * 2, dust_size))
-                screen.blit(dust_surf, (dust_x - dust_size, int(self.y) - dust_size // 2 - int(progress * 30) + shake_y))
+                surface.blit(dust_surf, (dust_x - dust_size, cy - dust_size // 2 - int(progress * 30) + shake_y))
 
         elif self.effect_type == 'heal_aura':
             # UNICORN'S RAINBOW BURST - Magical healing aurora
-            # Rainbow flash
-            if progress < 0.2:
-                flash_alpha = int(120 * (1 - progress / 0.2))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((255, 200, 255, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             # Multiple rainbow rings expanding outward
             rainbow_colors = [(255, 0, 0), (255, 127, 0), (255, 255, 0), (0, 255, 0), (0, 0, 255), (75, 0, 130), (148, 0, 211)]
             for i, color in enumerate(rainbow_colors):
                 ring_r = int(20 + progress * 150 - i * 15)
                 if ring_r > 5:
                     alpha = max(0, 200 - int(progress * 100))
-                    ring_surf = pygame.Surface((ring_r * 2 + 20, ring_r * 2 + 20), pygame.SRCALPHA)
+                    ring_surf = get_surface_cache().scratch(ring_r * 2 + 20, ring_r * 2 + 20)
                     pygame.draw.circle(ring_surf, (*color, alpha), (ring_r + 10, ring_r + 10), ring_r, 4)
-                    screen.blit(ring_surf, (screen_x - ring_r - 10, int(self.y) - 30 - ring_r - 10))
+                    surface.blit(ring_surf, (cx - ring_r - 10, cy - 30 - ring_r - 10))
             
             # Central unicorn horn glow
             horn_glow = int(40 * (1 + math.sin(progress * 15) * 0.3))
@@ -828,30 +769,29 @@ class SpecialEffect:
                 layer_size = horn_glow - layer * 6
                 if layer_size > 0:
                     alpha = 255 - layer * 40
-                    glow_surf = pygame.Surface((layer_size * 2, layer_size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (255, 255, 255, alpha), (layer_size, layer_size), layer_size)
-                    screen.blit(glow_surf, (screen_x - layer_size, int(self.y) - 50 - layer_size))
+                    get_surface_cache().draw_glow(surface, (cx, cy - 50), layer_size,
+                                                  (255, 255, 255), alpha)
             
             # Spiral rainbow sparkles rising
             for i in range(20):
                 sparkle_angle = (i / 20) * math.pi * 6 + progress * 8
                 sparkle_dist = 30 + (i / 20) * 60 * progress
                 sparkle_height = int(i * 8 * progress)
-                sx = screen_x + int(math.cos(sparkle_angle) * sparkle_dist)
-                sy = int(self.y) - 30 - sparkle_height
+                sx = cx + int(math.cos(sparkle_angle) * sparkle_dist)
+                sy = cy - 30 - sparkle_height
                 color = rainbow_colors[i % len(rainbow_colors)]
-                pygame.draw.circle(screen, color, (sx, sy), 5)
-                pygame.draw.circle(screen, WHITE, (sx, sy), 2)
+                pygame.draw.circle(surface, color, (sx, sy), 5)
+                pygame.draw.circle(surface, WHITE, (sx, sy), 2)
             
             # Healing hearts floating up
             for i in range(6):
-                heart_x = screen_x + int(math.sin(progress * 5 + i * 1.5) * 50)
-                heart_y = int(self.y) - 20 - int(progress * 100) - i * 25
+                heart_x = cx + int(math.sin(progress * 5 + i * 1.5) * 50)
+                heart_y = cy - 20 - int(progress * 100) - i * 25
                 heart_size = 8
                 # Simple heart shape
-                pygame.draw.circle(screen, (255, 150, 200), (heart_x - heart_size // 2, heart_y), heart_size // 2)
-                pygame.draw.circle(screen, (255, 150, 200), (heart_x + heart_size // 2, heart_y), heart_size // 2)
-                pygame.draw.polygon(screen, (255, 150, 200), [
+                pygame.draw.circle(surface, (255, 150, 200), (heart_x - heart_size // 2, heart_y), heart_size // 2)
+                pygame.draw.circle(surface, (255, 150, 200), (heart_x + heart_size // 2, heart_y), heart_size // 2)
+                pygame.draw.polygon(surface, (255, 150, 200), [
                     (heart_x - heart_size, heart_y), (heart_x, heart_y + heart_size), (heart_x + heart_size, heart_y)
                 ])
             
@@ -859,38 +799,27 @@ class SpecialEffect:
             for i in range(8):
                 star_angle = (i / 8) * math.pi * 2 + progress * 3
                 star_dist = 60 + progress * 50
-                star_x = screen_x + int(math.cos(star_angle) * star_dist)
-                star_y = int(self.y) - 30 + int(math.sin(star_angle) * star_dist * 0.4)
+                star_x = cx + int(math.cos(star_angle) * star_dist)
+                star_y = cy - 30 + int(math.sin(star_angle) * star_dist * 0.4)
                 # 4-point star
                 star_size = 8
-                pygame.draw.polygon(screen, (255, 255, 200), [
+                pygame.draw.polygon(surface, (255, 255, 200), [
                     (star_x, star_y - star_size), (star_x + 2, star_y - 2),
                     (star_x + star_size, star_y), (star_x + 2, star_y + 2),
                     (star_x, star_y + star_size), (star_x - 2, star_y + 2),
                     (star_x - star_size, star_y), (star_x - 2, star_y - 2)
                 ])
-                pygame.draw.circle(screen, WHITE, (star_x, star_y), 3)
+                pygame.draw.circle(surface, WHITE, (star_x, star_y), 3)
 
         elif self.effect_type == 'fire_breath':
             # DRAGON'S FIRE BREATH - Massive cone of dragonfire
-            direction = self.owner.direction
-            
-            # Orange/red heat flash
-            if progress < 0.15:
-                flash_alpha = int(100 * (1 - progress / 0.15))
-                flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surf.fill((255, 100, 0, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
-            
             # Smoke cloud behind the flames
             for i in range(8):
-                smoke_x = screen_x + direction * (120 + i * 20 + progress * 40)
-                smoke_y = int(self.y) + random.randint(-30, 30) - int(progress * 20)
+                smoke_x = cx + direction * (120 + i * 20 + progress * 40)
+                smoke_y = cy + random.randint(-30, 30) - int(progress * 20)
                 smoke_size = int(20 + i * 5 + progress * 15)
                 smoke_alpha = int(60 * (1 - progress * 0.5))
-                smoke_surf = pygame.Surface((smoke_size * 2, smoke_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(smoke_surf, (80, 80, 80, smoke_alpha), (smoke_size, smoke_size), smoke_size)
-                screen.blit(smoke_surf, (smoke_x - smoke_size, smoke_y - smoke_size))
+                get_surface_cache().draw_glow(surface, (smoke_x, smoke_y), smoke_size, (80, 80, 80), smoke_alpha)
             
             # Massive flame cone - multiple layers
             flame_length = int(180 * min(1, progress * 1.5))
@@ -898,55 +827,55 @@ class SpecialEffect:
             # Layer 1: Dark red base
             for i in range(25):
                 t = i / 25
-                cone_x = screen_x + direction * int(t * flame_length)
+                cone_x = cx + direction * int(t * flame_length)
                 spread = t * 60 * progress
                 wave = math.sin(i * 0.5 + progress * 20) * (10 + t * 20)
-                cone_y = int(self.y) + wave + (random.random() - 0.5) * spread * 2
+                cone_y = cy + wave + (random.random() - 0.5) * spread * 2
                 size = int(20 - t * 8 + random.random() * 8)
-                pygame.draw.circle(screen, (150, 30, 0), (cone_x, cone_y), size)
+                pygame.draw.circle(surface, (150, 30, 0), (cone_x, cone_y), size)
             
             # Layer 2: Orange flames
             for i in range(25):
                 t = i / 25
-                cone_x = screen_x + direction * int(t * flame_length * 0.9)
+                cone_x = cx + direction * int(t * flame_length * 0.9)
                 spread = t * 50 * progress
                 wave = math.sin(i * 0.6 + progress * 22 + 1) * (8 + t * 15)
-                cone_y = int(self.y) + wave + (random.random() - 0.5) * spread * 2
+                cone_y = cy + wave + (random.random() - 0.5) * spread * 2
                 size = int(16 - t * 6 + random.random() * 6)
-                pygame.draw.circle(screen, (255, 100, 0), (cone_x, cone_y), size)
+                pygame.draw.circle(surface, (255, 100, 0), (cone_x, cone_y), size)
             
             # Layer 3: Yellow/white hot core
             for i in range(20):
                 t = i / 20
-                cone_x = screen_x + direction * int(t * flame_length * 0.75)
+                cone_x = cx + direction * int(t * flame_length * 0.75)
                 spread = t * 30 * progress
                 wave = math.sin(i * 0.7 + progress * 25 + 2) * (5 + t * 10)
-                cone_y = int(self.y) + wave + (random.random() - 0.5) * spread
+                cone_y = cy + wave + (random.random() - 0.5) * spread
                 size = int(12 - t * 5 + random.random() * 4)
-                pygame.draw.circle(screen, (255, 200, 50), (cone_x, cone_y), size)
+                pygame.draw.circle(surface, (255, 200, 50), (cone_x, cone_y), size)
             
             # Layer 4: White-hot center line
             for i in range(15):
                 t = i / 15
-                cone_x = screen_x + direction * int(t * flame_length * 0.6)
+                cone_x = cx + direction * int(t * flame_length * 0.6)
                 wave = math.sin(i * 0.8 + progress * 28) * 5
-                cone_y = int(self.y) + wave
+                cone_y = cy + wave
                 size = int(8 - t * 4)
-                pygame.draw.circle(screen, (255, 255, 200), (cone_x, cone_y), size)
-                pygame.draw.circle(screen, WHITE, (cone_x, cone_y), max(2, size - 3))
+                pygame.draw.circle(surface, (255, 255, 200), (cone_x, cone_y), size)
+                pygame.draw.circle(surface, WHITE, (cone_x, cone_y), max(2, size - 3))
             
             # Rising flames - upward burst to hit flying enemies
             for i in range(10):
                 t = i / 10
-                rise_x = screen_x + direction * int(30 + t * flame_length * 0.6)
-                rise_y = int(self.y) - int(t * 80 * progress) - 20  # Rises upward
+                rise_x = cx + direction * int(30 + t * flame_length * 0.6)
+                rise_y = cy - int(t * 80 * progress) - 20  # Rises upward
                 wave_x = math.sin(i * 0.9 + progress * 15) * 15
                 size = int(14 - t * 8 + random.random() * 5)
                 # Gradient from orange at bottom to red at top
                 r = 255
                 g = int(150 - t * 100)
                 b = int(50 - t * 50)
-                pygame.draw.circle(screen, (r, max(0, g), max(0, b)), (rise_x + int(wave_x), rise_y), size)
+                pygame.draw.circle(surface, (r, max(0, g), max(0, b)), (rise_x + int(wave_x), rise_y), size)
             
             # Dragon mouth glow
             mouth_glow = int(25 + math.sin(progress * 20) * 10)
@@ -954,25 +883,23 @@ class SpecialEffect:
                 glow_size = mouth_glow - layer * 5
                 if glow_size > 0:
                     glow_color = [(255, 50, 0), (255, 150, 0), (255, 220, 100), WHITE][layer]
-                    pygame.draw.circle(screen, glow_color, (screen_x + direction * 10, int(self.y)), glow_size)
+                    pygame.draw.circle(surface, glow_color, (cx + direction * 10, cy), glow_size)
             
             # Ember particles flying off
             for i in range(12):
-                ember_x = screen_x + direction * (40 + random.random() * flame_length)
-                ember_y = int(self.y) + random.randint(-50, 50) - int(progress * 30)
+                ember_x = cx + direction * (40 + random.random() * flame_length)
+                ember_y = cy + random.randint(-50, 50) - int(progress * 30)
                 ember_size = random.randint(2, 5)
                 ember_color = random.choice([(255, 200, 0), (255, 150, 0), (255, 100, 0)])
-                pygame.draw.circle(screen, ember_color, (int(ember_x), int(ember_y)), ember_size)
+                pygame.draw.circle(surface, ember_color, (int(ember_x), int(ember_y)), ember_size)
             
             # Heat shimmer lines
             for i in range(6):
-                shimmer_x = screen_x + direction * (30 + i * 25)
-                shimmer_y = int(self.y) - 40 - int(progress * 20)
+                shimmer_x = cx + direction * (30 + i * 25)
+                shimmer_y = cy - 40 - int(progress * 20)
                 shimmer_len = 20 + random.randint(0, 15)
-                pygame.draw.line(screen, (255, 200, 150), 
+                pygame.draw.line(surface, (255, 200, 150), 
                                (shimmer_x, shimmer_y), (shimmer_x + random.randint(-5, 5), shimmer_y - shimmer_len), 2)
-            
-
 
 class Player:
     """Player class with Mario-style movement."""
@@ -986,7 +913,33 @@ class Player:
         "attack": [7, 8],
         "special": [9],
     }
+    SPRITE_FRAME_TIMES = {"idle": 350, "run": 90, "jump": 0, "attack": 100, "special": 150}
     SPRITE_CACHE = {}
+    SPRITE_CACHE_LEFT = {}  # Mirrored frames so drawing never flips per frame
+    FLYING_SPRITE_SUFFIX = '_flying'  # Cache key suffix for frames baked mid-flight
+
+    # Baked procedural frames are padded so wands, wings and fire fit inside
+    SPRITE_BAKE_PAD_X = 60
+    SPRITE_BAKE_PAD_Y = 24
+
+    # Melee swing effects are baked per character and facing, one frame per 60 Hz tick
+    MELEE_FLIPBOOK_STEPS = 18
+    MELEE_FLIPBOOK_CACHE = {}  # (name, color, w, h, facing_right) -> [frame, ...]
+    MELEE_RANGE = 70  # Increased from 50
+
+    # Special effect each character casts
+    SPECIAL_EFFECT_TYPES = {
+        'Harry': 'lightning',
+        'Ron': 'shockwave',
+        'Hermione': 'spell_burst',
+        'Voldemort': 'dark_magic',
+        'Hagrid': 'ground_slam',
+        'Unicorn': 'heal_aura',
+        'Dragon': 'fire_breath',
+    }
+
+    # Fixed tick value used while baking; None means use the live clock
+    _draw_ticks = None
 
     def __init__(self, player_num, character_name, start_x, start_y):
         self.player_num = player_num
@@ -1056,6 +1009,21 @@ class Player:
         # Unicorn healing
         self.heal_timer = 0
 
+        self._bake_effects()
+
+    def _bake_effects(self):
+        """Bake this character's special and melee flipbooks before play starts."""
+        effect_type = self.SPECIAL_EFFECT_TYPES.get(self.character.name)
+        if effect_type:
+            for direction in (1, -1):
+                SpecialEffect.get_flipbook(effect_type, direction)
+        if self.character.attack_type == 'melee':
+            facing_right = self.facing_right
+            for facing in (True, False):
+                self.facing_right = facing
+                self._get_melee_flipbook(self.MELEE_RANGE, self.rect.height + 20)
+            self.facing_right = facing_right
+
     def handle_input(self, keys):
         """Handle player input with Mario-style physics."""
 
@@ -1162,7 +1130,7 @@ class Player:
             self.attack_cooldown = int(ATTACK_COOLDOWN * 0.5)  # 50% faster
 
             # Melee attack - wider range to compensate for risk
-            melee_range = 70  # Increased from 50
+            melee_range = self.MELEE_RANGE
             melee_height = self.rect.height + 20  # Slightly taller hitbox
             if self.facing_right:
                 self.attack_rect = pygame.Rect(self.rect.right - 10, self.rect.top - 10, melee_range, melee_height)
@@ -1173,6 +1141,7 @@ class Player:
         """Character-specific special attack."""
         self.special_cooldown = SPECIAL_COOLDOWN
         name = self.character.name
+        get_tracer().instant('special_cast', player=self.player_num, character=name)
 
         if name == 'Harry':
             # Lightning Bolt - projectile + lightning area damage
@@ -1232,7 +1201,7 @@ class Player:
             )
 
     def update(self, platforms, dt):
-        """Update player physics."""
+        """Update player physics. platforms is the level's PlatformGrid."""
 
         # --- GRAVITY ---
         # Apply stronger gravity when falling for snappier feel
@@ -1318,7 +1287,7 @@ class Player:
 
         # Update projectiles
         for proj in self.projectiles[:]:
-            proj.update()
+            proj.update(dt)
             if not proj.active:
                 self.projectiles.remove(proj)
 
@@ -1346,7 +1315,8 @@ class Player:
 
     def check_horizontal_collisions(self, platforms):
         """Check horizontal collisions."""
-        for platform in platforms:
+        # Padded query so platforms reached after a push-back are still tested
+        for platform in platforms.query_rect(self.rect.inflate(64, 64)):
             if self.rect.colliderect(platform.rect):
                 if self.vel_x > 0:
                     self.rect.right = platform.rect.left
@@ -1360,7 +1330,7 @@ class Player:
     def check_vertical_collisions(self, platforms):
         """Check vertical collisions."""
         self.on_ground = False
-        for platform in platforms:
+        for platform in platforms.query_rect(self.rect.inflate(64, 64)):
             if self.rect.colliderect(platform.rect):
                 if self.vel_y > 0:  # Falling
                     self.rect.bottom = platform.rect.top
@@ -1411,7 +1381,8 @@ class Player:
             return True
         sheet_path = os.path.join(os.path.dirname(__file__), "assets", "characters", f"{name}_sheet.png")
         if not os.path.exists(sheet_path):
-            return False
+            self._bake_sprites()
+            return True
         sheet = pygame.image.load(sheet_path).convert_alpha()
         frames = []
         total_frames = sum(len(v) for v in self.SPRITE_FRAMES.values())
@@ -1421,8 +1392,48 @@ class Player:
             frame = pygame.transform.smoothscale(frame, (PLAYER_WIDTH, PLAYER_HEIGHT))
             frames.append(frame)
         self.SPRITE_CACHE[name] = frames
+        self.SPRITE_CACHE_LEFT[name] = [pygame.transform.flip(frame, True, False) for frame in frames]
         return True
 
+    def _bake_sprites(self):
+        """Render the procedural character into padded frames for every animation state."""
+        name = self.character.name.lower()
+        w, h = PLAYER_WIDTH, PLAYER_HEIGHT
+        pad_x, pad_y = self.SPRITE_BAKE_PAD_X, self.SPRITE_BAKE_PAD_Y
+        total_frames = sum(len(v) for v in self.SPRITE_FRAMES.values())
+
+        # A bare Player carries just the state the character painters read
+        pose = Player.__new__(Player)
+        pose.character = self.character
+
+        # Flyers get a second set, used while actually in flight (wings up, no legs)
+        for flying in ((False, True) if self.character.can_fly else (False,)):
+            pose.is_flying = flying
+            baked = {1: [None] * total_frames, -1: [None] * total_frames}
+            for state, frame_list in self.SPRITE_FRAMES.items():
+                pose.vel_x = 1.0 if state == "run" else 0.0
+                pose.on_ground = state != "jump" and not flying
+                pose.attacking = state in ("attack", "special")
+                for i, frame_index in enumerate(frame_list):
+                    pose._draw_ticks = i * self.SPRITE_FRAME_TIMES[state]
+                    for direction in (1, -1):
+                        pose.direction = direction
+                        frame = pygame.Surface((w + pad_x * 2, h + pad_y * 2), pygame.SRCALPHA)
+                        pose._draw_fallback(frame, pad_x, pad_y, w, h)
+                        if pygame.display.get_surface() is not None:
+                            frame = frame.convert_alpha()
+                        baked[direction][frame_index] = frame
+
+            key = name + self.FLYING_SPRITE_SUFFIX if flying else name
+            self.SPRITE_CACHE[key] = baked[1]
+            self.SPRITE_CACHE_LEFT[key] = baked[-1]
+
+    def _anim_ticks(self):
+        """Clock for the character painters (fixed while baking sprites)."""
+        if self._draw_ticks is not None:
+            return self._draw_ticks
+        return pygame.time.get_ticks()
+
     def _update_animation(self, dt):
         # Priority: special > attack > jump > run > idle
         if self.special_cooldown > SPECIAL_COOLDOWN - 300:
@@ -1441,15 +1452,8 @@ class Player:
             self.anim_timer = 0
             self.anim_index = 0
 
-        if state == "run":
-            frame_time = 90
-        elif state == "idle":
-            frame_time = 350
-        elif state == "attack":
-            frame_time = 100
-        elif state == "special":
-            frame_time = 150
-        else:
+        frame_time = self.SPRITE_FRAME_TIMES[state]
+        if not frame_time:
             return
 
         self.anim_timer += dt
@@ -1459,7 +1463,10 @@ class Player:
 
     def _get_current_frame(self):
         name = self.character.name.lower()
-        frames = self.SPRITE_CACHE.get(name, [])
+        cache = self.SPRITE_CACHE if self.facing_right else self.SPRITE_CACHE_LEFT
+        frames = cache.get(name + self.FLYING_SPRITE_SUFFIX) if self.is_flying else None
+        if not frames:
+            frames = cache.get(name, [])
         if not frames:
             return None
 
@@ -1472,12 +1479,34 @@ class Player:
 
     def _draw_melee_effect(self, screen, camera_x):
         """Draw character-specific melee attack effects."""
-        attack_screen_x = self.attack_rect.x - camera_x
-        attack_w = self.attack_rect.width
-        attack_h = self.attack_rect.height
         attack_progress = 1 - (self.attack_timer / ATTACK_DURATION) if ATTACK_DURATION > 0 else 1
-        
-        attack_surface = pygame.Surface((attack_w + 40, attack_h + 40), pygame.SRCALPHA)
+        frames = self._get_melee_flipbook(self.attack_rect.width, self.attack_rect.height)
+        step = max(0, min(len(frames) - 1, int(attack_progress * len(frames))))
+        screen.blit(frames[step], (self.attack_rect.x - camera_x - 20, self.attack_rect.y - 20))
+
+    def _get_melee_flipbook(self, attack_w, attack_h):
+        """Get (baking on first use) this character's swing frames for the current facing."""
+        key = (self.character.name, self.character.secondary_color, attack_w, attack_h, self.facing_right)
+        frames = self.MELEE_FLIPBOOK_CACHE.get(key)
+        if frames is not None:
+            return frames
+
+        rng_state = random.getstate()
+        random.seed(f"{self.character.name}:{self.facing_right}")
+        frames = []
+        for step in range(self.MELEE_FLIPBOOK_STEPS):
+            frame = pygame.Surface((attack_w + 40, attack_h + 40), pygame.SRCALPHA)
+            self._paint_melee_effect(frame, attack_w, attack_h, (step + 0.5) / self.MELEE_FLIPBOOK_STEPS)
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert_alpha()
+            frames.append(frame)
+        random.setstate(rng_state)
+
+        self.MELEE_FLIPBOOK_CACHE[key] = frames
+        return frames
+
+    def _paint_melee_effect(self, attack_surface, attack_w, attack_h, attack_progress):
+        """Paint one frame of the melee effect into a (w + 40, h + 40) surface."""
         center_x = 20 if self.facing_right else attack_w + 20
         center_y = attack_h // 2 + 20
         
@@ -1593,8 +1622,6 @@ class Player:
                 
                 rect = pygame.Rect(center_x - 30 - arc_offset, 20 - arc_offset, 60 + arc_offset * 2, attack_h + arc_offset * 2)
                 pygame.draw.arc(attack_surface, arc_col, rect, start_angle, end_angle, max(1, 6 - i * 2))
-        
-        screen.blit(attack_surface, (attack_screen_x - 20, self.attack_rect.y - 20))
 
     def _draw_fallback(self, screen, x, y, w, h):
         name = self.character.name
@@ -1630,8 +1657,10 @@ class Player:
             frame = self._get_current_frame()
             if frame:
                 sprite = frame
-                if not self.facing_right:
-                    sprite = pygame.transform.flip(sprite, True, False)
+                # Baked frames are padded around the player box; PNG frames are not
+                frame_w, frame_h = frame.get_size()
+                pad_x = (frame_w - w) // 2
+                pad_y = (frame_h - h) // 2
 
                 scale_x, scale_y = 1.0, 1.0
                 if self.jump_stretch > 0:
@@ -1640,14 +1669,14 @@ class Player:
                     scale_x, scale_y = 1.05, 0.92
 
                 if scale_x != 1.0 or scale_y != 1.0:
-                    new_w = max(1, int(w * scale_x))
-                    new_h = max(1, int(h * scale_y))
+                    new_w = max(1, int(frame_w * scale_x))
+                    new_h = max(1, int(frame_h * scale_y))
                     sprite = pygame.transform.smoothscale(sprite, (new_w, new_h))
                     draw_x = screen_x + (w - new_w) // 2
-                    draw_y = screen_y + (h - new_h)
+                    draw_y = screen_y + h - int((pad_y + h) * scale_y)
                 else:
-                    draw_x = screen_x
-                    draw_y = screen_y
+                    draw_x = screen_x - pad_x
+                    draw_y = screen_y - pad_y
 
                 screen.blit(sprite, (draw_x, draw_y))
             else:
@@ -1717,7 +1746,7 @@ class Player:
 
     def _draw_harry(self, screen, x, y, w, h):
         """Draw Harry Potter - chibi style with glasses, scar, Gryffindor robes."""
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
         dir = self.direction
         moving = abs(self.vel_x) > 0.5
         jumping = not self.on_ground
@@ -1932,7 +1961,7 @@ class Player:
 
     def _draw_ron(self, screen, x, y, w, h):
         """Draw Ron Weasley - chibi style with orange hair, freckles, Weasley sweater."""
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
         dir = self.direction
         moving = abs(self.vel_x) > 0.5
         jumping = not self.on_ground
@@ -1982,8 +2011,7 @@ class Player:
         pygame.draw.arc(screen, sweater_light, (body_x + body_w - 14, body_y + 6, 12, body_h - 12), -1.5, 1.5, 3)
 
         # "R" on sweater
-        font = pygame.font.Font(None, 18)
-        r_surf = font.render("R", True, (255, 210, 100))
+        r_surf = get_text_cache().render("R", 18, (255, 210, 100))
         screen.blit(r_surf, (body_x + body_w//2 - 5, body_y + body_h//2 - 6))
 
         pygame.draw.ellipse(screen, OUTLINE, (body_x, body_y, body_w, body_h), 3)
@@ -2103,7 +2131,7 @@ class Player:
         screen.blit(shadow_surf, (x - 4, y + h - 4))
 
         # Legs
-        leg_offset = int(math.sin(pygame.time.get_ticks() / 100) * 3) if moving else 0
+        leg_offset = int(math.sin(self._anim_ticks() / 100) * 3) if moving else 0
         pygame.draw.rect(screen, (50, 50, 60), (x + 12, y + 46 - leg_offset, 8, 18))
         pygame.draw.rect(screen, (50, 50, 60), (x + 28, y + 46 + leg_offset, 8, 18))
         pygame.draw.rect(screen, (30, 30, 35), (x + 12, y + 60 - leg_offset, 8, 6))
@@ -2184,7 +2212,7 @@ class Player:
         screen.blit(shadow_surf, (x - 5, y + h - 6))
 
         # Flowing dark robes
-        robe_sway = int(math.sin(pygame.time.get_ticks() / 200) * 3)
+        robe_sway = int(math.sin(self._anim_ticks() / 200) * 3)
         robe_points = [
             (x + 6, y + 24),
             (x + w - 6, y + 24),
@@ -2255,7 +2283,7 @@ class Player:
         """Draw Hagrid - the lovable half-giant gamekeeper."""
         dir = self.direction
         moving = abs(self.vel_x) > 0.5
-        t = pygame.time.get_ticks()
+        t = self._anim_ticks()
 
         # Large shadow for big character
         shadow_surf = pygame.Surface((w + 24, 14), pygame.SRCALPHA)
@@ -2430,7 +2458,7 @@ class Player:
         screen.blit(shadow_surf, (x, y + h - 4))
 
         # Legs with silver hooves - animated
-        leg_anim = math.sin(pygame.time.get_ticks() / 100) * 4 if moving else 0
+        leg_anim = math.sin(self._anim_ticks() / 100) * 4 if moving else 0
         for i, lx in enumerate([10, 20, w - 28, w - 18]):
             leg_y = y + h - 22 + (leg_anim if i % 2 == 0 else -leg_anim)
             pygame.draw.rect(screen, (250, 250, 255), (x + lx, leg_y, 8, 18))
@@ -2447,12 +2475,12 @@ class Player:
         mane_colors = [(255, 100, 150), (255, 200, 100), (150, 255, 150), (150, 200, 255), (200, 150, 255)]
         mane_x = x + w - 15 if dir > 0 else x + 5
         for i, color in enumerate(mane_colors):
-            wave = math.sin(pygame.time.get_ticks() / 200 + i) * 3
+            wave = math.sin(self._anim_ticks() / 200 + i) * 3
             pygame.draw.ellipse(screen, color, (mane_x - 5 + wave, y + 8 + i * 6, 14, 10))
 
         # Tail - flowing
         tail_x = x - 8 if dir > 0 else x + w
-        tail_wave = math.sin(pygame.time.get_ticks() / 150) * 5
+        tail_wave = math.sin(self._anim_ticks() / 150) * 5
         for i, color in enumerate(mane_colors):
             pygame.draw.ellipse(screen, color, (tail_x + tail_wave - i * dir * 3, y + 35 + i * 4, 12, 8))
 
@@ -2506,7 +2534,7 @@ class Player:
 
         # Tail - segmented with spikes
         tail_base_x = x - 5 if dir > 0 else x + w + 5
-        tail_wave = math.sin(pygame.time.get_ticks() / 150) * 8
+        tail_wave = math.sin(self._anim_ticks() / 150) * 8
         for i in range(4):
             segment_x = tail_base_x - (i * 10 + tail_wave * (i / 4)) * dir
             segment_y = y + 30 + i * 3
@@ -2519,7 +2547,7 @@ class Player:
 
         # Legs with claws
         if not is_flying:
-            leg_anim = math.sin(pygame.time.get_ticks() / 100) * 3 if moving else 0
+            leg_anim = math.sin(self._anim_ticks() / 100) * 3 if moving else 0
             # Back legs
             pygame.draw.ellipse(screen, (180, 40, 40), (x + 6, y + h - 20 - leg_anim, 14, 16))
             pygame.draw.ellipse(screen, (180, 40, 40), (x + w - 20, y + h - 20 + leg_anim, 14, 16))
@@ -2545,7 +2573,7 @@ class Player:
             pygame.draw.arc(screen, (210, 160, 100), (x + 16, y + 30 + i * 6, w - 32, 8), 0, 3.14, 1)
 
         # Wings - bat-like with membrane
-        wing_flap = math.sin(pygame.time.get_ticks() / 100) * 15 if is_flying else math.sin(pygame.time.get_ticks() / 300) * 5
+        wing_flap = math.sin(self._anim_ticks() / 100) * 15 if is_flying else math.sin(self._anim_ticks() / 300) * 5
         # Left wing
         wing_pts_l = [(x + 8, y + 20), (x - 25, y + 5 - wing_flap), (x - 30, y + 20 - wing_flap // 2), (x - 20, y + 35), (x + 4, y + 30)]
         pygame.draw.polygon(screen, (180, 80, 60), wing_pts_l)
@@ -2573,7 +2601,7 @@ class Player:
         pygame.draw.circle(screen, (60, 30, 30), (snout_x + 4, y + 14), 2)
         pygame.draw.circle(screen, (60, 30, 30), (snout_x + 10, y + 14), 2)
         # Smoke wisps
-        smoke_offset = math.sin(pygame.time.get_ticks() / 200) * 3
+        smoke_offset = math.sin(self._anim_ticks() / 200) * 3
         pygame.draw.circle(screen, (100, 100, 100), (snout_x + 7 + smoke_offset * dir, y + 8), 3)
         pygame.draw.circle(screen, (120, 120, 120), (snout_x + 10 + smoke_offset * dir * 1.5, y + 4), 2)
 
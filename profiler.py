@@ -0,0 +1,237 @@
+# Frame Profiler for Harry Potter Adventure
+# Times each stage of update and draw, with an in-game overlay and CSV dumps
+
+import time
+from collections import deque
+import pygame
+from settings import *
+from text_cache import get_text_cache
+from draw_counters import get_draw_counters, COUNTER_KINDS
+
+# Frames kept for averages, the sparkline and the worst-frame breakdown
+PROFILE_HISTORY = 240
+# The overlay is re-rendered this often, not every frame
+OVERLAY_REFRESH_MS = 250
+FRAME_BUDGET_MS = 1000 / FPS
+# Subsystems listed under the draw counts, busiest first
+OVERLAY_TOP_SUBSYSTEMS = 6
+
+# Stage order for the overlay and CSV columns
+UPDATE_STAGES = ('player_update', 'checkpoints', 'camera', 'level_update', 'particles',
+                 'enemy_update', 'combat', 'popups', 'hazards')
+DRAW_STAGES = ('background', 'decorations', 'platforms', 'level_items', 'enemies_draw',
+               'particles_draw', 'players_draw', 'popups_draw', 'hud')
+STAGES = UPDATE_STAGES + DRAW_STAGES
+
+
+class FrameProfiler:
+    """Lap timer for the stages of a frame. Off by default.
+
+    start() opens a lap; each mark(stage) charges the time since the last
+    start/mark to stage. Stages hit several times in one frame (several sim
+    steps) add up. When disabled mark() returns at once.
+
+    A frame's total counts work only: loop passes that draw nothing call
+    skip_frame(), which carries their work into the next drawn frame but
+    leaves out the clock.tick() sleep between passes.
+
+    Timing runs while the overlay is shown or while something else needs
+    the stage times (the hitch watchdog, the tracer); see set_watched().
+    While a tracer is attached every lap is also sent to it as a span.
+    """
+
+    def __init__(self, history=PROFILE_HISTORY):
+        self.enabled = False          # Stages are being timed
+        self.overlay_visible = False
+        self.watchers = set()  # Names of tools that need stages timed
+        self.trace = None  # Tracer receiving each lap as a span
+        self.frames = deque(maxlen=history)  # (total ms, {stage: ms})
+        self.current = {}
+        self.frame_start = None  # Start of the current loop pass
+        self.carried = None  # ms of work from skipped passes; None = no frame open
+        self.last = 0.0
+        self.overlay = None
+        self.overlay_time = 0
+
+    def toggle(self):
+        """Show or hide the overlay. Returns whether it is now shown."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.frames.clear()
+        self._update_enabled()
+        return self.overlay_visible
+
+    def set_watched(self, watcher, watched):
+        """Keep timing stages with the overlay hidden while watcher needs them."""
+        if watched:
+            self.watchers.add(watcher)
+        else:
+            self.watchers.discard(watcher)
+        self._update_enabled()
+
+    def _update_enabled(self):
+        enabled = self.overlay_visible or bool(self.watchers)
+        if enabled != self.enabled:
+            self.enabled = enabled
+            self.frames.clear()
+            self.frame_start = None
+            self.carried = None
+
+    @property
+    def last_frame(self):
+        """(total ms, {stage: ms}) of the most recent complete frame, or None."""
+        return self.frames[-1] if self.frames else None
+
+    def begin_frame(self):
+        """Start timing a loop pass (call after clock.tick)."""
+        if not self.enabled:
+            return
+        if self.carried is None:
+            self.carried = 0.0
+            self.current = {}
+        self.frame_start = time.perf_counter()
+
+    def skip_frame(self):
+        """End a loop pass that drew nothing; its work carries into the next frame."""
+        if not self.enabled or self.frame_start is None:
+            return
+        self.carried += (time.perf_counter() - self.frame_start) * 1000
+        self.frame_start = None
+
+    def start(self):
+        if self.enabled:
+            self.last = time.perf_counter()
+
+    def mark(self, stage):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[stage] = self.current.get(stage, 0.0) + (now - self.last) * 1000
+        if self.trace is not None:
+            self.trace.complete(stage, self.last, now)
+        self.last = now
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        total = self.carried + (time.perf_counter() - self.frame_start) * 1000
+        self.frames.append((total, self.current))
+        self.frame_start = None
+        self.carried = None
+
+    # === STATISTICS ===
+
+    def averages(self):
+        """Mean ms per stage over the history."""
+        if not self.frames:
+            return {}
+        sums = {}
+        for _, stages in self.frames:
+            for stage, ms in stages.items():
+                sums[stage] = sums.get(stage, 0.0) + ms
+        return {stage: ms / len(self.frames) for stage, ms in sums.items()}
+
+    def worst_frame(self):
+        """(total ms, {stage: ms}) of the slowest frame in the history."""
+        return max(self.frames, key=lambda frame: frame[0]) if self.frames else (0.0, {})
+
+    def dump_csv(self, path):
+        """Write one row per frame in the history: total then every stage, in ms."""
+        extra = sorted({s for _, stages in self.frames for s in stages} - set(STAGES))
+        columns = list(STAGES) + extra
+        with open(path, 'w') as f:
+            f.write(','.join(['frame', 'total_ms'] + columns) + '\n')
+            for i, (total, stages) in enumerate(self.frames):
+                row = [str(i), f"{total:.3f}"] + [f"{stages.get(s, 0.0):.3f}" for s in columns]
+                f.write(','.join(row) + '\n')
+        return path
+
+    # === OVERLAY ===
+
+    def draw_overlay(self, screen):
+        """Draw the overlay in the top-right corner, re-rendering it at most 4x a second."""
+        now = pygame.time.get_ticks()
+        if self.overlay is None or now - self.overlay_time >= OVERLAY_REFRESH_MS:
+            self.overlay = self._render_overlay()
+            self.overlay_time = now
+        screen.blit(self.overlay, (SCREEN_WIDTH - self.overlay.get_width() - 8, 8))
+
+    def _render_overlay(self):
+        font = get_text_cache().get_font(16)
+        averages = self.averages()
+        worst_total, worst = self.worst_frame()
+        stages = [s for s in STAGES if s in averages or s in worst]
+        stages += sorted(set(averages) - set(STAGES))
+
+        # Last frame's draw counts, when the draw counters are on (F5)
+        counters = get_draw_counters()
+        subsystems = []
+        if counters.enabled:
+            subsystems = sorted(counters.last_frame_subsystems.items(),
+                                key=lambda item: -item[1]['draw'] - item[1]['blit'])
+            subsystems = subsystems[:OVERLAY_TOP_SUBSYSTEMS]
+
+        line_h = 15
+        graph_h = 40
+        width = 250
+        height = 10 + line_h * (len(stages) + 3) + graph_h + 10
+        if counters.enabled:
+            height += line_h * (len(subsystems) + 2) + line_h // 2
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+
+        mean_total = sum(t for t, _ in self.frames) / len(self.frames) if self.frames else 0.0
+        y = 6
+        surf.blit(font.render(f"frame {mean_total:5.2f} ms avg  worst {worst_total:5.2f}",
+                              True, WHITE), (6, y))
+        y += line_h + 2
+        surf.blit(font.render("stage", True, GRAY), (6, y))
+        surf.blit(font.render("avg", True, GRAY), (150, y))
+        surf.blit(font.render("worst", True, GRAY), (200, y))
+        y += line_h
+        for stage in stages:
+            avg = averages.get(stage, 0.0)
+            color = YELLOW if worst.get(stage, 0.0) > FRAME_BUDGET_MS / 4 else WHITE
+            surf.blit(font.render(stage, True, color), (6, y))
+            surf.blit(font.render(f"{avg:5.2f}", True, color), (150, y))
+            surf.blit(font.render(f"{worst.get(stage, 0.0):5.2f}", True, color), (200, y))
+            y += line_h
+
+        # Sparkline of frame times, scaled so the budget sits mid-height
+        y += line_h // 2
+        scale = graph_h / (FRAME_BUDGET_MS * 2)
+        budget_y = y + graph_h - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surf, (0, 160, 0), (6, budget_y), (width - 6, budget_y))
+        for i, (total, _) in enumerate(self.frames):
+            x = 6 + i * (width - 12) // max(1, self.frames.maxlen)
+            bar = min(graph_h, int(total * scale))
+            color = RED if total > FRAME_BUDGET_MS else (120, 200, 255)
+            pygame.draw.line(surf, color, (x, y + graph_h), (x, y + graph_h - bar))
+
+        if counters.enabled:
+            y += graph_h + line_h // 2
+            last = counters.last_frame
+            surf.blit(font.render("  ".join(f"{kind} {last[kind]}" for kind in COUNTER_KINDS),
+                                  True, WHITE), (6, y))
+            y += line_h
+            surf.blit(font.render("subsystem", True, GRAY), (6, y))
+            surf.blit(font.render("draw", True, GRAY), (170, y))
+            surf.blit(font.render("blit", True, GRAY), (210, y))
+            y += line_h
+            for subsystem, counts in subsystems:
+                surf.blit(font.render(subsystem[-26:], True, WHITE), (6, y))
+                surf.blit(font.render(str(counts['draw']), True, WHITE), (170, y))
+                surf.blit(font.render(str(counts['blit']), True, WHITE), (210, y))
+                y += line_h
+        return surf
+
+
+# Global profiler instance
+profiler = None
+
+def get_profiler():
+    """Get or create the global frame profiler."""
+    global profiler
+    if profiler is None:
+        profiler = FrameProfiler()
+    return profiler
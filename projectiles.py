@@ -0,0 +1,230 @@
+# Projectile Engine for Harry Potter Adventure
+# Enemy and boss shots stored as parallel arrays and updated in bulk
+
+import pygame
+from settings import *
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - the engine falls back to plain lists
+    np = None
+
+# Starting number of slots; the engine doubles it when full
+PROJECTILE_CAPACITY = 256
+
+# Visual styles
+STYLE_BOLT = 0        # Enemy bolt tinted with the shooter's colour
+STYLE_DARK_ORB = 1    # Boss dark magic
+STYLE_SHOCKWAVE = 2   # Boss ground slam
+
+
+class ProjectileEngine:
+    """Struct-of-arrays store for enemy/boss projectiles.
+
+    Slots [0, count) are live. Integration, lifetime culling and the player
+    hit test run as whole-array passes when numpy is available.
+    """
+
+    FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'life')
+    INT_FIELDS = ('damage', 'half_size', 'style', 'owner', 'r', 'g', 'b')
+
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.count = 0
+        self.capacity = 0
+        self.sprites = {}  # (style, color) -> pre-rendered shot
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Create or grow the field arrays, keeping live slots."""
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+            old = getattr(self, name, None)
+            if np is not None:
+                dtype = np.float64 if name in self.FLOAT_FIELDS else np.int64
+                arr = np.zeros(capacity, dtype=dtype)
+                if old is not None:
+                    arr[:self.count] = old[:self.count]
+            else:
+                arr = [0.0 if name in self.FLOAT_FIELDS else 0] * capacity
+                if old is not None:
+                    arr[:self.count] = old[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, owner, x, y, vx, vy, life, damage, half_size=8,
+              style=STYLE_BOLT, color=(255, 100, 100)):
+        """Add a projectile. owner is any object; its shots can be dropped together."""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.damage[i] = damage
+        self.half_size[i] = half_size
+        self.style[i] = style
+        self.owner[i] = id(owner)
+        self.r[i], self.g[i], self.b[i] = color[:3]
+        self.count += 1
+
+    def update(self, dt):
+        """Move every shot one step and cull the expired ones."""
+        n = self.count
+        if n == 0:
+            return
+        if np is not None:
+            self.prev_x[:n] = self.x[:n]
+            self.prev_y[:n] = self.y[:n]
+            self.x[:n] += self.vx[:n]
+            self.y[:n] += self.vy[:n]
+            self.life[:n] -= dt
+            self._compact(self.life[:n] > 0)
+        else:
+            keep = []
+            for i in range(n):
+                self.prev_x[i] = self.x[i]
+                self.prev_y[i] = self.y[i]
+                self.x[i] += self.vx[i]
+                self.y[i] += self.vy[i]
+                self.life[i] -= dt
+                keep.append(self.life[i] > 0)
+            self._compact(keep)
+
+    def remove_owner(self, owner):
+        """Drop every shot fired by owner."""
+        n = self.count
+        if n == 0:
+            return
+        owner_id = id(owner)
+        if np is not None:
+            self._compact(self.owner[:n] != owner_id)
+        else:
+            self._compact([self.owner[i] != owner_id for i in range(n)])
+
+    def _compact(self, keep):
+        """Pack the slots where keep is true to the front, preserving fire order."""
+        n = self.count
+        if np is not None:
+            kept = int(np.count_nonzero(keep))
+            if kept == n:
+                return
+            for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+                arr = getattr(self, name)
+                arr[:kept] = arr[:n][keep]
+        else:
+            kept = 0
+            for i in range(n):
+                if keep[i]:
+                    if kept != i:
+                        for name in self.FLOAT_FIELDS + self.INT_FIELDS:
+                            arr = getattr(self, name)
+                            arr[kept] = arr[i]
+                    kept += 1
+        self.count = kept
+
+    def hit_players(self, players):
+        """Resolve shots against player rects.
+
+        Each shot hits at most one player - the first in players whose rect
+        it overlaps - and is removed. Returns [(player, damage), ...] in
+        fire order.
+        """
+        n = self.count
+        if n == 0 or not players:
+            return []
+
+        hits = []
+        if np is not None:
+            half = self.half_size[:n]
+            left = self.x[:n].astype(np.int64) - half  # int() truncation, as before
+            top = self.y[:n].astype(np.int64) - half
+            right = left + half * 2
+            bottom = top + half * 2
+            owner = np.full(n, -1, dtype=np.int64)
+            for p_index, player in enumerate(players):
+                rect = player.rect
+                mask = ((owner < 0) & (left < rect.right) & (right > rect.left) &
+                        (top < rect.bottom) & (bottom > rect.top))
+                owner[mask] = p_index
+            hit = np.flatnonzero(owner >= 0)
+            if len(hit) == 0:
+                return []
+            hits = [(players[owner[i]], int(self.damage[i])) for i in hit]
+            self._compact(owner < 0)
+        else:
+            keep = []
+            for i in range(n):
+                half = self.half_size[i]
+                left, top = int(self.x[i]) - half, int(self.y[i]) - half
+                target = None
+                for player in players:
+                    rect = player.rect
+                    if (left < rect.right and left + half * 2 > rect.left and
+                            top < rect.bottom and top + half * 2 > rect.top):
+                        target = player
+                        break
+                if target is not None:
+                    hits.append((target, self.damage[i]))
+                keep.append(target is None)
+            if hits:
+                self._compact(keep)
+        return hits
+
+    def _get_sprite(self, style, color):
+        """Pre-render a shot's concentric circles once per style and colour."""
+        key = (style, color)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        if style == STYLE_SHOCKWAVE:
+            rings = [(12, (150, 50, 150)), (8, (200, 100, 200))]
+        elif style == STYLE_DARK_ORB:
+            rings = [(14, (80, 40, 100)), (10, (150, 80, 180)), (5, (220, 150, 255))]
+        else:
+            glow = (color[0] // 2, color[1] // 2, color[2] // 2)
+            rings = [(10, glow), (7, color), (3, (255, 255, 200))]
+        radius = rings[0][0]
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        for r, ring_color in rings:
+            pygame.draw.circle(sprite, ring_color, (radius + 1, radius + 1), r)
+        self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, camera_x, alpha=1.0):
+        """Stamp every on-screen shot with one Surface.blits call.
+
+        alpha places shots between their previous and current step.
+        """
+        n = self.count
+        if n == 0:
+            return
+        if np is not None:
+            x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+            y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+            sx = (x - camera_x).astype(np.int64)
+            visible = np.flatnonzero((sx >= -20) & (sx <= SCREEN_WIDTH + 20))
+            sy = y.astype(np.int64)
+            indices = visible.tolist()
+            sx, sy = sx.tolist(), sy.tolist()
+        else:
+            x = [self.prev_x[i] + (self.x[i] - self.prev_x[i]) * alpha for i in range(n)]
+            y = [self.prev_y[i] + (self.y[i] - self.prev_y[i]) * alpha for i in range(n)]
+            sx = [int(x[i] - camera_x) for i in range(n)]
+            sy = [int(y[i]) for i in range(n)]
+            indices = [i for i in range(n) if -20 <= sx[i] <= SCREEN_WIDTH + 20]
+
+        batch = []
+        for i in indices:
+            sprite = self._get_sprite(int(self.style[i]), (int(self.r[i]), int(self.g[i]), int(self.b[i])))
+            offset = sprite.get_width() // 2
+            batch.append((sprite, (sx[i] - offset, sy[i] - offset)))
+        screen.blits(batch, doreturn=False)
+
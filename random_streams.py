@@ -0,0 +1,49 @@
+# Random Streams for Harry Potter Adventure
+# Seeded per-subsystem RNGs so a run can be reproduced from its seed
+
+import random
+
+
+class RandomStreams:
+    """Named random.Random instances all derived from one master seed.
+
+    Each gameplay subsystem draws from its own stream ('level', 'enemies',
+    'boss', 'particles'), so extra draws in one - or anything still using
+    the global random module for visuals - never shift another's sequence.
+    """
+
+    def __init__(self, seed=None):
+        self.streams = {}  # name -> random.Random
+        self.seed = None
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from seed (a fresh one if None). Returns the seed."""
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        for name, rng in self.streams.items():
+            rng.seed(f"{self.seed}:{name}")
+        return self.seed
+
+    def get(self, name):
+        """Get a subsystem's stream. The object stays valid across reseeds."""
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = random.Random(f"{self.seed}:{name}")
+            self.streams[name] = rng
+        return rng
+
+
+# Global random streams instance
+random_streams = None
+
+def get_random_streams():
+    """Get or create the global random streams."""
+    global random_streams
+    if random_streams is None:
+        random_streams = RandomStreams()
+    return random_streams
+
+
+def get_rng(name):
+    """Shortcut for get_random_streams().get(name)."""
+    return get_random_streams().get(name)
@@ -0,0 +1,153 @@
+# Input Replay for Harry Potter Adventure
+# Records the keys held on every sim step and plays them back deterministically
+#
+# File layout (little-endian):
+#   magic 'HPAR', version u8, seed u64, level u8, difficulty str, characters u8 + str each
+#   step count varint, then (steps since last change varint, key mask varint) pairs
+# Strings are a u8 length followed by UTF-8 bytes.
+
+import struct
+from settings import *
+from player import PressedKeys
+
+REPLAY_MAGIC = b'HPAR'
+REPLAY_VERSION = 1
+
+# Keys that can affect gameplay, one bit each in the recorded mask
+RECORDED_KEYS = tuple(PLAYER1_CONTROLS.values()) + tuple(PLAYER2_CONTROLS.values())
+
+
+def keys_to_mask(keys):
+    """Pack the recorded keys held in a get_pressed()-style state into bits."""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_to_keys(mask):
+    """Unpack a key mask into a PressedKeys state."""
+    return PressedKeys(key for bit, key in enumerate(RECORDED_KEYS) if mask >> bit & 1)
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_str(out, text):
+    raw = text.encode('utf-8')
+    out.append(len(raw))
+    out += raw
+
+
+def _read_str(data, pos):
+    length = data[pos]
+    return data[pos + 1:pos + 1 + length].decode('utf-8'), pos + 1 + length
+
+
+class InputRecording:
+    """One run's key mask per sim step, plus the settings needed to restart it."""
+
+    def __init__(self, seed, level, difficulty, characters, masks=None):
+        self.seed = seed
+        self.level = level
+        self.difficulty = difficulty
+        self.characters = list(characters)
+        self.masks = masks if masks is not None else []
+
+    def __len__(self):
+        return len(self.masks)
+
+    def record(self, keys):
+        """Append this step's key state."""
+        self.masks.append(keys_to_mask(keys))
+
+    def to_bytes(self):
+        out = bytearray(REPLAY_MAGIC)
+        out += struct.pack('<BQB', REPLAY_VERSION, self.seed, self.level)
+        _write_str(out, self.difficulty)
+        out.append(len(self.characters))
+        for name in self.characters:
+            _write_str(out, name)
+
+        # Held keys rarely change between steps: store only the changes
+        _write_varint(out, len(self.masks))
+        previous, since = 0, 0
+        for mask in self.masks:
+            if mask != previous:
+                _write_varint(out, since)
+                _write_varint(out, mask)
+                previous, since = mask, 0
+            since += 1
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != REPLAY_MAGIC:
+            raise ValueError("not a replay file")
+        version, seed, level = struct.unpack_from('<BQB', data, 4)
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+        pos = 4 + struct.calcsize('<BQB')
+        difficulty, pos = _read_str(data, pos)
+        count = data[pos]
+        pos += 1
+        characters = []
+        for _ in range(count):
+            name, pos = _read_str(data, pos)
+            characters.append(name)
+
+        steps, pos = _read_varint(data, pos)
+        masks = []
+        previous = 0
+        while pos < len(data):
+            since, pos = _read_varint(data, pos)
+            mask, pos = _read_varint(data, pos)
+            masks.extend([previous] * since)
+            previous = mask
+        masks.extend([previous] * (steps - len(masks)))
+        return cls(seed, level, difficulty, characters, masks)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayDriver:
+    """Feeds a recording's key states back one sim step at a time."""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.step = 0
+
+    @property
+    def finished(self):
+        return self.step >= len(self.recording)
+
+    def next_keys(self):
+        """Key state for the next sim step, or None once the recording is used up."""
+        if self.finished:
+            return None
+        keys = mask_to_keys(self.recording.masks[self.step])
+        self.step += 1
+        return keys
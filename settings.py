@@ -5,9 +5,23 @@ import pygame
 # Screen settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
-FPS = 60
+FPS = 60  # Simulation steps per second
 TITLE = "Harry Potter Adventure"
 
+# Frame timing: the simulation runs in fixed steps and rendering is
+# interpolated between them, so the render rate can differ from FPS
+SIM_STEP_MS = 1000 / FPS
+RENDER_FPS = 144             # Render cap (0 = uncapped)
+MAX_SIM_STEPS_PER_FRAME = 5  # Catch-up steps per frame; the rest carries over
+MAX_FRAME_SKIP = 4           # Renders dropped in a row while behind
+MAX_FRAME_MS = 250           # Longer stalls are clamped, not replayed
+
+# Hitch watchdog (--watch-hitches / F6): frames slower than this are captured to disk
+HITCH_THRESHOLD_MS = 25
+HITCH_DIR = 'hitches'
+HITCH_COOLDOWN_MS = 1000   # Minimum gap between captures
+HITCH_INPUT_SECONDS = 3    # Input history saved with each capture
+
 # Level settings (much larger than screen for scrolling)
 LEVEL_WIDTH = 7000  # Longer level for story-driven gameplay
 LEVEL_HEIGHT = 768
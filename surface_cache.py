@@ -0,0 +1,139 @@
+# Surface Cache for Harry Potter Adventure
+# Reusable SRCALPHA scratch surfaces, pre-rendered soft glows and flash overlays
+
+import pygame
+from collections import OrderedDict
+
+# Distinct scratch sizes / glow textures kept alive at once
+SCRATCH_POOL_SIZE = 64
+GLOW_CACHE_SIZE = 256
+# Glow alphas are rounded to this step so pulsing glows share textures
+GLOW_ALPHA_STEP = 8
+
+
+class SurfaceCache:
+    """Scratch surfaces keyed by size plus a cache of radial glow textures."""
+
+    def __init__(self):
+        self.scratch_surfaces = OrderedDict()  # (w, h) -> Surface
+        self.glows = OrderedDict()  # (radius, color, alpha, layers) -> Surface
+        self.tints = {}  # (w, h, rgba) -> Surface
+        self.flashes = {}  # (w, h, rgb) -> opaque Surface
+        self.allocations = 0
+
+    def scratch(self, width, height):
+        """Get a cleared SRCALPHA surface of the given size.
+
+        The surface is shared: draw into it and blit it before asking for
+        another scratch surface of the same size.
+        """
+        key = (max(1, int(width)), max(1, int(height)))
+        surf = self.scratch_surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface(key, pygame.SRCALPHA)
+            self.allocations += 1
+            self.scratch_surfaces[key] = surf
+            if len(self.scratch_surfaces) > SCRATCH_POOL_SIZE:
+                self.scratch_surfaces.popitem(last=False)
+        else:
+            self.scratch_surfaces.move_to_end(key)
+            surf.set_alpha(255)  # set_alpha(None) would drop per-pixel alpha
+            surf.fill((0, 0, 0, 0))
+        return surf
+
+    def glow(self, radius, color, alpha, layers=()):
+        """Get a (2*radius)^2 texture with a translucent disc centred in it.
+
+        layers is a sequence of (radius, color, alpha) discs painted over the
+        base disc, matching the old draw-circles-into-a-temp-surface glows.
+        """
+        radius = max(1, int(radius))
+        alpha = self._quantize_alpha(alpha)
+        layers = tuple((int(r), tuple(c[:3]), self._quantize_alpha(a)) for r, c, a in layers)
+        key = (radius, tuple(color[:3]), alpha, layers)
+
+        surf = self.glows.get(key)
+        if surf is not None:
+            self.glows.move_to_end(key)
+            return surf
+
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.allocations += 1
+        pygame.draw.circle(surf, (*key[1], alpha), (radius, radius), radius)
+        for layer_radius, layer_color, layer_alpha in layers:
+            pygame.draw.circle(surf, (*layer_color, layer_alpha), (radius, radius), layer_radius)
+        self.glows[key] = surf
+        if len(self.glows) > GLOW_CACHE_SIZE:
+            self.glows.popitem(last=False)
+        return surf
+
+    def draw_glow(self, screen, center, radius, color, alpha, layers=()):
+        """Blit a cached glow centred at center."""
+        surf = self.glow(radius, color, alpha, layers)
+        r = surf.get_width() // 2
+        return screen.blit(surf, (int(center[0]) - r, int(center[1]) - r))
+
+    def tint(self, width, height, rgba):
+        """Get a cached surface filled with a constant translucent colour."""
+        key = (int(width), int(height), tuple(rgba))
+        surf = self.tints.get(key)
+        if surf is None:
+            surf = pygame.Surface(key[:2], pygame.SRCALPHA)
+            self.allocations += 1
+            surf.fill(key[2])
+            self.tints[key] = surf
+        return surf
+
+    def draw_flash(self, screen, color, alpha):
+        """Wash the whole screen with a colour, as a translucent full-screen fill would.
+
+        One opaque surface is kept per colour and blended with surface alpha
+        (quantized like glows), so flashes never allocate per frame.
+        """
+        alpha = self._quantize_alpha(alpha)
+        if alpha <= 0:
+            return None
+        key = (*screen.get_size(), tuple(color[:3]))
+        surf = self.flashes.get(key)
+        if surf is None:
+            surf = pygame.Surface(key[:2])
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            self.allocations += 1
+            surf.fill(key[2])
+            self.flashes[key] = surf
+        surf.set_alpha(alpha)
+        return screen.blit(surf, (0, 0))
+
+    def clear(self):
+        """Drop all pooled and cached surfaces."""
+        self.scratch_surfaces.clear()
+        self.glows.clear()
+        self.tints.clear()
+        self.flashes.clear()
+
+    def get_stats(self):
+        """Cache usage summary for debugging and profiling."""
+        return {
+            'scratch': len(self.scratch_surfaces),
+            'glows': len(self.glows),
+            'tints': len(self.tints),
+            'flashes': len(self.flashes),
+            'allocations': self.allocations,
+        }
+
+    @staticmethod
+    def _quantize_alpha(alpha):
+        alpha = max(0, min(255, int(alpha)))
+        return min(255, (alpha + GLOW_ALPHA_STEP // 2) // GLOW_ALPHA_STEP * GLOW_ALPHA_STEP)
+
+
+# Global surface cache instance
+surface_cache = None
+
+def get_surface_cache():
+    """Get or create the global surface cache."""
+    global surface_cache
+    if surface_cache is None:
+        surface_cache = SurfaceCache()
+    return surface_cache
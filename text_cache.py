@@ -0,0 +1,138 @@
+# Text Rendering Cache for Harry Potter Adventure
+# Shares one Font per size and keeps rendered strings in an LRU cache
+
+import pygame
+from collections import OrderedDict
+
+# Budget for cached text surfaces (bytes of pixel data)
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+class TextCache:
+    """Pooled fonts plus an LRU cache of rendered text surfaces."""
+
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.fonts = {}  # size -> Font
+        self.surfaces = OrderedDict()  # (text, font, color, ...) -> Surface
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0  # Actual font.render calls
+
+    def get_font(self, size):
+        """Get the shared default font at a given size."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, font, color, antialias=True):
+        """Render text once and reuse it. font may be a Font or a pooled size.
+
+        The returned surface is shared - blit it, don't modify it.
+        """
+        if isinstance(font, int):
+            font = self.get_font(font)
+        key = (text, font, tuple(color), antialias)
+
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        self.renders += 1
+        surf = font.render(text, antialias, color)
+        self._store(key, surf)
+        return surf
+
+    def render_outlined(self, text, font, color, outline_color, thickness=2, diagonals=True):
+        """Compose outline and fill into one cached surface.
+
+        The outline is the text stamped at +/-thickness around the fill (8
+        neighbours, or 4 with diagonals=False), so the result is padded by
+        thickness on every side.
+        """
+        if isinstance(font, int):
+            font = self.get_font(font)
+        key = ('outlined', text, font, tuple(color), tuple(outline_color), thickness, diagonals)
+
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        # Intermediates go straight to the font; only the composed result is cached
+        fill = font.render(text, True, color)
+        outline = font.render(text, True, outline_color)
+        self.renders += 2
+        t = thickness
+        surf = pygame.Surface((fill.get_width() + t * 2, fill.get_height() + t * 2), pygame.SRCALPHA)
+        if diagonals:
+            offsets = [(dx, dy) for dx in (-t, 0, t) for dy in (-t, 0, t) if dx or dy]
+        else:
+            offsets = [(-t, 0), (t, 0), (0, -t), (0, t)]
+        for dx, dy in offsets:
+            surf.blit(outline, (t + dx, t + dy))
+        surf.blit(fill, (t, t))
+
+        self.misses += 1
+        self._store(key, surf)
+        return surf
+
+    def draw(self, screen, text, font, color, pos, alpha=255, antialias=True):
+        """Blit cached text at pos, optionally faded. Returns the blitted rect."""
+        surf = self.render(text, font, color, antialias)
+        return self.draw_surface(screen, surf, pos, alpha)
+
+    def draw_surface(self, screen, surf, pos, alpha=255):
+        """Blit a shared cached surface with a temporary alpha."""
+        if alpha >= 255:
+            return screen.blit(surf, pos)
+        surf.set_alpha(max(0, int(alpha)))
+        rect = screen.blit(surf, pos)
+        surf.set_alpha(255)  # set_alpha(None) would drop per-pixel alpha
+        return rect
+
+    def clear(self):
+        """Drop all cached text surfaces (fonts stay pooled)."""
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+    def get_stats(self):
+        """Cache usage summary for debugging and profiling."""
+        return {
+            'entries': len(self.surfaces),
+            'bytes': self.used_bytes,
+            'fonts': len(self.fonts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'renders': self.renders,
+        }
+
+    def _store(self, key, surf):
+        """Insert a surface and evict least-recently-used ones over budget."""
+        self.surfaces[key] = surf
+        self.used_bytes += self._surface_bytes(surf)
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(old)
+
+    @staticmethod
+    def _surface_bytes(surf):
+        return surf.get_pitch() * surf.get_height()
+
+
+# Global text cache instance
+text_cache = None
+
+def get_text_cache():
+    """Get or create the global text cache."""
+    global text_cache
+    if text_cache is None:
+        text_cache = TextCache()
+    return text_cache
@@ -0,0 +1,97 @@
+# Fixed Timestep for Harry Potter Adventure
+# Fixed-rate simulation clock, render interpolation and a frame-skip governor
+
+from settings import *
+
+
+class FixedTimestep:
+    """Turns variable frame times into whole simulation steps of SIM_STEP_MS.
+
+    Sim steps are never dropped: time the loop could not simulate this frame
+    stays in the accumulator. When the machine falls behind, the governor
+    skips renders instead, forcing one through every MAX_FRAME_SKIP frames.
+    """
+
+    def __init__(self, step_ms=SIM_STEP_MS, max_steps=MAX_SIM_STEPS_PER_FRAME,
+                 max_frame_skip=MAX_FRAME_SKIP, max_frame_ms=MAX_FRAME_MS):
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.max_frame_skip = max_frame_skip
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+        self.skipped = 0           # Renders skipped in a row
+        self.total_steps = 0
+        self.total_skipped = 0
+
+    def reset(self):
+        """Forget pending time (after a level load or other long stall)."""
+        self.accumulator = 0.0
+        self.skipped = 0
+
+    def advance(self, frame_ms):
+        """Add a frame's real time and return how many sim steps to run now."""
+        # A long stall (window drag, breakpoint) is clamped rather than replayed
+        self.accumulator += min(frame_ms, self.max_frame_ms)
+        steps = min(int(self.accumulator // self.step_ms), self.max_steps)
+        self.accumulator -= steps * self.step_ms
+        # Backlog beyond one clamped frame can never be caught up; let it go
+        self.accumulator = min(self.accumulator, self.max_frame_ms)
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the render sits between the last two sim states (0..1)."""
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def should_render(self):
+        """Frame-skip governor: drop this render if a full step is still owed."""
+        if self.accumulator >= self.step_ms and self.skipped < self.max_frame_skip:
+            self.skipped += 1
+            self.total_skipped += 1
+            return False
+        self.skipped = 0
+        return True
+
+
+class RenderInterpolator:
+    """Blends drawn positions between the previous and current sim step.
+
+    capture() records positions before a step; apply() moves objects to the
+    blended position for drawing and restore() puts the sim values back.
+    """
+
+    # Moves longer than this in one step (respawns, teleports) are not blended
+    SNAP_DISTANCE = 200
+
+    def __init__(self):
+        self.previous = {}  # (id(obj), attr) -> (obj, value)
+        self.applied = []   # (obj, attr, sim value) to restore after drawing
+
+    def capture(self, targets):
+        """Record (obj, attrs) positions as the previous sim state."""
+        previous = {}
+        for obj, attrs in targets:
+            for attr in attrs:
+                previous[(id(obj), attr)] = (obj, getattr(obj, attr))
+        self.previous = previous
+
+    def apply(self, targets, alpha):
+        """Move targets to their interpolated positions."""
+        for obj, attrs in targets:
+            for attr in attrs:
+                entry = self.previous.get((id(obj), attr))
+                if entry is None or entry[0] is not obj:
+                    continue  # Spawned this step - draw where it is
+                before = entry[1]
+                current = getattr(obj, attr)
+                if abs(current - before) > self.SNAP_DISTANCE:
+                    continue
+                self.applied.append((obj, attr, current))
+                setattr(obj, attr, before + (current - before) * alpha)
+
+    def restore(self):
+        """Put back the sim positions changed by apply()."""
+        for obj, attr, value in reversed(self.applied):
+            setattr(obj, attr, value)
+        self.applied.clear()
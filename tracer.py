@@ -0,0 +1,175 @@
+# Frame Tracer for Harry Potter Adventure
+# Streams frame spans and game events to a trace-event JSON file
+#
+# Open the file in a trace viewer (Perfetto, chrome://tracing). It uses the
+# JSON array format, which viewers load even if the game exits mid-write.
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from profiler import get_profiler
+
+# Events held for the writer thread; events past this are dropped, not waited on
+TRACE_BUFFER_EVENTS = 65536
+# How often the writer thread drains the buffer
+TRACE_FLUSH_MS = 200
+
+TRACE_PID = 1
+TRACE_TID = 1
+
+
+class Tracer:
+    """Records spans and instant events for the trace viewer. Off by default.
+
+    The game thread only appends small tuples to a bounded deque; a writer
+    thread turns them into JSON and writes them out in batches, so a long
+    session costs the frame a few microseconds per event. When the buffer is
+    full new events are dropped and counted, and the count is written into
+    the trace when it closes.
+
+    begin()/end() pairs nest; an end() with nothing open (tracing started
+    mid-frame) is ignored, and spans still open at stop() are closed there.
+    """
+
+    def __init__(self, capacity=TRACE_BUFFER_EVENTS):
+        self.enabled = False
+        self.path = None
+        self.capacity = capacity
+        self.buffer = deque()  # (phase, name, start s, end s, args)
+        self.depth = 0
+        self.dropped = 0
+        self.events = 0
+        self.origin = 0.0
+        self.thread = None
+        self.wake = threading.Event()
+        self.stopping = False
+
+    def start(self, path):
+        if self.enabled:
+            return
+        self.path = path
+        self.buffer.clear()
+        self.depth = 0
+        self.dropped = 0
+        self.events = 0
+        self.origin = time.perf_counter()
+        self.stopping = False
+        self.wake.clear()
+        self.thread = threading.Thread(target=self._write_loop, args=(path,),
+                                       name='trace-writer', daemon=True)
+        self.thread.start()
+        profiler = get_profiler()
+        profiler.set_watched('tracer', True)
+        profiler.trace = self
+        self.enabled = True
+
+    def stop(self):
+        """Close open spans, flush everything and finish the file."""
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        while self.depth > 0:
+            self.end(now)
+        profiler = get_profiler()
+        profiler.trace = None
+        profiler.set_watched('tracer', False)
+        self.enabled = False
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout=10)
+        self.thread = None
+        return self.path
+
+    def toggle(self, path):
+        """Start tracing to path, or stop. Returns the finished trace's path on stop."""
+        if self.enabled:
+            return self.stop()
+        self.start(path)
+        return None
+
+    # === RECORDING ===
+
+    def _push(self, event):
+        if len(self.buffer) >= self.capacity:
+            self.dropped += 1
+            return
+        self.buffer.append(event)
+
+    def begin(self, name):
+        """Open a span, closed by the next end()."""
+        if not self.enabled:
+            return
+        self.depth += 1
+        self._push(('B', name, time.perf_counter(), None, None))
+
+    def end(self, now=None):
+        if not self.enabled or self.depth == 0:
+            return
+        self.depth -= 1
+        self._push(('E', None, now if now is not None else time.perf_counter(), None, None))
+
+    def complete(self, name, start, end):
+        """A span already timed by the caller (perf_counter seconds)."""
+        if self.enabled:
+            self._push(('X', name, start, end, None))
+
+    def instant(self, name, **args):
+        """Mark a moment: a spawn, a cast, a state change."""
+        if self.enabled:
+            self._push(('i', name, time.perf_counter(), None, args or None))
+
+    # === WRITER THREAD ===
+
+    def _event_json(self, event):
+        phase, name, start, end, args = event
+        fields = {'ph': phase, 'ts': round((start - self.origin) * 1e6, 1),
+                  'pid': TRACE_PID, 'tid': TRACE_TID}
+        if name is not None:
+            fields['name'] = name
+        if phase == 'X':
+            fields['dur'] = round((end - start) * 1e6, 1)
+        elif phase == 'i':
+            fields['s'] = 't'
+        if args:
+            fields['args'] = args
+        return json.dumps(fields, separators=(',', ':'))
+
+    def _drain(self, f):
+        lines = []
+        buffer = self.buffer
+        while buffer:
+            lines.append(self._event_json(buffer.popleft()))
+        if lines:
+            f.write(',\n'.join(lines) + ',\n')
+            self.events += len(lines)
+
+    def _write_loop(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('[\n')
+            meta = {'ph': 'M', 'pid': TRACE_PID, 'tid': TRACE_TID, 'name': 'thread_name',
+                    'args': {'name': 'game'}}
+            f.write(json.dumps(meta) + ',\n')
+            while not self.stopping:
+                self.wake.wait(TRACE_FLUSH_MS / 1000)
+                self._drain(f)
+            self._drain(f)
+            summary = {'ph': 'M', 'pid': TRACE_PID, 'name': 'process_name',
+                       'args': {'name': 'Harry Potter Adventure',
+                                'events': self.events, 'dropped_events': self.dropped}}
+            f.write(json.dumps(summary) + '\n]\n')
+
+
+# Global tracer instance
+tracer = None
+
+def get_tracer():
+    """Get or create the global tracer."""
+    global tracer
+    if tracer is None:
+        tracer = Tracer()
+    return tracer
@@ -5,6 +5,9 @@ import math
 import os
 from settings import *
 from characters import CHARACTERS, CHARACTER_ORDER
+from text_cache import get_text_cache
+from surface_cache import get_surface_cache
+from particles import ParticleSystem
 
 
 class UI:
@@ -12,27 +15,21 @@ class UI:
 
     def __init__(self):
         pygame.font.init()
-        self.font_small = pygame.font.Font(None, FONT_SMALL)
-        self.font_medium = pygame.font.Font(None, FONT_MEDIUM)
-        self.font_large = pygame.font.Font(None, FONT_LARGE)
-        self.font_title = pygame.font.Font(None, 96)
+        self.text = get_text_cache()
+        self.font_small = self.text.get_font(FONT_SMALL)
+        self.font_medium = self.text.get_font(FONT_MEDIUM)
+        self.font_large = self.text.get_font(FONT_LARGE)
+        self.font_title = self.text.get_font(96)
+        self.overlays = {}  # name -> full-screen overlay surface
 
         # Character selection state
         self.selected_index = 0
         self.anim_timer = 0
         self.hover_offset = 0
         
-        # Particle effects for menu
-        self.particles = []
-        for _ in range(30):
-            self.particles.append({
-                'x': pygame.time.get_ticks() % SCREEN_WIDTH,
-                'y': pygame.time.get_ticks() % SCREEN_HEIGHT,
-                'vx': (pygame.time.get_ticks() % 100) / 50 - 1,
-                'vy': -0.5 - (pygame.time.get_ticks() % 100) / 100,
-                'size': 2 + (pygame.time.get_ticks() % 4),
-                'color': GOLD if pygame.time.get_ticks() % 3 == 0 else YELLOW
-            })
+        # Particle effects for menu (screen space, separate from the world system)
+        self.particles = ParticleSystem()
+        self.particles.emit('menu_sparkles', 0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Cache for character sprites
         self.char_sprites = {}
@@ -52,30 +49,47 @@ class UI:
 
     def _update_particles(self):
         """Update floating particles."""
-        import random
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            if p['y'] < -10:
-                p['y'] = SCREEN_HEIGHT + 10
-                p['x'] = random.randint(0, SCREEN_WIDTH)
-            if p['x'] < -10:
-                p['x'] = SCREEN_WIDTH + 10
-            elif p['x'] > SCREEN_WIDTH + 10:
-                p['x'] = -10
+        self.particles.update(1000 / FPS)
 
     def _draw_particles(self, screen):
         """Draw floating magical particles."""
-        for p in self.particles:
-            pygame.draw.circle(screen, p['color'], (int(p['x']), int(p['y'])), p['size'])
-            # Glow
-            glow_surf = pygame.Surface((p['size'] * 4, p['size'] * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*p['color'], 50), (p['size'] * 2, p['size'] * 2), p['size'] * 2)
-            screen.blit(glow_surf, (int(p['x']) - p['size'] * 2, int(p['y']) - p['size'] * 2))
+        self.particles.draw(screen)
+
+    def get_overlay(self, name):
+        """Get a full-screen end/pause overlay, building it on first use."""
+        overlay = self.overlays.get(name)
+        if overlay is not None:
+            return overlay
+
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        if name == 'pause':
+            # Overlay with blur effect simulation
+            overlay.fill((20, 20, 40, 180))
+        elif name == 'game_over':
+            # Dark red gradient
+            for y in range(SCREEN_HEIGHT):
+                alpha = int(180 + (y / SCREEN_HEIGHT) * 40)
+                overlay.fill((40, 0, 0, min(220, alpha)), (0, y, SCREEN_WIDTH, 1))
+        elif name == 'victory':
+            # Golden gradient
+            for y in range(SCREEN_HEIGHT):
+                ratio = y / SCREEN_HEIGHT
+                r = int(60 - ratio * 20)
+                g = int(50 - ratio * 15)
+                overlay.fill((r, g, 0, 200), (0, y, SCREEN_WIDTH, 1))
+        elif name == 'level_complete':
+            # Green/gold gradient
+            for y in range(SCREEN_HEIGHT):
+                ratio = y / SCREEN_HEIGHT
+                r = int(30 + ratio * 20)
+                g = int(50 + ratio * 30)
+                overlay.fill((r, g, 20, 190), (0, y, SCREEN_WIDTH, 1))
+        self.overlays[name] = overlay
+        return overlay
 
     def draw_text(self, screen, text, font, color, x, y, center=False):
         """Draw text on screen."""
-        surface = font.render(text, True, color)
+        surface = self.text.render(text, font, color)
         rect = surface.get_rect()
         if center:
             rect.center = (x, y)
@@ -86,13 +100,15 @@ class UI:
 
     def draw_text_outlined(self, screen, text, font, color, outline_color, x, y, center=False):
         """Draw text with outline for better visibility."""
-        # Draw outline
-        for dx in [-2, 0, 2]:
-            for dy in [-2, 0, 2]:
-                if dx != 0 or dy != 0:
-                    self.draw_text(screen, text, font, outline_color, x + dx, y + dy, center)
-        # Draw main text
-        return self.draw_text(screen, text, font, color, x, y, center)
+        # Outline and fill are composed once and cached as a single surface
+        surface = self.text.render_outlined(text, font, color, outline_color, 2)
+        rect = surface.get_rect()
+        if center:
+            rect.center = (x, y)
+        else:
+            rect.topleft = (x - 2, y - 2)
+        screen.blit(surface, rect)
+        return rect.inflate(-4, -4)
 
     def draw_menu(self, screen):
         """Draw the main menu with magical theme."""
@@ -112,7 +128,7 @@ class UI:
         
         # Magical glow behind title
         glow_size = 300 + int(math.sin(self.anim_timer * 0.03) * 20)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size), pygame.SRCALPHA)
+        glow_surf = get_surface_cache().scratch(glow_size * 2, glow_size)
         pygame.draw.ellipse(glow_surf, (255, 215, 0, 30), (0, 0, glow_size * 2, glow_size))
         screen.blit(glow_surf, (SCREEN_WIDTH // 2 - glow_size, 100))
         
@@ -346,7 +362,7 @@ class UI:
             p2 = (end_x + math.cos(angle + 0.2) * 50, end_y + math.sin(angle + 0.2) * 50)
             p3 = (end_x + math.cos(angle - 0.2) * 50, end_y + math.sin(angle - 0.2) * 50)
             
-            ray_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            ray_surf = get_surface_cache().scratch(SCREEN_WIDTH, SCREEN_HEIGHT)
             pygame.draw.polygon(ray_surf, (*theme_color, 20), [p1, p2, p3])
             screen.blit(ray_surf, (0, 0))
 
@@ -366,7 +382,7 @@ class UI:
 
         # Title Glow
         glow_size = 400 + math.sin(self.anim_timer * 0.1) * 20
-        glow_surf = pygame.Surface((glow_size * 2, 100), pygame.SRCALPHA)
+        glow_surf = get_surface_cache().scratch(glow_size * 2, 100)
         pygame.draw.ellipse(glow_surf, (*title_color, 40), (0, 0, glow_size * 2, 100))
         screen.blit(glow_surf, (SCREEN_WIDTH // 2 - glow_size, 20))
 
@@ -450,7 +466,7 @@ class UI:
         panel_x = (SCREEN_WIDTH - panel_w) // 2
         
         # Panel Glass Background
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel_surf = get_surface_cache().scratch(panel_w, panel_h)
         pygame.draw.rect(panel_surf, (20, 20, 25, 230), (0, 0, panel_w, panel_h), border_radius=20)
         screen.blit(panel_surf, (panel_x, panel_y))
         
@@ -514,9 +530,7 @@ class UI:
     def draw_hud(self, screen, players, enemy_manager, camera, level_num=1, respawn_info=None, level=None):
         """Draw polished in-game HUD."""
         # Semi-transparent HUD background strips
-        top_hud = pygame.Surface((SCREEN_WIDTH, 90), pygame.SRCALPHA)
-        top_hud.fill((0, 0, 0, 100))
-        screen.blit(top_hud, (0, 0))
+        screen.blit(get_surface_cache().tint(SCREEN_WIDTH, 90, (0, 0, 0, 100)), (0, 0))
         
         # Story Area Display (center top - prominent!)
         if level and hasattr(level, 'get_story_area'):
@@ -706,16 +720,16 @@ class UI:
         self.draw_text(screen, health_text, self.font_small, WHITE,
                       x + bar_w // 2, y + 1, center=True)
 
-    def draw_game_over(self, screen, state_manager):
-        """Draw polished game over screen."""
+    def draw_game_over(self, screen, state_manager, overlay=True):
+        """Draw polished game over screen.
+
+        Pass overlay=False when the backdrop already has the overlay applied.
+        """
         self.anim_timer += 1
         
         # Dark red gradient overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            alpha = int(180 + (y / SCREEN_HEIGHT) * 40)
-            overlay.fill((40, 0, 0, min(220, alpha)), (0, y, SCREEN_WIDTH, 1))
-        screen.blit(overlay, (0, 0))
+        if overlay:
+            screen.blit(self.get_overlay('game_over'), (0, 0))
 
         # Game Over text with dramatic effect
         shake = int(math.sin(self.anim_timer * 0.1) * 2) if self.anim_timer < 60 else 0
@@ -754,12 +768,11 @@ class UI:
         self.draw_text(screen, "[ESC] Main Menu", self.font_small, GRAY,
                       SCREEN_WIDTH // 2, btn_y + 130, center=True)
 
-    def draw_pause(self, screen):
+    def draw_pause(self, screen, overlay=True):
         """Draw polished pause overlay."""
         # Overlay with blur effect simulation
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((20, 20, 40, 180))
-        screen.blit(overlay, (0, 0))
+        if overlay:
+            screen.blit(self.get_overlay('pause'), (0, 0))
 
         # Center panel
         panel_w, panel_h = 350, 230
@@ -783,18 +796,13 @@ class UI:
         self.draw_text(screen, "[ESC] or [Q] Main Menu", self.font_small, GRAY,
                       SCREEN_WIDTH // 2, panel_y + 170, center=True)
 
-    def draw_victory(self, screen, state_manager):
+    def draw_victory(self, screen, state_manager, overlay=True):
         """Draw polished victory screen."""
         self.anim_timer += 1
         
         # Golden gradient overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(60 - ratio * 20)
-            g = int(50 - ratio * 15)
-            overlay.fill((r, g, 0, 200), (0, y, SCREEN_WIDTH, 1))
-        screen.blit(overlay, (0, 0))
+        if overlay:
+            screen.blit(self.get_overlay('victory'), (0, 0))
 
         # Sparkle particles
         import random
@@ -817,7 +825,7 @@ class UI:
         trophy_y = 320 + int(math.sin(self.anim_timer * 0.04) * 5)
         
         # Trophy glow
-        glow_surf = pygame.Surface((140, 100), pygame.SRCALPHA)
+        glow_surf = get_surface_cache().scratch(140, 100)
         pygame.draw.ellipse(glow_surf, (255, 215, 0, 60), (0, 20, 140, 80))
         screen.blit(glow_surf, (trophy_x - 70, trophy_y - 30))
         
@@ -933,9 +941,7 @@ class UI:
 
         elif name == 'Voldemort':
             # Aura
-            s = pygame.Surface((100, 100), pygame.SRCALPHA)
-            pygame.draw.circle(s, (0, 255, 0, 30), (50, 50), 40)
-            screen.blit(s, (cx-50, cy-50))
+            get_surface_cache().draw_glow(screen, (cx, cy), 40, (0, 255, 0), 30)
             
             # Robe - flowing dark
             pygame.draw.polygon(screen, (20, 20, 25), [(cx-25, cy+40), (cx-15, cy+10), (cx+15, cy+10), (cx+25, cy+40)])
@@ -967,9 +973,7 @@ class UI:
 
         elif name == 'Unicorn':
             # Body glow
-            glow = pygame.Surface((80, 80), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (255, 255, 255, 60), (40, 40), 35)
-            screen.blit(glow, (cx-40, cy-40))
+            get_surface_cache().draw_glow(screen, (cx, cy), 35, (255, 255, 255), 60)
             
             # Head
             pygame.draw.ellipse(screen, (255, 255, 255), (cx - 25, cy - 25, 50, 40)) # Snout
@@ -1142,18 +1146,13 @@ class UI:
         self.draw_text(screen, "Press SPACE to skip", self.font_small, (pulse, pulse, pulse),
                       SCREEN_WIDTH - 140, SCREEN_HEIGHT - letterbox_h + 30, center=True)
 
-    def draw_level_complete(self, screen, state_manager):
+    def draw_level_complete(self, screen, state_manager, overlay=True):
         """Draw level complete screen."""
         self.anim_timer += 1
         
         # Green/gold gradient overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(30 + ratio * 20)
-            g = int(50 + ratio * 30)
-            overlay.fill((r, g, 20, 190), (0, y, SCREEN_WIDTH, 1))
-        screen.blit(overlay, (0, 0))
+        if overlay:
+            screen.blit(self.get_overlay('level_complete'), (0, 0))
 
         # Title with animation
         bounce = int(abs(math.sin(self.anim_timer * 0.06)) * 10)